@@ -0,0 +1,188 @@
+"""
+Extraction scaling benchmark for the FORMS Edge Delivery MCP managers.
+
+Runs every manager's extraction against the checked-in doc fixtures
+(tests/fixtures/docs) enlarged 1x, 2x, 5x, 10x... and reports, per size:
+
+- legacy: extract_content_patterns with the manager's original regexes
+- index: building the theme.md SectionIndex (all sections, once per version)
+  and rendering each manager's response from it
+- clean: clean_content over the whole document
+- layout / component: the whole-document managers' response build
+
+Time is the median of --runs runs; peak memory is measured separately with
+tracemalloc (which slows the code it traces). "scaling" is time per byte
+relative to the 1x run: ~1.0 means linear growth. Each size is also checked
+for byte-identical output between the legacy and index extractors. The exit
+code is 1 on any mismatch, or when an index, clean or whole-document build
+scales past --max-scaling (quadratic growth scales with the input size).
+
+Usage:
+    python benchmarks/extraction_benchmark.py [--factors 1,2,5,10,20] [--runs 5]
+        [--max-scaling 4] [--theme PATH] [--json] [--output FILE]
+"""
+
+import argparse
+import gc
+import importlib
+import json
+import os
+import statistics
+import sys
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List, Optional
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "tests"))
+
+from doc_fixtures import LEGACY_PATTERNS, doc_url, enlarge_document, load_doc, theme_index  # noqa: E402
+from forms_edge_delivery_mcp.managers import custom_component_manager, layout_manager  # noqa: E402
+from forms_edge_delivery_mcp.managers.shared_utils import clean_content, extract_content_patterns  # noqa: E402
+
+THEME_MANAGERS = {
+    name: importlib.import_module(f"forms_edge_delivery_mcp.managers.{name}") for name in sorted(LEGACY_PATTERNS)
+}
+
+DOCUMENT_BUILDERS = {
+    "layout": layout_manager._render_layout_configuration,
+    "component": custom_component_manager._render_custom_component_creation,
+}
+
+# Operations held to --max-scaling; the legacy extractors are the baseline
+CHECKED_PREFIXES = ("index:", "clean:") + tuple(f"{doc}:" for doc in DOCUMENT_BUILDERS)
+
+
+def measure(function: Callable[[], Any], runs: int) -> Dict[str, float]:
+    """Return the median/min time in milliseconds and the peak traced memory in KiB."""
+    function()  # Warm up regex caches and imports
+    timings = []
+    for _ in range(runs):
+        gc.collect()
+        start = time.perf_counter()
+        function()
+        timings.append((time.perf_counter() - start) * 1000)
+
+    gc.collect()
+    tracemalloc.start()
+    try:
+        function()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return {
+        "median_ms": round(statistics.median(timings), 3),
+        "min_ms": round(min(timings), 3),
+        "peak_kib": round(peak / 1024, 1),
+    }
+
+
+def run_size(theme: str, factor: int, runs: int) -> Dict[str, Any]:
+    """Measure every extraction on the documents enlarged factor times."""
+    content = enlarge_document(theme, factor)
+    url = doc_url("theme")
+    results: Dict[str, Any] = {"factor": factor, "bytes": len(content.encode("utf-8")), "operations": {}}
+    operations = results["operations"]
+    mismatches = []
+
+    operations["index:build"] = measure(lambda: theme_index(content), runs)
+    index = theme_index(content)
+    for name, module in THEME_MANAGERS.items():
+        keys, title = module.SECTION_KEYS, module.SECTION_TITLE
+        legacy = lambda: extract_content_patterns(content, LEGACY_PATTERNS[name], url, title)  # noqa: E731
+        operations[f"legacy:{name}"] = measure(legacy, runs)
+        # render() is memoized per version; time the join on a fresh memo
+        operations[f"index:{name}"] = measure(lambda: (index._rendered.clear(), index.render(keys, title)), runs)
+        if index.render(keys, title) != legacy():
+            mismatches.append(name)
+
+    operations["clean:document"] = measure(lambda: clean_content(content), runs)
+    for doc, build in DOCUMENT_BUILDERS.items():
+        document = enlarge_document(load_doc(doc), factor)
+        operations[f"{doc}:build"] = measure(lambda: build(document, doc_url(doc)), runs)
+
+    results["legacy_total_ms"] = round(sum(
+        timing["median_ms"] for operation, timing in operations.items() if operation.startswith("legacy:")
+    ), 3)
+    results["index_total_ms"] = round(sum(
+        timing["median_ms"] for operation, timing in operations.items() if operation.startswith("index:")
+    ), 3)
+    results["mismatches"] = mismatches
+    return results
+
+
+def add_scaling(sizes: List[Dict[str, Any]]) -> None:
+    """Add each operation's time per byte relative to the smallest size."""
+    base = sizes[0]
+    for size in sizes:
+        ratio = size["bytes"] / base["bytes"]
+        for operation, timing in size["operations"].items():
+            base_ms = base["operations"][operation]["median_ms"]
+            timing["scaling"] = round(timing["median_ms"] / base_ms / ratio, 2) if base_ms else None
+
+
+def over_scaling(sizes: List[Dict[str, Any]], limit: Optional[float]) -> List[str]:
+    """Return the checked operations whose time per byte grew past limit at the largest size."""
+    if limit is None or len(sizes) < 2:
+        return []
+    return [
+        operation for operation, timing in sizes[-1]["operations"].items()
+        if operation.startswith(CHECKED_PREFIXES) and (timing["scaling"] or 0) > limit
+    ]
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Measure doc extraction time and memory as docs grow")
+    parser.add_argument("--factors", default="1,2,5,10,20", help="Comma-separated enlargement factors")
+    parser.add_argument("--runs", type=int, default=5, help="Timed runs per operation")
+    parser.add_argument("--max-scaling", type=float, default=4.0,
+                        help="Fail when a checked operation's time per byte grows past this (0: no check)")
+    parser.add_argument("--theme", help="theme.md to use instead of the checked-in fixture")
+    parser.add_argument("--json", action="store_true", help="Print results as JSON")
+    parser.add_argument("--output", help="Also write the JSON results to this file")
+    args = parser.parse_args(argv)
+
+    factors = sorted({int(value) for value in args.factors.split(",") if value.strip()})
+    if args.theme:
+        with open(args.theme, encoding="utf-8", newline="") as handle:
+            theme = handle.read()
+    else:
+        theme = load_doc("theme")
+
+    sizes = [run_size(theme, factor, args.runs) for factor in factors]
+    add_scaling(sizes)
+    slow = over_scaling(sizes, args.max_scaling or None)
+    results = {"runs": args.runs, "python": sys.version.split()[0], "sizes": sizes, "over_scaling": slow}
+    failed = any(size["mismatches"] for size in sizes) or bool(slow)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as handle:
+            json.dump(results, handle, indent=2)
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return 1 if failed else 0
+
+    print(f"Extraction over {args.runs} run(s) per operation (median time, tracemalloc peak)")
+    print(f"{'factor':>6}{'bytes':>10}  {'operation':<38}{'median':>11}{'peak':>12}{'scaling':>9}")
+    for size in sizes:
+        for operation, timing in size["operations"].items():
+            scaling = f"{timing['scaling']:.2f}" if timing.get("scaling") is not None else "-"
+            print(
+                f"{size['factor']:>6}{size['bytes']:>10}  {operation:<38}"
+                f"{timing['median_ms']:>9.3f}ms{timing['peak_kib']:>9.1f}KiB{scaling:>9}"
+            )
+        print(
+            f"{size['factor']:>6}{size['bytes']:>10}  all managers: legacy {size['legacy_total_ms']:.3f}ms, "
+            f"index build + render {size['index_total_ms']:.3f}ms"
+        )
+        if size["mismatches"]:
+            print(f"   ❌ output differs from extract_content_patterns: {', '.join(size['mismatches'])}")
+    if slow:
+        print(f"❌ time per byte grew past {args.max_scaling}x at {sizes[-1]['factor']}x: {', '.join(slow)}")
+    if failed:
+        return 1
+    print("✅ index output identical to extract_content_patterns at every size")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,233 @@
+"""
+Startup benchmark for the FORMS Edge Delivery MCP server.
+
+Launches the server as a fresh process, the way IDE clients do, and reports:
+
+- stdio: time from spawn to the first ``tools/list`` response and to the first
+  ``tools/call`` result, speaking JSON-RPC over the process' stdin/stdout.
+- http: time from spawn to the first ``/api/discovery`` response (the HTTP
+  listing of the tool endpoints) and to the first tool endpoint result.
+
+Usage:
+    python benchmarks/startup_benchmark.py [--transport stdio|http|both] [--runs 5]
+        [--tool get_dropdown_styling] [--docs-url URL] [--no-snapshot] [--json]
+"""
+
+import argparse
+import json
+import os
+import queue
+import socket
+import statistics
+import subprocess
+import sys
+import threading
+import time
+import urllib.error
+import urllib.request
+from typing import Dict, List
+
+SERVER_MODULE = "forms_edge_delivery_mcp.server"
+
+# MCP tool name -> HTTP route serving the same response
+HTTP_ROUTES = {
+    "get_field_structure": "/field-structure",
+    "get_dropdown_styling": "/dropdown-styling",
+    "get_radio_checkbox_styling": "/radio-checkbox-styling",
+    "get_panel_container_styling": "/panel-container-styling",
+    "get_css_selectors_guide": "/css-selectors-guide",
+    "get_file_attachment_styling": "/file-attachment-styling",
+    "get_error_message_styling": "/error-message-styling",
+    "get_repeatable_panel_styling": "/repeatable-panel-styling",
+    "get_styling_bundle": "/styling-bundle",
+    "get_custom_component_creation": "/custom-component-creation",
+    "get_layout_configuration": "/layout-configuration",
+}
+
+
+def _server_env(args: argparse.Namespace, transport: str) -> Dict[str, str]:
+    env = dict(os.environ)
+    env["MCP_TRANSPORT"] = transport
+    env["MCP_DEBUG"] = "false"
+    env["DEBUG"] = "false"
+    if args.docs_url:
+        env["MCP_DOCS_BASE_URL"] = args.docs_url
+    if args.no_snapshot:
+        env["MCP_SNAPSHOT_ENABLED"] = "false"
+    return env
+
+
+def _read_lines(stream, lines: "queue.Queue[str]") -> None:
+    for line in iter(stream.readline, ""):
+        lines.put(line)
+
+
+def _wait_for_response(lines: "queue.Queue[str]", request_id: int, deadline: float) -> dict:
+    """Return the JSON-RPC response with the given id, skipping log output."""
+    while True:
+        remaining = deadline - time.perf_counter()
+        if remaining <= 0:
+            raise TimeoutError(f"No response to request {request_id}")
+        line = lines.get(timeout=remaining).strip()
+        if not line.startswith("{"):
+            continue
+        try:
+            message = json.loads(line)
+        except ValueError:
+            continue
+        if message.get("id") == request_id:
+            return message
+
+
+def run_stdio(args: argparse.Namespace) -> Dict[str, float]:
+    """Measure one stdio cold start."""
+    start = time.perf_counter()
+    process = subprocess.Popen(
+        [args.python, "-m", SERVER_MODULE],
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+        env=_server_env(args, "stdio"),
+        text=True,
+        bufsize=1,
+    )
+    lines: "queue.Queue[str]" = queue.Queue()
+    threading.Thread(target=_read_lines, args=(process.stdout, lines), daemon=True).start()
+    deadline = start + args.timeout
+
+    def send(message: dict) -> None:
+        process.stdin.write(json.dumps(message) + "\n")
+        process.stdin.flush()
+
+    try:
+        send({
+            "jsonrpc": "2.0", "id": 1, "method": "initialize",
+            "params": {
+                "protocolVersion": "2024-11-05",
+                "capabilities": {},
+                "clientInfo": {"name": "startup-benchmark", "version": "1.0.0"},
+            },
+        })
+        _wait_for_response(lines, 1, deadline)
+        send({"jsonrpc": "2.0", "method": "notifications/initialized"})
+
+        send({"jsonrpc": "2.0", "id": 2, "method": "tools/list"})
+        listed = _wait_for_response(lines, 2, deadline)
+        tools_list = time.perf_counter() - start
+
+        send({
+            "jsonrpc": "2.0", "id": 3, "method": "tools/call",
+            "params": {"name": args.tool, "arguments": {}},
+        })
+        _wait_for_response(lines, 3, deadline)
+        first_result = time.perf_counter() - start
+    finally:
+        process.kill()
+        process.wait()
+
+    return {
+        "tools_list": tools_list,
+        "first_tool_result": first_result,
+        "tool_count": len(listed.get("result", {}).get("tools", [])),
+    }
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def run_http(args: argparse.Namespace) -> Dict[str, float]:
+    """Measure one HTTP cold start."""
+    port = _free_port()
+    env = _server_env(args, "http")
+    env["MCP_HOST"] = "127.0.0.1"
+    env["MCP_PORT"] = str(port)
+    base_url = f"http://127.0.0.1:{port}"
+
+    start = time.perf_counter()
+    process = subprocess.Popen(
+        [args.python, "-m", SERVER_MODULE],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        env=env,
+    )
+    deadline = start + args.timeout
+    try:
+        while True:
+            try:
+                with urllib.request.urlopen(f"{base_url}/api/discovery", timeout=1) as response:
+                    listed = json.load(response)
+                break
+            except (urllib.error.URLError, ConnectionError):
+                if time.perf_counter() > deadline or process.poll() is not None:
+                    raise TimeoutError("HTTP server did not start")
+                time.sleep(0.01)
+        tools_list = time.perf_counter() - start
+
+        with urllib.request.urlopen(f"{base_url}{HTTP_ROUTES[args.tool]}", timeout=args.timeout) as response:
+            response.read()
+        first_result = time.perf_counter() - start
+    finally:
+        process.kill()
+        process.wait()
+
+    return {
+        "tools_list": tools_list,
+        "first_tool_result": first_result,
+        "tool_count": len(listed.get("endpoints", {})),
+    }
+
+
+def summarize(samples: List[Dict[str, float]]) -> Dict[str, Dict[str, float]]:
+    """Return median/min/max in milliseconds for every timing."""
+    summary = {}
+    for key in ("tools_list", "first_tool_result"):
+        values = [sample[key] * 1000 for sample in samples]
+        summary[key] = {
+            "median_ms": round(statistics.median(values), 1),
+            "min_ms": round(min(values), 1),
+            "max_ms": round(max(values), 1),
+        }
+    return summary
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Measure MCP server cold-start latency")
+    parser.add_argument("--transport", choices=["stdio", "http", "both"], default="both")
+    parser.add_argument("--runs", type=int, default=5, help="Cold starts per transport")
+    parser.add_argument("--tool", default="get_dropdown_styling", choices=sorted(HTTP_ROUTES))
+    parser.add_argument("--docs-url", help="Override MCP_DOCS_BASE_URL for the server")
+    parser.add_argument("--no-snapshot", action="store_true", help="Start without the doc snapshot")
+    parser.add_argument("--timeout", type=float, default=60, help="Seconds per cold start")
+    parser.add_argument("--python", default=sys.executable, help="Interpreter running the server")
+    parser.add_argument("--json", action="store_true", help="Print results as JSON")
+    args = parser.parse_args(argv)
+
+    transports = ["stdio", "http"] if args.transport == "both" else [args.transport]
+    runners = {"stdio": run_stdio, "http": run_http}
+    results = {}
+    for transport in transports:
+        samples = [runners[transport](args) for _ in range(args.runs)]
+        results[transport] = summarize(samples)
+        results[transport]["tool_count"] = samples[-1]["tool_count"]
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return 0
+
+    print(f"Cold start over {args.runs} run(s), first tool: {args.tool}")
+    print(f"{'transport':<10}{'metric':<20}{'median':>10}{'min':>10}{'max':>10}")
+    for transport, summary in results.items():
+        for metric in ("tools_list", "first_tool_result"):
+            timing = summary[metric]
+            print(
+                f"{transport:<10}{metric:<20}"
+                f"{timing['median_ms']:>8.1f}ms{timing['min_ms']:>8.1f}ms{timing['max_ms']:>8.1f}ms"
+            )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
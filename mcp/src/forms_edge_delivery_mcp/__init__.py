@@ -9,8 +9,16 @@ __version__ = "1.0.0"
 __author__ = "Deep Prakash Dewanjo"
 __email__ = "ddewanji@adobe.com"
 
-# Import main components for easier access
-from .server import main
+from typing import Any
+
 from .config import SERVER_CONFIG
 
 __all__ = ["main", "SERVER_CONFIG", "__version__", "__author__", "__email__"]
+
+
+def __getattr__(name: str) -> Any:
+    # Importing the server pulls in fastmcp; only do it when main is used
+    if name == "main":
+        from .server import main
+        return main
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -2,12 +2,15 @@
 Configuration settings for the MCP Server
 """
 import os
+import tempfile
+from typing import Any, Dict
+
 from dotenv import load_dotenv
 
 # Load environment variables from .env file
 load_dotenv()
 
-SERVER_CONFIG = {
+SERVER_CONFIG: Dict[str, Any] = {
     "name": "FORMS EDGE DELIVERY MCP",
     "version": "1.0.0",
     "description": "FORMS Edge Delivery MCP server providing tools and services for edge delivery operations",
@@ -25,3 +28,80 @@ WEATHER_API_URL = "https://api.openweathermap.org/data/2.5/weather"
 # File operation settings
 ALLOWED_FILE_EXTENSIONS = {".txt", ".json", ".csv", ".md", ".py", ".js", ".html", ".css"}
 MAX_FILE_SIZE_MB = 10
+
+# Upstream documentation sources
+DOCS_BASE_URL = os.getenv("MCP_DOCS_BASE_URL", "https://main--afb--adobe.aem.live/docs/developer")
+DOCS_URLS = {
+    "theme": f"{DOCS_BASE_URL}/theme.md",
+    "layout": f"{DOCS_BASE_URL}/layout.md",
+    "component": f"{DOCS_BASE_URL}/component.md",
+}
+
+# Document cache settings (TTLs in seconds, overridable per document)
+DEFAULT_DOC_TTL = int(os.getenv("MCP_DOC_CACHE_TTL", 300))
+DOC_CACHE_CONFIG: Dict[str, Any] = {
+    "default_ttl": DEFAULT_DOC_TTL,
+    "ttls": {
+        DOCS_URLS["theme"]: int(os.getenv("MCP_DOC_CACHE_TTL_THEME", DEFAULT_DOC_TTL)),
+        DOCS_URLS["layout"]: int(os.getenv("MCP_DOC_CACHE_TTL_LAYOUT", DEFAULT_DOC_TTL)),
+        DOCS_URLS["component"]: int(os.getenv("MCP_DOC_CACHE_TTL_COMPONENT", DEFAULT_DOC_TTL)),
+    },
+    "max_concurrent_fetches": int(os.getenv("MCP_UPSTREAM_CONCURRENCY", 4)),
+    # Stale-while-revalidate: serve an expired copy for up to stale_ttl seconds
+    # while it is refreshed in the background; long enough to hide one upstream
+    # round trip, short enough that nobody is served an old doc unawares
+    "stale_ttl": int(os.getenv("MCP_DOC_STALE_TTL", 60)),
+    "retry_interval": int(os.getenv("MCP_DOC_RETRY_INTERVAL", 30)),
+    # Background refresher: revalidate docs refresh_ahead seconds before expiry
+    "refresh_ahead": int(os.getenv("MCP_DOC_REFRESH_AHEAD", 30)),
+    "refresh_interval": int(os.getenv("MCP_DOC_REFRESH_INTERVAL", 10)),
+    "background_refresh": os.getenv("MCP_DOC_BACKGROUND_REFRESH", "true").lower() == "true",
+}
+
+# Pooled keep-alive HTTP session used for every upstream doc request
+UPSTREAM_CONFIG: Dict[str, Any] = {
+    "pool_size": int(os.getenv("MCP_UPSTREAM_POOL_SIZE", DOC_CACHE_CONFIG["max_concurrent_fetches"])),
+    "connect_timeout": float(os.getenv("MCP_UPSTREAM_CONNECT_TIMEOUT", 5)),
+    "read_timeout": float(os.getenv("MCP_DOC_FETCH_TIMEOUT", 10)),
+    "retries": int(os.getenv("MCP_UPSTREAM_RETRIES", 0)),
+}
+
+# Paginated documentation resources (resource://docs/{doc}?page=N)
+DOC_PAGE_CONFIG: Dict[str, Any] = {
+    "page_tokens": int(os.getenv("MCP_DOC_PAGE_TOKENS", 2000)),
+}
+
+# Offline documentation snapshot (loaded at startup, refreshed on every new doc
+# version), kept in the user cache directory since the package may be read-only
+USER_CACHE_DIR = os.getenv("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+SNAPSHOT_CONFIG: Dict[str, Any] = {
+    "directory": os.getenv(
+        "MCP_SNAPSHOT_DIR",
+        os.path.join(USER_CACHE_DIR, "forms-edge-delivery-mcp", "snapshot"),
+    ),
+    "enabled": os.getenv("MCP_SNAPSHOT_ENABLED", "true").lower() == "true",
+}
+
+# Multi-worker HTTP mode: worker processes share docs through a local SQLite
+# store, and only the worker holding the refresher lease fetches upstream
+WORKER_CONFIG: Dict[str, Any] = {
+    "workers": int(os.getenv("MCP_WORKERS", 1)),
+    "store_path": os.getenv(
+        "MCP_SHARED_STORE",
+        os.path.join(tempfile.gettempdir(), "forms-edge-delivery-mcp", "docs.sqlite"),
+    ),
+    # A leader that stops renewing is replaced after this many seconds
+    "lease_ttl": int(os.getenv("MCP_REFRESH_LEASE_TTL", 3 * DOC_CACHE_CONFIG["refresh_interval"])),
+    # On a cold miss, a follower waits this long for the leader to publish the
+    # doc before fetching it upstream itself
+    "store_wait": float(os.getenv("MCP_SHARED_STORE_WAIT", 10)),
+}
+
+# Bulk markup linter: process pool size (also the most a caller may request),
+# HTML files per worker task, and the directory that tool and HTTP callers may
+# lint (unset: they cannot lint; the CLI reads any path)
+LINT_CONFIG: Dict[str, Any] = {
+    "workers": int(os.getenv("MCP_LINT_WORKERS", os.cpu_count() or 1)),
+    "batch_size": int(os.getenv("MCP_LINT_BATCH_SIZE", 64)),
+    "root": os.getenv("MCP_LINT_ROOT") or None,
+}
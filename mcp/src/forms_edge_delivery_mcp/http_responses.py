@@ -0,0 +1,309 @@
+"""
+HTTP response helpers for the FORMS Edge Delivery MCP HTTP transport.
+
+Prepared manager responses carry a strong ETag and the URL of the document they
+were built from, so GET routes can answer conditional requests with 304 and let
+clients and proxies cache the body for as long as the document stays fresh.
+Large bodies are sent with the precompressed encoding the client accepts.
+Budgeted, delta and error bodies are built per request and sent uncompressed.
+Every request is timed into the metrics registry by ``metrics_middleware``,
+and ``server_timing_middleware`` reports the phases of each response in a
+``Server-Timing`` header (and in the JSON body with ``?debug=timing``).
+Documentation routes can also stream their sections as Server-Sent Events.
+"""
+
+import json
+import time
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional
+
+from fastapi import Request, Response
+from fastapi.responses import StreamingResponse
+
+from .managers.doc_cache import document_cache
+from .managers.metrics import metrics
+from .managers.request_timing import current_timing, start_request_timing
+from .managers.response_cache import PreparedResponse
+from .managers.response_stream import StreamEvent, error as stream_error
+from .managers.shared_utils import create_error_response
+
+# Values of the ``debug`` query parameter that add the timing to the JSON body
+DEBUG_TIMING_VALUES = {"1", "true", "timing"}
+
+# Values of the ``stream`` query parameter that select a Server-Sent Events response
+STREAM_VALUES = {"1", "true", "sse"}
+
+HTTP_DURATION = metrics.histogram(
+    "mcp_http_request_duration_seconds", "HTTP request latency", ["method", "route", "status"]
+)
+HTTP_IN_FLIGHT = metrics.gauge(
+    "mcp_http_requests_in_flight", "HTTP requests currently being handled"
+)
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """
+    Evaluate an If-None-Match header against an ETag.
+
+    Uses the weak comparison required for If-None-Match, so ``W/"x"`` matches
+    ``"x"``.
+
+    Args:
+        if_none_match (str): Raw If-None-Match header value, if any
+        etag (str): Current strong ETag, quoted
+
+    Returns:
+        bool: True if the client's copy is current
+    """
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == etag:
+            return True
+    return False
+
+
+def cache_max_age(result: PreparedResponse) -> int:
+    """Return the seconds left before the response's source document expires."""
+    entry = document_cache.peek(result.source_url) if result.source_url else None
+    if entry is None:
+        return 0
+    return max(0, int(entry.expires_at - time.time()))
+
+
+def choose_encoding(accept_encoding: Optional[str], offered: List[str]) -> Optional[str]:
+    """
+    Pick the content coding to send from an Accept-Encoding header.
+
+    Args:
+        accept_encoding (str): Raw Accept-Encoding header value, if any
+        offered (List[str]): Codings available for the response, preferred first
+
+    Returns:
+        str: The chosen coding, or None to send the identity body
+    """
+    if not accept_encoding or not offered:
+        return None
+    weights = {}
+    for item in accept_encoding.split(","):
+        name, _, params = item.strip().partition(";")
+        quality = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        weights[name.strip().lower()] = quality
+    best = None
+    for coding in offered:
+        quality = weights.get(coding, weights.get("*", 0.0))
+        if quality > 0 and (best is None or quality > best[1]):
+            best = (coding, quality)
+    return best[0] if best else None
+
+
+def json_response(request: Request, result: str) -> Response:
+    """
+    Send a manager's JSON text, honouring HTTP caching for prepared responses.
+
+    Prepared responses are sent from their pre-encoded body (compressed when
+    the client accepts an encoding that is already built) with an ETag per
+    encoding. GET requests additionally get a Cache-Control lifetime matching
+    the source document's remaining TTL, and a 304 when If-None-Match is
+    current. Any other result (an error, a budgeted page or a delta) is sent
+    uncompressed and marked as not cacheable, as are debug responses carrying
+    the request's timing breakdown. Those bodies are per request and, budgeted
+    or delta, already small, so compressing them on the event loop is not
+    worth it.
+
+    Args:
+        request (Request): Incoming request
+        result (str): JSON text returned by a manager
+
+    Returns:
+        Response: The HTTP response
+    """
+    if wants_debug_timing(request):
+        return _debug_response(result)
+    if not isinstance(result, PreparedResponse):
+        return Response(
+            content=result.encode("utf-8"),
+            media_type="application/json",
+            headers={"Cache-Control": "no-store"},
+        )
+
+    encoding = choose_encoding(request.headers.get("accept-encoding"), result.encodings())
+    etag = result.encoded_etag(encoding)
+    headers = {"ETag": etag, "Vary": "Accept-Encoding"}
+    if request.method == "GET":
+        headers["Cache-Control"] = (
+            f"public, max-age={cache_max_age(result)}, "
+            f"stale-while-revalidate={document_cache.stale_ttl}"
+        )
+        if etag_matches(request.headers.get("if-none-match"), etag):
+            return Response(status_code=304, headers=headers)
+    else:
+        headers["Cache-Control"] = "no-cache"
+
+    if encoding is None:
+        return Response(content=result.body, media_type="application/json", headers=headers)
+    headers["Content-Encoding"] = encoding
+    return Response(content=result.encoded(encoding), media_type="application/json", headers=headers)
+
+
+async def budget_params(request: Request) -> Dict[str, Any]:
+    """
+    Read max_tokens, max_bytes, cursor and if_changed_since from the query string or a JSON body.
+
+    Args:
+        request (Request): Incoming request
+
+    Returns:
+        Dict[str, Any]: Keyword arguments for a budget-aware manager
+
+    Raises:
+        ValueError: If the body is not a JSON object or a budget is not a number
+    """
+    params: Dict[str, Any] = dict(request.query_params)
+    if request.method == "POST" and await request.body():
+        try:
+            params.update(await request.json())
+        except (ValueError, TypeError):
+            raise ValueError("Request body must be a JSON object")
+    budget: Dict[str, Any] = {
+        "cursor": params.get("cursor") or None,
+        "if_changed_since": params.get("if_changed_since") or None,
+    }
+    for name in ("max_tokens", "max_bytes"):
+        value = params.get(name)
+        try:
+            budget[name] = int(value) if value not in (None, "") else None
+        except (TypeError, ValueError):
+            raise ValueError(f"{name} must be a positive number")
+    return budget
+
+
+async def call_with_budget(request: Request, manager: Callable[..., Awaitable[str]]) -> str:
+    """Call a budget-aware manager with the request's budget parameters."""
+    try:
+        budget = await budget_params(request)
+    except ValueError as e:
+        return create_error_response(str(e))
+    return await manager(**budget)
+
+
+def wants_debug_timing(request: Request) -> bool:
+    """Return True if the request asks for the timing breakdown in the body."""
+    return request.query_params.get("debug", "").lower() in DEBUG_TIMING_VALUES
+
+
+def _debug_response(result: str) -> Response:
+    payload = json.loads(result)
+    timing = current_timing()
+    payload["timing"] = timing.breakdown() if timing is not None else None
+    return Response(
+        content=json.dumps(payload).encode("utf-8"),
+        media_type="application/json",
+        headers={"Cache-Control": "no-store"},
+    )
+
+
+async def server_timing_middleware(
+    request: Request, call_next: Callable[[Request], Awaitable[Response]]
+) -> Response:
+    """Time the phases of a request and report them in a Server-Timing header."""
+    timing = start_request_timing()
+    response = await call_next(request)
+    response.headers["Server-Timing"] = timing.server_timing()
+    return response
+
+
+async def metrics_middleware(
+    request: Request, call_next: Callable[[Request], Awaitable[Response]]
+) -> Response:
+    """Record latency per route template (not raw path) and in-flight requests."""
+    HTTP_IN_FLIGHT.inc()
+    start = time.perf_counter()
+    status = 500
+    try:
+        response = await call_next(request)
+        status = response.status_code
+        return response
+    finally:
+        route = request.scope.get("route")
+        HTTP_DURATION.observe(
+            time.perf_counter() - start,
+            method=request.method,
+            route=getattr(route, "path", "unmatched"),
+            status=status,
+        )
+        HTTP_IN_FLIGHT.dec()
+
+
+def wants_stream(request: Request) -> bool:
+    """Return True if the request asks for an event stream (?stream=sse or Accept)."""
+    if request.query_params.get("stream", "").lower() in STREAM_VALUES:
+        return True
+    return "text/event-stream" in request.headers.get("accept", "")
+
+
+def _sse(event: str, data: Dict[str, Any]) -> bytes:
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n".encode("utf-8")
+
+
+def event_stream_response(events: AsyncIterator[StreamEvent]) -> StreamingResponse:
+    """
+    Send a manager's stream events as Server-Sent Events.
+
+    A comment line is flushed before the manager starts, so the first byte
+    does not wait for the upstream fetch. Each event is written as soon as it
+    is produced; a successful stream ends with a ``done`` event carrying the
+    number of events sent and the request's timing breakdown (the
+    Server-Timing header is sent before any work is done). The status line
+    has been sent by then too, so a manager that raises mid-stream ends the
+    stream with an ``error`` event.
+
+    Args:
+        events (AsyncIterator[StreamEvent]): Events from a manager's stream function
+
+    Returns:
+        StreamingResponse: A text/event-stream response, never cached
+    """
+    async def body() -> AsyncIterator[bytes]:
+        yield b": stream open\n\n"
+        count = 0
+        try:
+            async for event, data in events:
+                yield _sse(event, data)
+                if event == "error":
+                    return
+                count += 1
+        except Exception as e:
+            yield _sse(*stream_error(f"Error streaming response: {str(e)}"))
+            return
+        timing = current_timing()
+        yield _sse("done", {
+            "status": "success",
+            "events": count,
+            "timing": timing.breakdown() if timing is not None else None,
+        })
+
+    return StreamingResponse(
+        body(),
+        media_type="text/event-stream",
+        # X-Accel-Buffering stops nginx-style proxies from holding events back
+        headers={"Cache-Control": "no-store", "X-Accel-Buffering": "no"},
+    )
+
+
+def metrics_response() -> Response:
+    """Return the metrics registry in the Prometheus text format."""
+    return Response(
+        content=metrics.render_prometheus(),
+        media_type="text/plain; version=0.0.4; charset=utf-8",
+    )
@@ -0,0 +1,159 @@
+"""
+Content hashes and delta responses for FORMS Edge Delivery MCP managers.
+
+Every documentation response carries the ``version`` of its source document and
+a ``hash`` of its content. A caller that passes the hash back as
+``if_changed_since`` gets a tiny "unchanged" reply while the content is the
+same. Once it changes, a large response is cut down to the sections whose
+hashes differ from the ones in the caller's copy. Section hashes of recent
+responses are kept in memory for this; an unknown hash gets the full response.
+"""
+
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from .response_cache import PreparedResponse, prepared_response
+from .section_index import SectionIndex
+
+# Responses smaller than this are sent whole instead of as a delta
+DELTA_MIN_BYTES = 2048
+
+# (response key, content hash) pairs whose section hashes are remembered
+MAX_HISTORY = 256
+
+# (section id, markdown) in response order
+Section = Tuple[str, str]
+
+_lock = threading.Lock()
+_history: "OrderedDict[Tuple[str, str], Dict[str, str]]" = OrderedDict()
+
+
+def content_hash(text: str) -> str:
+    """Return the stable hash of a response or section text."""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()[:16]
+
+
+def _section_hash(text: str) -> str:
+    # Sections are sent stripped; the blank lines after one depend on what follows it
+    return content_hash(text.strip())
+
+
+def theme_sections(index: SectionIndex, keys: List[str]) -> List[Section]:
+    """Return the theme.md fragments of a manager's sections; repeats get "-2", "-3"..."""
+    sections = []
+    for key in keys:
+        for number, fragment in enumerate(index.sections.get(key, []), 1):
+            sections.append((key if number == 1 else f"{key}-{number}", fragment))
+    return sections
+
+
+def document_sections(index: SectionIndex) -> List[Section]:
+    """Return the heading sections of a whole document, keyed by heading id."""
+    return [
+        (node.id if node else "intro", index.content[start:end])
+        for node, start, end in index.spans()
+    ]
+
+
+def _stamp(text: str, version: str) -> str:
+    payload = json.loads(text)
+    if payload.get("status") == "success" and isinstance(payload.get("data"), str):
+        payload["version"] = version
+        payload["hash"] = content_hash(payload["data"])
+    return json.dumps(payload)
+
+
+def _remember(key: str, response: PreparedResponse, sections: Callable[[], List[Section]]) -> None:
+    response.content_hash = json.loads(response).get("hash")
+    if response.content_hash is None:
+        return
+    hashes = {section_id: _section_hash(text) for section_id, text in sections()}
+    with _lock:
+        _history[(key, response.content_hash)] = hashes
+        _history.move_to_end((key, response.content_hash))
+        while len(_history) > MAX_HISTORY:
+            _history.popitem(last=False)
+
+
+def versioned_response(
+    key: str,
+    source: Any,
+    build: Callable[[], str],
+    sections: Callable[[], List[Section]],
+    title: str,
+    if_changed_since: Optional[str] = None,
+) -> str:
+    """
+    Return a prepared response stamped with its doc version and content hash.
+
+    Args:
+        key (str): Response identifier, e.g. the tool name
+        source: Document the response is built from (see prepared_response)
+        build (Callable[[], str]): Produces the JSON text on a cache miss
+        sections (Callable[[], List[Section]]): Sections of the response,
+            hashed once per version for later deltas
+        title (str): Title of a delta response
+        if_changed_since (str): Hash of the caller's copy, from an earlier response
+
+    Returns:
+        The full response; with if_changed_since, a reply with ``unchanged``
+        set when the hash still matches, or a ``delta`` holding only the
+        changed sections when the caller's version is known and the response
+        is large
+    """
+    response = prepared_response(key, source, lambda: _stamp(build(), source.version))
+    if response.content_hash is None:
+        _remember(key, response, sections)
+    if not if_changed_since or response.content_hash is None:
+        return response
+    if if_changed_since == response.content_hash:
+        return json.dumps({
+            "status": "success",
+            "data": None,
+            "errorMessage": None,
+            "unchanged": True,
+            "version": response.version,
+            "hash": response.content_hash,
+        })
+    return _delta_response(key, response, if_changed_since, sections, title)
+
+
+def _delta_response(
+    key: str,
+    response: PreparedResponse,
+    since: str,
+    sections: Callable[[], List[Section]],
+    title: str,
+) -> str:
+    with _lock:
+        previous = _history.get((key, since))
+    if previous is None or len(response.body) < DELTA_MIN_BYTES:
+        return response
+    current = sections()
+    changed = [(section_id, text) for section_id, text in current
+               if previous.get(section_id) != _section_hash(text)]
+    current_ids = {section_id for section_id, _ in current}
+    removed = [section_id for section_id in previous if section_id not in current_ids]
+    if not changed and not removed:
+        # Only text around the sections (title, footer) differs
+        return response
+
+    parts = [f"# {title} (changed sections)"] + [text.strip() for _, text in changed]
+    if removed:
+        parts.append(f"*Removed sections: {', '.join(removed)}*")
+    return json.dumps({
+        "status": "success",
+        "data": "\n\n---\n\n".join(parts),
+        "errorMessage": None,
+        "version": response.version,
+        "hash": response.content_hash,
+        "delta": {
+            "since": since,
+            "changed": [section_id for section_id, _ in changed],
+            "removed": removed,
+            "unchanged_sections": len(current) - len(changed),
+        },
+    })
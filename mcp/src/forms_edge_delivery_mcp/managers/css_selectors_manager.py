@@ -4,12 +4,22 @@ CSS Selectors Manager for FORMS Edge Delivery MCP server.
 Handles CSS selectors and targeting techniques documentation retrieval and fallback content.
 """
 
+import json
+from typing import Optional
+
 from .shared_utils import (
-    fetch_adobe_docs, 
     create_success_response, 
-    create_error_response,
-    extract_content_patterns
+    create_error_response
 )
+from .section_index import SectionIndex, get_theme_index, get_theme_index_async
+from .content_delta import theme_sections, versioned_response
+from .selector_index import SelectorIndex, selector_index_for
+from .token_budget import is_budgeted, theme_budgeted_response
+
+
+# theme.md sections served by this manager, in output order
+SECTION_KEYS = ["styling-fields", "styling-field-type", "styling-specific-field"]
+SECTION_TITLE = "CSS Selectors & Styling Techniques"
 
 
 def get_css_selectors_guide_fallback() -> str:
@@ -30,35 +40,122 @@ Visit: https://main--afb--adobe.aem.live/docs/developer/theme.md
 """
 
 
-def get_css_selectors_guide() -> str:
+def _render_css_selectors_guide(index: SectionIndex) -> str:
+    """Build the full CSS selectors response from a theme.md section index."""
+    extracted_content = index.render(SECTION_KEYS, SECTION_TITLE)
+    
+    if extracted_content:
+        return create_success_response(extracted_content)
+    else:
+        return create_success_response(get_css_selectors_guide_fallback())
+
+
+def _build_css_selectors_guide(
+    index: SectionIndex,
+    max_tokens: Optional[int] = None,
+    max_bytes: Optional[int] = None,
+    cursor: Optional[str] = None,
+    if_changed_since: Optional[str] = None,
+) -> str:
+    """Build the tool response from a theme.md section index: budgeted, delta or full."""
+    if is_budgeted(max_tokens, max_bytes, cursor):
+        return theme_budgeted_response(
+            "get_css_selectors_guide", index, SECTION_KEYS, SECTION_TITLE, get_css_selectors_guide_fallback,
+            max_tokens, max_bytes, cursor,
+        )
+    return versioned_response(
+        "get_css_selectors_guide", index, lambda: _render_css_selectors_guide(index),
+        lambda: theme_sections(index, SECTION_KEYS), SECTION_TITLE, if_changed_since,
+    )
+
+
+def get_css_selectors_guide(
+    max_tokens: Optional[int] = None,
+    max_bytes: Optional[int] = None,
+    cursor: Optional[str] = None,
+    if_changed_since: Optional[str] = None,
+) -> str:
     """
     Get CSS selectors and targeting techniques for styling form fields.
     Covers type-based selectors, name-based targeting, and advanced styling patterns.
     
+    Args:
+        max_tokens (int): Optional token budget; returns the most relevant sections that fit
+        max_bytes (int): Optional byte budget, like max_tokens
+        cursor (str): Cursor from a previous budgeted call, to fetch the remaining sections
+        if_changed_since (str): Hash of an earlier response; returns a short "unchanged"
+            reply, or only the changed sections, instead of the full content
+        
     Returns:
         JSON string with CSS selectors guide information
     """
     try:
-        docs_content, docs_url = fetch_adobe_docs()
-        
-        # Extract styling/selectors patterns
-        patterns = [
-            r"## \*\*Styling Fields\*\*(.*?)(?=###|\Z)",
-            r"### \*\*Styling based on Field Type\.\*\*(.*?)(?=###|\Z)",
-            r"### \*\*Styling specific field type\.\*\*(.*?)(?=###|\Z)"
-        ]
-        
-        extracted_content = extract_content_patterns(
-            docs_content, 
-            patterns, 
-            docs_url, 
-            "CSS Selectors & Styling Techniques"
-        )
-        
-        if extracted_content:
-            return create_success_response(extracted_content)
-        else:
-            return create_success_response(get_css_selectors_guide_fallback())
-            
+        index = get_theme_index()
+        return _build_css_selectors_guide(index, max_tokens, max_bytes, cursor, if_changed_since)
     except Exception as e:
         return create_error_response(f"Error fetching CSS selectors documentation: {str(e)}")
+
+
+async def get_css_selectors_guide_async(
+    max_tokens: Optional[int] = None,
+    max_bytes: Optional[int] = None,
+    cursor: Optional[str] = None,
+    if_changed_since: Optional[str] = None,
+) -> str:
+    """
+    Async variant of get_css_selectors_guide() that never blocks the event loop.
+    
+    Returns:
+        JSON string with CSS selectors guide information
+    """
+    try:
+        index = await get_theme_index_async()
+        return _build_css_selectors_guide(index, max_tokens, max_bytes, cursor, if_changed_since)
+    except Exception as e:
+        return create_error_response(f"Error fetching CSS selectors documentation: {str(e)}")
+
+
+def _lookup_response(selectors: SelectorIndex, field_type: str, name: Optional[str]) -> str:
+    """Build the lookup_selectors response from a parsed selector index."""
+    result = selectors.lookup(field_type, name)
+    result["documented_types"] = selectors.field_types()
+    return create_success_response(json.dumps(result, indent=2))
+
+
+def lookup_selectors(field_type: str, name: Optional[str] = None) -> str:
+    """
+    Look up the CSS selectors of a field type, optionally for one named field.
+    Answers from the selector index parsed from theme.md's examples, not from prose.
+    
+    Args:
+        field_type (str): Field type, e.g. "drop-down", "radio-group", "email" (aliases
+            such as "select" or "checkbox" are accepted)
+        name (str): Optional field name, e.g. "country", to get name-based selectors
+        
+    Returns:
+        JSON string whose ``data`` is itself a JSON-encoded object (as in
+        search_forms_docs) with the wrapper, control, name and state selectors,
+        the classes inside the field and the documented CSS examples
+    """
+    if not field_type or not field_type.strip():
+        return create_error_response("field_type is required")
+    try:
+        return _lookup_response(selector_index_for(get_theme_index()), field_type, name)
+    except Exception as e:
+        return create_error_response(f"Error looking up CSS selectors: {str(e)}")
+
+
+async def lookup_selectors_async(field_type: str, name: Optional[str] = None) -> str:
+    """
+    Async variant of lookup_selectors() that never blocks the event loop.
+    
+    Returns:
+        JSON string with the selectors of the field type
+    """
+    if not field_type or not field_type.strip():
+        return create_error_response("field_type is required")
+    try:
+        index = await get_theme_index_async()
+        return _lookup_response(selector_index_for(index), field_type, name)
+    except Exception as e:
+        return create_error_response(f"Error looking up CSS selectors: {str(e)}")
@@ -0,0 +1,530 @@
+"""
+Document cache for FORMS Edge Delivery MCP managers.
+
+Keeps a single process-wide copy of every upstream documentation file and
+revalidates it with conditional GETs (ETag / Last-Modified) once its TTL expires.
+With a shared store attached (multi-worker HTTP mode), fresh copies published
+by another worker are adopted instead of being fetched again.
+"""
+
+import asyncio
+import hashlib
+import sqlite3
+import sys
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple, Union
+
+from ..config import DOC_CACHE_CONFIG
+from .metrics import CollectedFamily, metrics
+from .request_timing import record_cache_status, timed_phase
+from .upstream_client import UpstreamClient, get_upstream_client
+
+if TYPE_CHECKING:
+    from .doc_store import SharedDocumentStore
+
+# How often a waiting follower checks the shared store for a published doc
+STORE_POLL_INTERVAL = 0.1
+
+UPSTREAM_FETCH_SECONDS = metrics.histogram(
+    "mcp_upstream_fetch_seconds", "Upstream documentation request latency", ["url", "status"]
+)
+UPSTREAM_BYTES = metrics.counter(
+    "mcp_upstream_response_bytes_total", "Bytes received from upstream documentation requests", ["url"]
+)
+
+
+class CachedDocument:
+    """A fetched documentation file together with its HTTP validators."""
+
+    def __init__(
+        self,
+        url: str,
+        content: str,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+        fetched_at: Optional[float] = None,
+        expires_at: float = 0.0,
+    ):
+        self.url = url
+        self.content = content
+        self.etag = etag
+        self.last_modified = last_modified
+        self.fetched_at = fetched_at if fetched_at is not None else time.time()
+        self.expires_at = expires_at
+        self.version = hashlib.sha256(content.encode("utf-8")).hexdigest()[:16]
+        # Last failed refresh; the stale copy keeps being served meanwhile
+        self.last_error: Optional[str] = None
+        self.last_error_at: Optional[float] = None
+        self.retry_at = 0.0
+
+    def is_fresh(self, now: Optional[float] = None) -> bool:
+        """Return True while the document is inside its TTL."""
+        return (now if now is not None else time.time()) < self.expires_at
+
+
+# The single upstream request for a URL, shared by every caller waiting on it
+if TYPE_CHECKING:
+    Flight = Future[CachedDocument]
+else:
+    Flight = Future
+
+
+class DocumentCache:
+    """
+    Thread-safe cache of upstream documents keyed by URL.
+
+    Fresh entries are served from memory. Expired entries are revalidated with
+    a conditional GET; a 304 response simply extends the entry's lifetime.
+    Within ``stale_ttl`` seconds after expiry the stale copy is returned
+    immediately while the revalidation runs in the background, and a failed
+    refresh keeps the stale copy (recording the error) instead of failing.
+    At most ``max_concurrent_fetches`` upstream requests run at once across
+    the threaded and async code paths, and concurrent misses for the same URL
+    are coalesced into a single upstream request whose result (or error) is
+    shared by every waiter. Requests go through ``client``, or the shared
+    pooled upstream client when none is given. With a shared ``store``, a
+    lookup that would go upstream first adopts a fresh copy from the store,
+    and every upstream result is published to it. While another worker holds
+    the refresher lease, such a lookup polls the store for up to
+    ``store_wait`` seconds for the leader's copy before going upstream itself.
+    """
+
+    def __init__(
+        self,
+        default_ttl: int,
+        ttls: Optional[Dict[str, int]] = None,
+        max_concurrent_fetches: int = 4,
+        stale_ttl: int = 0,
+        retry_interval: int = 30,
+        client: Optional[UpstreamClient] = None,
+    ):
+        self.default_ttl = default_ttl
+        self.ttls = dict(ttls or {})
+        self.client = client
+        self.store: Optional["SharedDocumentStore"] = None
+        self.owner: Optional[str] = None
+        self.store_wait = 0.0
+        self.stale_ttl = stale_ttl
+        self.retry_interval = retry_interval
+        self._entries: Dict[str, CachedDocument] = {}
+        self._inflight: Dict[str, Flight] = {}
+        self._listeners: List[Callable[[CachedDocument], None]] = []
+        self._lock = threading.Lock()
+        self._fetch_slots = threading.BoundedSemaphore(max_concurrent_fetches)
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_concurrent_fetches, thread_name_prefix="doc-fetch"
+        )
+        self.hits = 0
+        self.misses = 0
+        self.not_modified = 0
+        self.coalesced = 0
+        self.stale_hits = 0
+        self.refresh_errors = 0
+        self.evictions = 0
+        self.adopted = 0
+
+    def ttl_for(self, url: str) -> int:
+        """Return the TTL in seconds configured for a URL."""
+        return self.ttls.get(url, self.default_ttl)
+
+    def peek(self, url: str) -> Optional[CachedDocument]:
+        """Return the cached entry for a URL without fetching or counting."""
+        with self._lock:
+            return self._entries.get(url)
+
+    def get(self, url: str) -> CachedDocument:
+        """
+        Return the document for a URL, fetching or revalidating it when needed.
+
+        Args:
+            url (str): Upstream document URL
+
+        Returns:
+            CachedDocument: The cached or freshly fetched document
+
+        Raises:
+            requests.exceptions.RequestException: If the upstream request fails
+        """
+        with timed_phase("fetch"):
+            found = self._lookup(url)
+            if isinstance(found, CachedDocument):
+                return found
+            flight, entry, leader = found
+            if leader:
+                self._run_flight(url, entry, flight)
+            return flight.result()
+
+    async def get_async(self, url: str) -> CachedDocument:
+        """
+        Async variant of get() that never blocks the event loop.
+
+        Fresh entries are returned inline; upstream requests run on the
+        cache's fetch executor, which is sized to the concurrency ceiling,
+        and are awaited without holding an executor thread per waiter.
+
+        Args:
+            url (str): Upstream document URL
+
+        Returns:
+            CachedDocument: The cached or freshly fetched document
+
+        Raises:
+            requests.exceptions.RequestException: If the upstream request fails
+        """
+        with timed_phase("fetch"):
+            found = self._lookup(url)
+            if isinstance(found, CachedDocument):
+                return found
+            flight, entry, leader = found
+            if leader:
+                self._executor.submit(self._run_flight, url, entry, flight)
+            return await asyncio.wrap_future(flight)
+
+    def refresh(self, url: str) -> CachedDocument:
+        """
+        Revalidate a URL now, regardless of its remaining TTL.
+
+        Returns:
+            CachedDocument: The refreshed document, or the kept stale copy if
+            the refresh failed
+
+        Raises:
+            requests.exceptions.RequestException: If nothing is cached and the
+            upstream request fails
+        """
+        with self._lock:
+            entry = self._entries.get(url)
+            flight, leader = self._join_flight(url)
+        if leader:
+            self._run_flight(url, entry, flight, upstream=True)
+        return flight.result()
+
+    def _lookup(self, url: str) -> Union[CachedDocument, Tuple[Flight, Optional[CachedDocument], bool]]:
+        """
+        Return the entry, or (flight, entry, leader) when it must be fetched.
+
+        The entry is returned alone when it can be served right away (fresh,
+        or stale while a background refresh runs). Otherwise flight is the
+        single in-flight upstream request for the URL, and leader is True when
+        the caller created it and is responsible for running it.
+        """
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(url)
+            if entry is not None and entry.is_fresh(now):
+                self.hits += 1
+                record_cache_status("hit")
+                return entry
+            if entry is not None and self._is_servable_stale(entry, now):
+                self.stale_hits += 1
+                record_cache_status("stale")
+                if now >= entry.retry_at:
+                    flight, leader = self._join_flight(url)
+                    if leader:
+                        self._executor.submit(self._run_flight, url, entry, flight)
+                return entry
+            self.misses += 1
+            record_cache_status("miss")
+            flight, leader = self._join_flight(url)
+            return flight, entry, leader
+
+    def _is_servable_stale(self, entry: CachedDocument, now: float) -> bool:
+        # Keep serving a stale copy inside the stale window, and while backing
+        # off after a failed refresh
+        return now < entry.expires_at + self.stale_ttl or now < entry.retry_at
+
+    def _join_flight(self, url: str) -> Tuple[Flight, bool]:
+        """Return the in-flight request for a URL and whether the caller leads it (lock held)."""
+        existing = self._inflight.get(url)
+        if existing is not None:
+            self.coalesced += 1
+            return existing, False
+        flight: Flight = Future()
+        # A running future cannot be cancelled by one impatient waiter
+        flight.set_running_or_notify_cancel()
+        self._inflight[url] = flight
+        return flight, True
+
+    def _run_flight(
+        self, url: str, entry: Optional[CachedDocument], flight: Flight, upstream: bool = False
+    ) -> None:
+        try:
+            adopted = None if upstream else self._adopt_or_wait(url, entry)
+            document = adopted or self._fetch(url, entry)
+        except Exception as e:
+            if entry is None:
+                self._land_flight(url, flight, error=e)
+                return
+            # Keep the last good copy and back off before retrying upstream
+            now = time.time()
+            with self._lock:
+                entry.last_error = str(e)
+                entry.last_error_at = now
+                entry.retry_at = now + self.retry_interval
+                self.refresh_errors += 1
+            self._land_flight(url, flight, entry)
+        except BaseException as e:
+            self._land_flight(url, flight, error=e)
+            raise
+        else:
+            self._land_flight(url, flight, document)
+
+    def _land_flight(
+        self,
+        url: str,
+        flight: Flight,
+        document: Optional[CachedDocument] = None,
+        error: Optional[BaseException] = None,
+    ) -> None:
+        """Retire a flight, then complete it, under one lock hold."""
+        # A caller arriving between the two steps would otherwise join a
+        # flight that has already completed
+        with self._lock:
+            if self._inflight.get(url) is flight:
+                del self._inflight[url]
+            if error is not None:
+                flight.set_exception(error)
+            elif document is not None:
+                flight.set_result(document)
+
+    def _fetch(self, url: str, entry: Optional[CachedDocument]) -> CachedDocument:
+        headers = {}
+        if entry is not None:
+            if entry.etag:
+                headers["If-None-Match"] = entry.etag
+            if entry.last_modified:
+                headers["If-Modified-Since"] = entry.last_modified
+
+        with self._fetch_slots:
+            client = self.client or get_upstream_client()
+            start = time.perf_counter()
+            try:
+                response = client.get(url, headers=headers)
+            except Exception:
+                UPSTREAM_FETCH_SECONDS.observe(time.perf_counter() - start, url=url, status="error")
+                raise
+        UPSTREAM_FETCH_SECONDS.observe(time.perf_counter() - start, url=url, status=response.status_code)
+        UPSTREAM_BYTES.inc(len(response.content), url=url)
+
+        if response.status_code == 304 and entry is not None:
+            with self._lock:
+                entry.expires_at = time.time() + self.ttl_for(url)
+                entry.last_error = None
+                entry.retry_at = 0.0
+                self.not_modified += 1
+            self._share(entry, new_version=False)
+            return entry
+
+        response.raise_for_status()
+        document = CachedDocument(
+            url,
+            response.text,
+            etag=response.headers.get("ETag"),
+            last_modified=response.headers.get("Last-Modified"),
+        )
+        document.expires_at = document.fetched_at + self.ttl_for(url)
+        with self._lock:
+            if url in self._entries:
+                self.evictions += 1
+            self._entries[url] = document
+        self._share(document, new_version=True)
+        self._notify(document)
+        return document
+
+    def attach_store(self, store: "SharedDocumentStore", owner: Optional[str] = None, wait: float = 0.0) -> None:
+        """
+        Share documents with other worker processes through a store.
+
+        Args:
+            store (SharedDocumentStore): Store shared by the workers
+            owner (str): This worker's lease owner id (see doc_store.worker_id)
+            wait (float): Seconds a lookup waits for the refreshing worker to
+                publish a document before fetching it upstream
+        """
+        self.store = store
+        self.owner = owner
+        self.store_wait = wait
+
+    def _share(self, document: CachedDocument, new_version: bool) -> None:
+        if self.store is None:
+            return
+        try:
+            if new_version:
+                self.store.publish(document)
+            else:
+                self.store.extend(document)
+        except sqlite3.Error as e:
+            print(f"⚠️  Could not publish {document.url} to the shared store: {e}", file=sys.stderr)
+
+    def _adopt_or_wait(self, url: str, entry: Optional[CachedDocument]) -> Optional[CachedDocument]:
+        """Adopt a fresh copy from the store, polling while another worker refreshes upstream."""
+        deadline = time.monotonic() + self.store_wait
+        while True:
+            adopted = self._adopt(url, entry)
+            if adopted is not None or time.monotonic() >= deadline or not self._follows_store():
+                return adopted
+            time.sleep(STORE_POLL_INTERVAL)
+
+    def _follows_store(self) -> bool:
+        """Return True while another live worker holds the refresher lease."""
+        from .doc_store import REFRESHER_LEASE  # doc_store imports this module
+
+        if self.store is None:
+            return False
+        try:
+            holder = self.store.lease_holder(REFRESHER_LEASE)
+        except sqlite3.Error:
+            return False
+        return holder is not None and holder != self.owner
+
+    def _adopt(self, url: str, entry: Optional[CachedDocument]) -> Optional[CachedDocument]:
+        """Return a fresh copy published by another worker, installing it; None to go upstream."""
+        if self.store is None:
+            return None
+        try:
+            head = self.store.head(url)
+            if head is None or head[2] <= time.time():
+                return None
+            if entry is not None and entry.version == head[0]:
+                with self._lock:
+                    entry.expires_at = max(entry.expires_at, head[2])
+                    entry.last_error = None
+                    entry.retry_at = 0.0
+                    self.adopted += 1
+                return entry
+            document = self.store.load(url)
+        except sqlite3.Error as e:
+            print(f"⚠️  Could not read {url} from the shared store: {e}", file=sys.stderr)
+            return None
+        if document is None:
+            return None
+        with self._lock:
+            if url in self._entries:
+                self.evictions += 1
+            self._entries[url] = document
+            self.adopted += 1
+        return document
+
+    def sync_from_store(self, url: str) -> bool:
+        """
+        Adopt a newer version or a later expiry of a URL from the shared store.
+
+        Called periodically by workers that do not refresh upstream, so they
+        switch to a new version as soon as the refreshing worker publishes it.
+
+        Returns:
+            bool: True if the local entry was replaced or extended
+        """
+        if self.store is None:
+            return False
+        try:
+            head = self.store.head(url)
+        except sqlite3.Error as e:
+            print(f"⚠️  Could not read {url} from the shared store: {e}", file=sys.stderr)
+            return False
+        if head is None:
+            return False
+        version, fetched_at, expires_at = head
+        entry = self.peek(url)
+        if entry is not None:
+            if entry.version == version and expires_at <= entry.expires_at:
+                return False
+            if entry.version != version and fetched_at < entry.fetched_at:
+                return False
+        return self._adopt(url, entry) is not None
+
+    def put(self, document: CachedDocument) -> None:
+        """Store a document obtained outside the cache, e.g. from a snapshot."""
+        with self._lock:
+            self._entries[document.url] = document
+
+    def subscribe(self, listener: Callable[[CachedDocument], None]) -> None:
+        """Register a callback invoked whenever a new document version is fetched."""
+        self._listeners.append(listener)
+
+    def _notify(self, document: CachedDocument) -> None:
+        for listener in self._listeners:
+            try:
+                listener(document)
+            except Exception as e:
+                print(f"⚠️  Document listener failed for {document.url}: {e}", file=sys.stderr)
+
+    def invalidate(self, url: Optional[str] = None) -> None:
+        """Drop one cached URL, or every entry when no URL is given."""
+        with self._lock:
+            if url is None:
+                self.evictions += len(self._entries)
+                self._entries.clear()
+            elif self._entries.pop(url, None) is not None:
+                self.evictions += 1
+
+    def stats(self) -> Dict[str, Any]:
+        """Return hit/miss counters and the state of each cached document."""
+        now = time.time()
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "not_modified": self.not_modified,
+                "coalesced": self.coalesced,
+                "stale_hits": self.stale_hits,
+                "refresh_errors": self.refresh_errors,
+                "evictions": self.evictions,
+                "adopted": self.adopted,
+                "in_flight": len(self._inflight),
+                "hit_ratio": round(self.hits / total, 4) if total else 0.0,
+                "documents": {
+                    url: {
+                        "version": entry.version,
+                        "size": len(entry.content),
+                        "fresh": entry.is_fresh(now),
+                        "age_seconds": round(now - entry.fetched_at, 1),
+                        "expires_in_seconds": round(entry.expires_at - now, 1),
+                        "last_error": entry.last_error,
+                    }
+                    for url, entry in self._entries.items()
+                },
+            }
+
+
+# Process-wide cache shared by every documentation manager
+document_cache = DocumentCache(
+    DOC_CACHE_CONFIG["default_ttl"],
+    DOC_CACHE_CONFIG["ttls"],
+    DOC_CACHE_CONFIG["max_concurrent_fetches"],
+    DOC_CACHE_CONFIG["stale_ttl"],
+    DOC_CACHE_CONFIG["retry_interval"],
+)
+
+
+def _collect_cache_metrics() -> List[CollectedFamily]:
+    stats = document_cache.stats()
+    return [
+        ("mcp_doc_cache_lookups_total", "counter", "Document cache lookups by result", [
+            ({"result": "hit"}, stats["hits"]),
+            ({"result": "stale"}, stats["stale_hits"]),
+            ({"result": "miss"}, stats["misses"]),
+        ]),
+        ("mcp_doc_cache_not_modified_total", "counter", "Revalidations answered with 304 Not Modified",
+         [({}, stats["not_modified"])]),
+        ("mcp_doc_cache_coalesced_total", "counter", "Lookups that joined an in-flight upstream request",
+         [({}, stats["coalesced"])]),
+        ("mcp_doc_cache_refresh_errors_total", "counter", "Failed refreshes that kept the stale copy",
+         [({}, stats["refresh_errors"])]),
+        ("mcp_doc_cache_evictions_total", "counter", "Cached documents dropped or replaced by a new version",
+         [({}, stats["evictions"])]),
+        ("mcp_doc_cache_adopted_total", "counter", "Documents taken from the shared store instead of upstream",
+         [({}, stats["adopted"])]),
+        ("mcp_doc_cache_hit_ratio", "gauge", "Fresh hits over hits plus misses",
+         [({}, stats["hit_ratio"])]),
+        ("mcp_upstream_fetches_in_flight", "gauge", "Upstream documentation requests in flight",
+         [({}, stats["in_flight"])]),
+        ("mcp_doc_age_seconds", "gauge", "Age of each cached document",
+         [({"url": url}, doc["age_seconds"]) for url, doc in stats["documents"].items()]),
+    ]
+
+
+metrics.register_collector(_collect_cache_metrics)
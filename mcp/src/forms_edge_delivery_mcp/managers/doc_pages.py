@@ -0,0 +1,147 @@
+"""
+Paginated documentation for FORMS Edge Delivery MCP resources.
+
+Each upstream document is cut into pages of roughly ``page_tokens`` tokens,
+always on heading-section boundaries, once per document version. Pages are
+contiguous slices of the raw markdown, so reading them in order reproduces the
+document, and a character offset maps to exactly one page.
+"""
+
+import bisect
+from typing import Any, Dict, List, Optional
+from urllib.parse import parse_qs
+
+from ..config import DOCS_URLS, DOC_PAGE_CONFIG
+from .doc_cache import document_cache
+from .section_index import SectionIndex, section_index_for
+from .token_budget import estimate_tokens
+
+RESOURCE_PREFIX = "resource://docs/"
+
+
+class DocPage:
+    """A run of whole heading sections of one document version."""
+
+    def __init__(self, number: int, start: int, end: int, tokens: int, sections: List[str]):
+        self.number = number
+        self.start = start
+        self.end = end
+        self.tokens = tokens
+        self.sections = sections
+
+
+def document_pages(index: SectionIndex, page_tokens: int) -> List[DocPage]:
+    """
+    Return the pages of a document version, computed once per version.
+
+    Consecutive sections are added to a page until the next one would exceed
+    ``page_tokens``; a single section larger than that gets a page of its own.
+
+    Args:
+        index (SectionIndex): Section index of the document version
+        page_tokens (int): Target page size in estimated tokens
+
+    Returns:
+        List[DocPage]: Pages in document order, numbered from 1
+    """
+    def build() -> List[DocPage]:
+        content = index.content
+        pages: List[DocPage] = []
+        start, tokens = 0, 0
+        sections: List[str] = []
+        for node, span_start, span_end in index.spans():
+            span_tokens = estimate_tokens(content[span_start:span_end])
+            if sections and tokens + span_tokens > page_tokens:
+                pages.append(DocPage(len(pages) + 1, start, span_start, tokens, sections))
+                start, tokens, sections = span_start, 0, []
+            tokens += span_tokens
+            sections.append(node.id if node else "intro")
+        if sections or not pages:
+            pages.append(DocPage(len(pages) + 1, start, len(content), tokens, sections))
+        return pages
+    return index.derived(("pages", page_tokens), build)
+
+
+def parse_doc_uri(value: str) -> Dict[str, Any]:
+    """
+    Split "layout?page=2" (or "layout?offset=5000") into arguments for read_doc_page.
+
+    Raises:
+        ValueError: If page or offset is not a number
+    """
+    name, _, query = value.partition("?")
+    params = {key: values[-1] for key, values in parse_qs(query).items()}
+    arguments: Dict[str, Any] = {"doc": name}
+    for key in ("page", "offset"):
+        if key in params:
+            try:
+                arguments[key] = int(params[key])
+            except ValueError:
+                raise ValueError(f"{key} must be a number")
+    return arguments
+
+
+def _page_payload(doc: str, index: SectionIndex, page: Optional[int], offset: Optional[int]) -> Dict[str, Any]:
+    pages = document_pages(index, DOC_PAGE_CONFIG["page_tokens"])
+    if offset is not None:
+        if not 0 <= offset < max(len(index.content), 1):
+            raise ValueError(f"offset must be between 0 and {len(index.content) - 1}")
+        page = bisect.bisect_right([p.start for p in pages], offset)
+    if page is None:
+        page = 1
+    if not 1 <= page <= len(pages):
+        raise ValueError(f"page must be between 1 and {len(pages)}")
+    current = pages[page - 1]
+    return {
+        "doc": doc,
+        "url": index.url,
+        "version": index.version,
+        "page": current.number,
+        "pages": len(pages),
+        "offset": current.start,
+        "end_offset": current.end,
+        "tokens": current.tokens,
+        "sections": current.sections,
+        "next": f"{RESOURCE_PREFIX}{doc}?page={page + 1}" if page < len(pages) else None,
+        "content": index.content[current.start:current.end],
+    }
+
+
+def _resolve_doc(doc: str) -> str:
+    if doc not in DOCS_URLS:
+        raise ValueError(f"Unknown document '{doc}'. Available: {', '.join(DOCS_URLS)}")
+    return DOCS_URLS[doc]
+
+
+def read_doc_page(doc: str, page: Optional[int] = None, offset: Optional[int] = None) -> Dict[str, Any]:
+    """
+    Read one page of an upstream document.
+
+    Args:
+        doc (str): "theme", "layout" or "component"
+        page (int): Page number, from 1 (default 1)
+        offset (int): Character offset in the document; selects the page containing it
+
+    Returns:
+        Dict[str, Any]: Page content with its position, section IDs and the
+        URI of the next page
+
+    Raises:
+        ValueError: If the document, page or offset is unknown
+        Exception: If the documentation cannot be fetched
+    """
+    url = _resolve_doc(doc)
+    return _page_payload(doc, section_index_for(document_cache.get(url)), page, offset)
+
+
+async def read_doc_page_async(doc: str, page: Optional[int] = None, offset: Optional[int] = None) -> Dict[str, Any]:
+    """
+    Async variant of read_doc_page() that never blocks the event loop.
+
+    Returns:
+        Dict[str, Any]: Page content with its position, section IDs and the
+        URI of the next page
+    """
+    url = _resolve_doc(doc)
+    document = await document_cache.get_async(url)
+    return _page_payload(doc, section_index_for(document), page, offset)
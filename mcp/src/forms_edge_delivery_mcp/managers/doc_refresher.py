@@ -0,0 +1,142 @@
+"""
+Background documentation refresher for FORMS Edge Delivery MCP managers.
+
+Revalidates every upstream document shortly before its cache entry expires, so
+tool calls keep hitting a fresh copy instead of paying the upstream round trip.
+When worker processes share a document store, they elect one refresher through
+a lease in the store; the others only pick up what it publishes.
+"""
+
+import sqlite3
+import sys
+import threading
+import time
+from typing import TYPE_CHECKING, Dict, List, Optional
+
+from ..config import DOC_CACHE_CONFIG, DOCS_URLS, WORKER_CONFIG
+from .doc_cache import DocumentCache, document_cache
+from .doc_store import REFRESHER_LEASE
+
+if TYPE_CHECKING:
+    from .doc_store import SharedDocumentStore
+
+
+class DocumentRefresher:
+    """Daemon thread that refreshes cached documents ahead of their expiry."""
+
+    def __init__(
+        self,
+        cache: DocumentCache,
+        urls: List[str],
+        refresh_ahead: int = 30,
+        interval: int = 10,
+        lease_ttl: int = 30,
+    ):
+        self.cache = cache
+        self.urls = list(urls)
+        self.refresh_ahead = refresh_ahead
+        self.interval = interval
+        self.lease_ttl = lease_ttl
+        self.last_errors: Dict[str, str] = {}
+        self.store: Optional["SharedDocumentStore"] = None
+        self.owner: Optional[str] = None
+        self.leader = True
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def due(self, url: str, now: Optional[float] = None) -> bool:
+        """Return True if a URL is missing or about to expire and not backing off."""
+        now = now if now is not None else time.time()
+        entry = self.cache.peek(url)
+        if entry is None:
+            return True
+        return entry.expires_at - now <= self.refresh_ahead and now >= entry.retry_at
+
+    def attach_store(self, store: "SharedDocumentStore", owner: str) -> None:
+        """Elect a single refresher among the workers sharing a store."""
+        self.store = store
+        self.owner = owner
+        self.leader = False
+
+    def _elect(self) -> bool:
+        if self.store is None or self.owner is None:
+            # No shared store: this worker refreshes on its own
+            return True
+        try:
+            leader = self.store.acquire_lease(REFRESHER_LEASE, self.owner, self.lease_ttl)
+        except sqlite3.Error as e:
+            print(f"⚠️  Refresher election failed: {e}", file=sys.stderr)
+            leader = False
+        if leader != self.leader:
+            role = "refreshing docs upstream" if leader else "following the shared store"
+            print(f"🔁 Worker {self.owner} is now {role}", file=sys.stderr)
+        self.leader = leader
+        return leader
+
+    def run_once(self) -> None:
+        """Refresh every due document once (or, on a follower worker, sync from the store)."""
+        if self.store is not None and not self._elect():
+            for url in self.urls:
+                self.cache.sync_from_store(url)
+            return
+        for url in self.urls:
+            if self._stop.is_set() or not self.due(url):
+                continue
+            try:
+                self.cache.refresh(url)
+                self.last_errors.pop(url, None)
+            except Exception as e:
+                # Nothing cached yet; the next pass retries
+                self.last_errors[url] = str(e)
+
+    def start(self) -> None:
+        """Start the refresher thread (no-op if already running)."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        if self.store is not None:
+            # Elect before serving, so a follower's first cold miss already
+            # knows to wait for the leader instead of fetching upstream
+            self._elect()
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="doc-refresher", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the refresher thread."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=self.interval)
+        if self.store is not None and self.owner is not None and self.leader:
+            try:
+                self.store.release_lease(REFRESHER_LEASE, self.owner)
+            except sqlite3.Error:
+                pass
+            self.leader = False
+
+    def stats(self) -> Dict[str, object]:
+        """Return whether the refresher runs, whether it leads, and its last per-URL errors."""
+        return {
+            "running": self._thread is not None and self._thread.is_alive(),
+            "worker": self.owner,
+            "leader": self.leader,
+            "refresh_ahead_seconds": self.refresh_ahead,
+            "last_errors": dict(self.last_errors),
+        }
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            try:
+                self.run_once()
+            except Exception as e:
+                print(f"⚠️  Document refresher pass failed: {e}", file=sys.stderr)
+            self._stop.wait(self.interval)
+
+
+# Refresher for the process-wide cache; started by the server entry point
+document_refresher = DocumentRefresher(
+    document_cache,
+    list(DOCS_URLS.values()),
+    DOC_CACHE_CONFIG["refresh_ahead"],
+    DOC_CACHE_CONFIG["refresh_interval"],
+    WORKER_CONFIG["lease_ttl"],
+)
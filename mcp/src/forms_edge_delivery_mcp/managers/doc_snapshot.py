@@ -0,0 +1,207 @@
+"""
+Documentation snapshot for FORMS Edge Delivery MCP managers.
+
+Persists the fetched upstream docs to a local directory so a fresh process can
+serve real content before (or without) reaching aem.live. Every file is written
+atomically and recorded in a manifest with its content hash and fetch time.
+Updates take a file lock next to the manifest, so worker processes sharing the
+directory do not overwrite each other's entries.
+"""
+
+import hashlib
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, Optional
+
+if sys.platform != "win32":
+    import fcntl
+
+from ..config import DOCS_URLS, SNAPSHOT_CONFIG
+from .doc_cache import CachedDocument, DocumentCache, document_cache
+
+MANIFEST_FILE = "manifest.json"
+LOCK_FILE = ".manifest.lock"
+
+_manifest_lock = threading.Lock()
+
+
+def _atomic_write(path: str, data: bytes) -> None:
+    """Write a file so readers only ever see the old or the new content."""
+    directory = os.path.dirname(path)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".tmp-")
+    try:
+        with os.fdopen(fd, "wb") as tmp:
+            tmp.write(data)
+            tmp.flush()
+            os.fsync(tmp.fileno())
+        os.chmod(tmp_path, 0o644)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+
+
+def _doc_name(url: str) -> Optional[str]:
+    for name, doc_url in DOCS_URLS.items():
+        if doc_url == url:
+            return name
+    return None
+
+
+@contextmanager
+def _locked_manifest(directory: str) -> Iterator[None]:
+    """Hold the manifest lock of a directory, across threads and processes."""
+    with _manifest_lock:
+        if sys.platform == "win32":
+            # No flock: only the threads of one process are serialized
+            yield
+            return
+        with open(os.path.join(directory, LOCK_FILE), "a") as lock:
+            fcntl.flock(lock.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock.fileno(), fcntl.LOCK_UN)
+
+
+def read_manifest(directory: str) -> Dict[str, Any]:
+    """Return the snapshot manifest of a directory, or an empty one."""
+    try:
+        with open(os.path.join(directory, MANIFEST_FILE), encoding="utf-8") as f:
+            manifest: Dict[str, Any] = json.load(f)
+        return manifest
+    except (OSError, ValueError):
+        return {"documents": {}}
+
+
+def save_document(document: CachedDocument, directory: Optional[str] = None) -> None:
+    """
+    Persist one document and its manifest entry to the snapshot directory.
+
+    Args:
+        document (CachedDocument): The document to persist
+        directory (str): Snapshot directory; defaults to the configured one
+    """
+    name = _doc_name(document.url)
+    if name is None:
+        return
+    directory = directory or SNAPSHOT_CONFIG["directory"]
+    os.makedirs(directory, exist_ok=True)
+
+    data = document.content.encode("utf-8")
+    file_name = f"{name}.md"
+    with _locked_manifest(directory):
+        _atomic_write(os.path.join(directory, file_name), data)
+        manifest = read_manifest(directory)
+        manifest.setdefault("documents", {})[name] = {
+            "url": document.url,
+            "file": file_name,
+            "sha256": hashlib.sha256(data).hexdigest(),
+            "version": document.version,
+            "etag": document.etag,
+            "last_modified": document.last_modified,
+            "fetched_at": document.fetched_at,
+        }
+        manifest["updated_at"] = time.time()
+        _atomic_write(
+            os.path.join(directory, MANIFEST_FILE),
+            json.dumps(manifest, indent=2).encode("utf-8"),
+        )
+
+
+def load_snapshot(cache: DocumentCache = document_cache, directory: Optional[str] = None) -> int:
+    """
+    Seed a document cache from the snapshot directory.
+
+    Documents whose content no longer matches the manifest hash are skipped.
+    A loaded document keeps the TTL it had when it was fetched, so a snapshot
+    older than the TTL is revalidated upstream on first use (and still served
+    if upstream is unreachable).
+
+    Args:
+        cache (DocumentCache): Cache to seed
+        directory (str): Snapshot directory; defaults to the configured one
+
+    Returns:
+        int: Number of documents loaded
+    """
+    directory = directory or SNAPSHOT_CONFIG["directory"]
+    manifest = read_manifest(directory)
+    loaded = 0
+    for name, meta in manifest.get("documents", {}).items():
+        url = DOCS_URLS.get(name)
+        if url is None or cache.peek(url) is not None:
+            continue
+        try:
+            with open(os.path.join(directory, meta["file"]), "rb") as f:
+                data = f.read()
+        except (OSError, KeyError):
+            continue
+        if hashlib.sha256(data).hexdigest() != meta.get("sha256"):
+            print(f"⚠️  Snapshot of {name} does not match its manifest hash - skipping", file=sys.stderr)
+            continue
+        # Without a fetch time the snapshot's age is unknown: treat it as expired
+        fetched_at = meta.get("fetched_at")
+        cache.put(CachedDocument(
+            url,
+            data.decode("utf-8"),
+            etag=meta.get("etag"),
+            last_modified=meta.get("last_modified"),
+            fetched_at=fetched_at,
+            expires_at=fetched_at + cache.ttl_for(url) if fetched_at is not None else 0.0,
+        ))
+        loaded += 1
+    return loaded
+
+
+def _persist_quietly(document: CachedDocument) -> None:
+    try:
+        save_document(document)
+    except OSError as e:
+        print(f"⚠️  Could not update doc snapshot: {e}", file=sys.stderr)
+
+
+def enable_snapshot(cache: DocumentCache = document_cache) -> int:
+    """
+    Load the snapshot into the cache and keep it updated with new doc versions.
+
+    Returns:
+        int: Number of documents loaded from the snapshot
+    """
+    if not SNAPSHOT_CONFIG["enabled"]:
+        return 0
+    loaded = load_snapshot(cache)
+    cache.subscribe(_persist_quietly)
+    return loaded
+
+
+def build_snapshot(directory: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Fetch every upstream document and write a complete snapshot.
+
+    Args:
+        directory (str): Output directory; defaults to the configured one
+
+    Returns:
+        Dict[str, Any]: The written manifest
+
+    Raises:
+        Exception: If any document cannot be fetched
+    """
+    import requests
+
+    directory = directory or SNAPSHOT_CONFIG["directory"]
+    builder = DocumentCache(0)
+    for name, url in DOCS_URLS.items():
+        try:
+            document = builder.get(url)
+        except requests.exceptions.RequestException as e:
+            raise Exception(f"Unable to fetch {name} documentation: {str(e)}")
+        save_document(document, directory)
+    return read_manifest(directory)
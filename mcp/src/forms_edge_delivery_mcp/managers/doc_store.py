@@ -0,0 +1,168 @@
+"""
+Cross-process document store for FORMS Edge Delivery MCP HTTP workers.
+
+When the HTTP server runs several worker processes, they share the fetched
+upstream documents through a local SQLite database (WAL mode, so readers never
+block the writer). One worker at a time holds the refresher lease and is the
+only one revalidating documents upstream; it publishes every new version and
+every extended TTL, and the other workers adopt them from the store instead of
+fetching the documents themselves.
+"""
+
+import os
+import socket
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Optional, Tuple
+
+from ..config import WORKER_CONFIG
+from .doc_cache import CachedDocument
+
+# Name of the store lease held by the worker that refreshes upstream
+REFRESHER_LEASE = "refresher"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS documents (
+    url TEXT PRIMARY KEY,
+    content TEXT NOT NULL,
+    version TEXT NOT NULL,
+    etag TEXT,
+    last_modified TEXT,
+    fetched_at REAL NOT NULL,
+    expires_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS leases (
+    name TEXT PRIMARY KEY,
+    owner TEXT NOT NULL,
+    expires_at REAL NOT NULL
+);
+"""
+
+
+def worker_id() -> str:
+    """Return an identifier of this worker process, unique on the host."""
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+class SharedDocumentStore:
+    """
+    SQLite-backed documents and leases shared by every worker on one host.
+
+    Each thread uses its own connection; writes are single statements or short
+    IMMEDIATE transactions, so concurrent workers only ever wait for each
+    other for the duration of one write.
+    """
+
+    def __init__(self, path: str, timeout: float = 5.0):
+        self.path = path
+        self.timeout = timeout
+        self._local = threading.local()
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        connection = self._connection()
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.executescript(_SCHEMA)
+
+    def _connection(self) -> sqlite3.Connection:
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            # Autocommit; transactions are opened explicitly where needed
+            connection = sqlite3.connect(self.path, timeout=self.timeout, isolation_level=None)
+            self._local.connection = connection
+        return connection
+
+    def publish(self, document: CachedDocument) -> None:
+        """Store a new document version for the other workers."""
+        self._connection().execute(
+            "INSERT OR REPLACE INTO documents "
+            "(url, content, version, etag, last_modified, fetched_at, expires_at) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (document.url, document.content, document.version, document.etag,
+             document.last_modified, document.fetched_at, document.expires_at),
+        )
+
+    def extend(self, document: CachedDocument) -> None:
+        """Record a revalidated (304) document's new expiry, if the version is unchanged."""
+        self._connection().execute(
+            "UPDATE documents SET expires_at = MAX(expires_at, ?) WHERE url = ? AND version = ?",
+            (document.expires_at, document.url, document.version),
+        )
+
+    def head(self, url: str) -> Optional[Tuple[str, float, float]]:
+        """Return (version, fetched_at, expires_at) of a stored document without its content."""
+        row: Optional[Tuple[str, float, float]] = self._connection().execute(
+            "SELECT version, fetched_at, expires_at FROM documents WHERE url = ?", (url,)
+        ).fetchone()
+        return row
+
+    def load(self, url: str) -> Optional[CachedDocument]:
+        """Return the stored document for a URL, if any."""
+        row = self._connection().execute(
+            "SELECT content, etag, last_modified, fetched_at, expires_at FROM documents WHERE url = ?",
+            (url,),
+        ).fetchone()
+        if row is None:
+            return None
+        content, etag, last_modified, fetched_at, expires_at = row
+        return CachedDocument(url, content, etag, last_modified, fetched_at, expires_at)
+
+    def acquire_lease(self, name: str, owner: str, ttl: float) -> bool:
+        """
+        Take or renew a named lease.
+
+        Args:
+            name (str): Lease name
+            owner (str): Identifier of the caller (see worker_id)
+            ttl (float): Seconds the lease stays valid without renewal
+
+        Returns:
+            bool: True if the caller holds the lease until now + ttl
+        """
+        now = time.time()
+        connection = self._connection()
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            row = connection.execute(
+                "SELECT owner, expires_at FROM leases WHERE name = ?", (name,)
+            ).fetchone()
+            acquired = row is None or row[0] == owner or row[1] <= now
+            if acquired:
+                connection.execute(
+                    "INSERT OR REPLACE INTO leases (name, owner, expires_at) VALUES (?, ?, ?)",
+                    (name, owner, now + ttl),
+                )
+            connection.execute("COMMIT")
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+        return acquired
+
+    def release_lease(self, name: str, owner: str) -> None:
+        """Give up a lease held by owner, so another worker can take it right away."""
+        self._connection().execute("DELETE FROM leases WHERE name = ? AND owner = ?", (name, owner))
+
+    def lease_holder(self, name: str) -> Optional[str]:
+        """Return the owner of a lease that has not expired."""
+        row = self._connection().execute(
+            "SELECT owner FROM leases WHERE name = ? AND expires_at > ?", (name, time.time())
+        ).fetchone()
+        return row[0] if row else None
+
+    def stats(self) -> Dict[str, Any]:
+        """Return the store path, stored versions and the refresher lease holder."""
+        rows = self._connection().execute("SELECT url, version, expires_at FROM documents").fetchall()
+        now = time.time()
+        return {
+            "path": self.path,
+            "documents": {
+                url: {"version": version, "expires_in_seconds": round(expires_at - now, 1)}
+                for url, version, expires_at in rows
+            },
+            "refresher": self.lease_holder(REFRESHER_LEASE),
+        }
+
+
+def open_shared_store(path: Optional[str] = None) -> SharedDocumentStore:
+    """Open (creating if needed) the store at path, or at the configured location."""
+    return SharedDocumentStore(path or WORKER_CONFIG["store_path"])
@@ -4,12 +4,20 @@ Dropdown Manager for FORMS Edge Delivery MCP server.
 Handles dropdown/select component documentation retrieval and fallback content.
 """
 
+from typing import Optional
+
 from .shared_utils import (
-    fetch_adobe_docs, 
     create_success_response, 
-    create_error_response,
-    extract_content_patterns
+    create_error_response
 )
+from .section_index import SectionIndex, get_theme_index, get_theme_index_async
+from .content_delta import theme_sections, versioned_response
+from .token_budget import is_budgeted, theme_budgeted_response
+
+
+# theme.md sections served by this manager, in output order
+SECTION_KEYS = ["dropdown"]
+SECTION_TITLE = "Dropdown Component Styling"
 
 
 def get_dropdown_styling_fallback() -> str:
@@ -31,33 +39,76 @@ Dropdowns typically use:
 """
 
 
-def get_dropdown_styling() -> str:
+def _render_dropdown_styling(index: SectionIndex) -> str:
+    """Build the full dropdown response from a theme.md section index."""
+    extracted_content = index.render(SECTION_KEYS, SECTION_TITLE)
+    
+    if extracted_content:
+        return create_success_response(extracted_content)
+    else:
+        return create_success_response(get_dropdown_styling_fallback())
+
+
+def _build_dropdown_styling(
+    index: SectionIndex,
+    max_tokens: Optional[int] = None,
+    max_bytes: Optional[int] = None,
+    cursor: Optional[str] = None,
+    if_changed_since: Optional[str] = None,
+) -> str:
+    """Build the tool response from a theme.md section index: budgeted, delta or full."""
+    if is_budgeted(max_tokens, max_bytes, cursor):
+        return theme_budgeted_response(
+            "get_dropdown_styling", index, SECTION_KEYS, SECTION_TITLE, get_dropdown_styling_fallback,
+            max_tokens, max_bytes, cursor,
+        )
+    return versioned_response(
+        "get_dropdown_styling", index, lambda: _render_dropdown_styling(index),
+        lambda: theme_sections(index, SECTION_KEYS), SECTION_TITLE, if_changed_since,
+    )
+
+
+def get_dropdown_styling(
+    max_tokens: Optional[int] = None,
+    max_bytes: Optional[int] = None,
+    cursor: Optional[str] = None,
+    if_changed_since: Optional[str] = None,
+) -> str:
     """
     Get dropdown/select component structure and styling information.
     Covers HTML structure, CSS selectors, and styling techniques for dropdown components.
     
+    Args:
+        max_tokens (int): Optional token budget; returns the most relevant sections that fit
+        max_bytes (int): Optional byte budget, like max_tokens
+        cursor (str): Cursor from a previous budgeted call, to fetch the remaining sections
+        if_changed_since (str): Hash of an earlier response; returns a short "unchanged"
+            reply, or only the changed sections, instead of the full content
+        
     Returns:
         JSON string with dropdown component information
     """
     try:
-        docs_content, docs_url = fetch_adobe_docs()
-        
-        # Extract dropdown-specific patterns
-        patterns = [
-            r"### \*\*Dropdown\*\*(.*?)(?=###|\Z)"
-        ]
-        
-        extracted_content = extract_content_patterns(
-            docs_content, 
-            patterns, 
-            docs_url, 
-            "Dropdown Component Styling"
-        )
-        
-        if extracted_content:
-            return create_success_response(extracted_content)
-        else:
-            return create_success_response(get_dropdown_styling_fallback())
-            
+        index = get_theme_index()
+        return _build_dropdown_styling(index, max_tokens, max_bytes, cursor, if_changed_since)
+    except Exception as e:
+        return create_error_response(f"Error fetching dropdown documentation: {str(e)}")
+
+
+async def get_dropdown_styling_async(
+    max_tokens: Optional[int] = None,
+    max_bytes: Optional[int] = None,
+    cursor: Optional[str] = None,
+    if_changed_since: Optional[str] = None,
+) -> str:
+    """
+    Async variant of get_dropdown_styling() that never blocks the event loop.
+    
+    Returns:
+        JSON string with dropdown component information
+    """
+    try:
+        index = await get_theme_index_async()
+        return _build_dropdown_styling(index, max_tokens, max_bytes, cursor, if_changed_since)
     except Exception as e:
         return create_error_response(f"Error fetching dropdown documentation: {str(e)}")
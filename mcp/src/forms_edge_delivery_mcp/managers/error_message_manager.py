@@ -4,12 +4,20 @@ Error Message Manager for FORMS Edge Delivery MCP server.
 Handles form validation and error message documentation retrieval and fallback content.
 """
 
+from typing import Optional
+
 from .shared_utils import (
-    fetch_adobe_docs, 
     create_success_response, 
-    create_error_response,
-    extract_content_patterns
+    create_error_response
 )
+from .section_index import SectionIndex, get_theme_index, get_theme_index_async
+from .content_delta import theme_sections, versioned_response
+from .token_budget import is_budgeted, theme_budgeted_response
+
+
+# theme.md sections served by this manager, in output order
+SECTION_KEYS = ["error-messages", "error-structure", "error-styling"]
+SECTION_TITLE = "Error Message Styling"
 
 
 def get_error_message_styling_fallback() -> str:
@@ -32,35 +40,76 @@ Error styling typically includes:
 """
 
 
-def get_error_message_styling() -> str:
+def _render_error_message_styling(index: SectionIndex) -> str:
+    """Build the full error message response from a theme.md section index."""
+    extracted_content = index.render(SECTION_KEYS, SECTION_TITLE)
+    
+    if extracted_content:
+        return create_success_response(extracted_content)
+    else:
+        return create_success_response(get_error_message_styling_fallback())
+
+
+def _build_error_message_styling(
+    index: SectionIndex,
+    max_tokens: Optional[int] = None,
+    max_bytes: Optional[int] = None,
+    cursor: Optional[str] = None,
+    if_changed_since: Optional[str] = None,
+) -> str:
+    """Build the tool response from a theme.md section index: budgeted, delta or full."""
+    if is_budgeted(max_tokens, max_bytes, cursor):
+        return theme_budgeted_response(
+            "get_error_message_styling", index, SECTION_KEYS, SECTION_TITLE, get_error_message_styling_fallback,
+            max_tokens, max_bytes, cursor,
+        )
+    return versioned_response(
+        "get_error_message_styling", index, lambda: _render_error_message_styling(index),
+        lambda: theme_sections(index, SECTION_KEYS), SECTION_TITLE, if_changed_since,
+    )
+
+
+def get_error_message_styling(
+    max_tokens: Optional[int] = None,
+    max_bytes: Optional[int] = None,
+    cursor: Optional[str] = None,
+    if_changed_since: Optional[str] = None,
+) -> str:
     """
     Get form validation and error message styling techniques.
     Covers error states, validation feedback, and error message presentation.
     
+    Args:
+        max_tokens (int): Optional token budget; returns the most relevant sections that fit
+        max_bytes (int): Optional byte budget, like max_tokens
+        cursor (str): Cursor from a previous budgeted call, to fetch the remaining sections
+        if_changed_since (str): Hash of an earlier response; returns a short "unchanged"
+            reply, or only the changed sections, instead of the full content
+        
     Returns:
         JSON string with error message styling information
     """
     try:
-        docs_content, docs_url = fetch_adobe_docs()
-        
-        # Extract error message patterns
-        patterns = [
-            r"## \*\*Styling Error Messages\*\*(.*?)(?=\+---|$)",
-            r"### Error Structure(.*?)(?=###|\Z)",
-            r"### Styling error message(.*?)(?=\+---|$)"
-        ]
-        
-        extracted_content = extract_content_patterns(
-            docs_content, 
-            patterns, 
-            docs_url, 
-            "Error Message Styling"
-        )
-        
-        if extracted_content:
-            return create_success_response(extracted_content)
-        else:
-            return create_success_response(get_error_message_styling_fallback())
-            
+        index = get_theme_index()
+        return _build_error_message_styling(index, max_tokens, max_bytes, cursor, if_changed_since)
+    except Exception as e:
+        return create_error_response(f"Error fetching error message documentation: {str(e)}")
+
+
+async def get_error_message_styling_async(
+    max_tokens: Optional[int] = None,
+    max_bytes: Optional[int] = None,
+    cursor: Optional[str] = None,
+    if_changed_since: Optional[str] = None,
+) -> str:
+    """
+    Async variant of get_error_message_styling() that never blocks the event loop.
+    
+    Returns:
+        JSON string with error message styling information
+    """
+    try:
+        index = await get_theme_index_async()
+        return _build_error_message_styling(index, max_tokens, max_bytes, cursor, if_changed_since)
     except Exception as e:
         return create_error_response(f"Error fetching error message documentation: {str(e)}")
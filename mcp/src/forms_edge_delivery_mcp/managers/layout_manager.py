@@ -4,9 +4,22 @@ Layout Manager for FORMS Edge Delivery MCP server.
 Handles panel layout configuration documentation retrieval and fallback content.
 """
 
-import requests
 import json
-from typing import Tuple
+from typing import AsyncIterator, Optional, Tuple
+
+from ..config import DOCS_URLS
+from .doc_cache import CachedDocument, document_cache
+from .content_delta import document_sections, versioned_response
+from .response_stream import StreamEvent, document_events, error
+from .section_index import section_index_for
+from .token_budget import budgeted_response, document_units, is_budgeted
+from .upstream_client import request_error
+
+DOC_TITLE = "Custom Layout Configuration for Panel"
+
+
+def _footer(docs_url: str) -> str:
+    return f"*Complete documentation from [Adobe Layout Configuration Documentation]({docs_url})*"
 
 
 def fetch_layout_docs() -> Tuple[str, str]:
@@ -19,15 +32,40 @@ def fetch_layout_docs() -> Tuple[str, str]:
     Raises:
         Exception: If documentation cannot be fetched
     """
-    DOCS_URL = "https://main--afb--adobe.aem.live/docs/developer/layout.md"
+    document = _fetch_layout_document()
+    return document.content, document.url
+
+
+def _fetch_layout_document() -> CachedDocument:
+    DOCS_URL = DOCS_URLS["layout"]
+    try:
+        return document_cache.get(DOCS_URL)
+    except request_error() as e:
+        raise Exception(f"Unable to fetch layout documentation: {str(e)}")
+
+
+async def _fetch_layout_document_async() -> CachedDocument:
+    DOCS_URL = DOCS_URLS["layout"]
     try:
-        response = requests.get(DOCS_URL, timeout=10)
-        response.raise_for_status()
-        return response.text, DOCS_URL
-    except requests.exceptions.RequestException as e:
+        return await document_cache.get_async(DOCS_URL)
+    except request_error() as e:
         raise Exception(f"Unable to fetch layout documentation: {str(e)}")
 
 
+async def fetch_layout_docs_async() -> Tuple[str, str]:
+    """
+    Async variant of fetch_layout_docs() that never blocks the event loop.
+    
+    Returns:
+        Tuple[str, str]: (content, url) - The documentation content and source URL
+        
+    Raises:
+        Exception: If documentation cannot be fetched
+    """
+    document = await _fetch_layout_document_async()
+    return document.content, document.url
+
+
 def get_layout_configuration_fallback() -> str:
     """Returns fallback content for layout configuration documentation."""
     return """
@@ -78,38 +116,124 @@ export default function accordionLayout(panel) {
 """
 
 
-def get_layout_configuration() -> str:
+def _render_layout_configuration(docs_content: str, docs_url: str) -> str:
+    """Build the full layout configuration response from the fetched documentation."""
+    if docs_content and docs_content.strip():
+        # Return the entire document content as requested
+        result = f"# {DOC_TITLE}\n\n"
+        result += docs_content
+        result += f"\n\n---\n\n{_footer(docs_url)}"
+            
+        return json.dumps({
+            "status": "success",
+            "data": result,
+            "errorMessage": None
+        })
+    else:
+        return json.dumps({
+            "status": "success",
+            "data": get_layout_configuration_fallback(),
+            "errorMessage": None
+        })
+
+
+def _build_layout_configuration(
+    document: CachedDocument,
+    max_tokens: Optional[int] = None,
+    max_bytes: Optional[int] = None,
+    cursor: Optional[str] = None,
+    if_changed_since: Optional[str] = None,
+) -> str:
+    """Build the tool response from the fetched documentation: budgeted, delta or full."""
+    if is_budgeted(max_tokens, max_bytes, cursor):
+        index = section_index_for(document)
+        return budgeted_response(
+            "get_layout_configuration",
+            index,
+            document_units(index),
+            DOC_TITLE,
+            _footer(document.url),
+            max_tokens,
+            max_bytes,
+            cursor,
+            get_layout_configuration_fallback,
+        )
+    return versioned_response(
+        "get_layout_configuration",
+        document,
+        lambda: _render_layout_configuration(document.content, document.url),
+        lambda: document_sections(section_index_for(document)),
+        DOC_TITLE,
+        if_changed_since,
+    )
+
+
+def get_layout_configuration(
+    max_tokens: Optional[int] = None,
+    max_bytes: Optional[int] = None,
+    cursor: Optional[str] = None,
+    if_changed_since: Optional[str] = None,
+) -> str:
     """
     Get complete documentation for panel layout configuration in Adaptive Form Block.
     Covers the entire process from componentDecorator function to layout implementation.
     
+    Args:
+        max_tokens (int): Optional token budget; returns the most relevant sections that fit
+        max_bytes (int): Optional byte budget, like max_tokens
+        cursor (str): Cursor from a previous budgeted call, to fetch the remaining sections
+        if_changed_since (str): Hash of an earlier response; returns a short "unchanged"
+            reply, or only the changed sections, instead of the full content
+        
     Returns:
         JSON string with complete layout configuration documentation
     """
     try:
-        docs_content, docs_url = fetch_layout_docs()
-        
-        if docs_content and docs_content.strip():
-            # Return the entire document content as requested
-            result = f"# Custom Layout Configuration for Panel\n\n"
-            result += docs_content
-            result += f"\n\n---\n\n*Complete documentation from [Adobe Layout Configuration Documentation]({docs_url})*"
-            
-            return json.dumps({
-                "status": "success",
-                "data": result,
-                "errorMessage": None
-            })
-        else:
-            return json.dumps({
-                "status": "success",
-                "data": get_layout_configuration_fallback(),
-                "errorMessage": None
-            })
-            
+        document = _fetch_layout_document()
+        return _build_layout_configuration(document, max_tokens, max_bytes, cursor, if_changed_since)
     except Exception as e:
         return json.dumps({
             "status": "failure",
             "data": None,
             "errorMessage": f"Error fetching layout configuration documentation: {str(e)}"
         })
+
+
+async def get_layout_configuration_async(
+    max_tokens: Optional[int] = None,
+    max_bytes: Optional[int] = None,
+    cursor: Optional[str] = None,
+    if_changed_since: Optional[str] = None,
+) -> str:
+    """
+    Async variant of get_layout_configuration() that never blocks the event loop.
+    
+    Returns:
+        JSON string with complete layout configuration documentation
+    """
+    try:
+        document = await _fetch_layout_document_async()
+        return _build_layout_configuration(document, max_tokens, max_bytes, cursor, if_changed_since)
+    except Exception as e:
+        return json.dumps({
+            "status": "failure",
+            "data": None,
+            "errorMessage": f"Error fetching layout configuration documentation: {str(e)}"
+        })
+
+
+async def stream_layout_configuration_async() -> AsyncIterator[StreamEvent]:
+    """
+    Stream the layout configuration documentation one heading section at a time.
+
+    Yields:
+        StreamEvent: ``meta`` and ``chunk`` events (see response_stream), or
+        an ``error`` event if the documentation cannot be fetched
+    """
+    try:
+        index = section_index_for(await _fetch_layout_document_async())
+    except Exception as e:
+        yield error(f"Error fetching layout configuration documentation: {str(e)}")
+        return
+    for event in document_events(index, DOC_TITLE, _footer(index.url), get_layout_configuration_fallback):
+        yield event
@@ -0,0 +1,131 @@
+"""
+Markup Lint Manager for FORMS Edge Delivery MCP server.
+
+Lints a directory or archive of generated form field HTML against the Field
+Structure rules of the current theme.md (see markup_linter) and reports the
+violations with the run's throughput.
+"""
+
+import json
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+from .markup_linter import LintRun, compile_rules, resolve_lint_path
+from .response_stream import StreamEvent, error as stream_error
+from .section_index import get_theme_index, get_theme_index_async
+from .shared_utils import create_success_response, create_error_response
+
+
+# Violations listed in a JSON response; the summary always counts all of them
+DEFAULT_MAX_VIOLATIONS = 100
+
+
+def _collect(violations: List[Dict[str, Any]], result: Dict[str, Any], limit: int) -> None:
+    """Keep the first violations of a run; the run itself counts the rest."""
+    for violation in result["violations"][:max(0, limit - len(violations))]:
+        violations.append({"source": result["source"], **violation})
+
+
+def _violation_limit(max_violations: Optional[int]) -> int:
+    """Return how many violations to list; None means the default."""
+    if max_violations is None:
+        return DEFAULT_MAX_VIOLATIONS
+    if max_violations < 0:
+        raise ValueError("max_violations must not be negative")
+    return max_violations
+
+
+def _lint_response(run: LintRun, path: str, violations: List[Dict[str, Any]]) -> str:
+    summary = run.summary()
+    return create_success_response(json.dumps({
+        "path": path,
+        "summary": summary,
+        "violations": violations,
+        "truncated": summary["violations"] > len(violations),
+    }, indent=2))
+
+
+def lint_form_markup(
+    path: str,
+    workers: Optional[int] = None,
+    max_violations: Optional[int] = DEFAULT_MAX_VIOLATIONS,
+) -> str:
+    """
+    Lint generated form field HTML against the documented Field Structure.
+    Checks wrapper classes, label/description placement and ARIA attributes.
+
+    Args:
+        path (str): Directory of .html fragments, a .zip/.tar[.gz] archive of them, or one
+            file, inside MCP_LINT_ROOT
+        workers (int): Worker processes (default and maximum MCP_LINT_WORKERS)
+        max_violations (int): Violations to list (0 for the summary only); all are counted
+
+    Returns:
+        JSON string with the summary (files, fragments, violations by rule,
+        fragments per second) and the first violations
+    """
+    try:
+        limit = _violation_limit(max_violations)
+        resolved = resolve_lint_path(path)
+        run = LintRun(compile_rules(get_theme_index()), workers)
+        violations: List[Dict[str, Any]] = []
+        for result in run.results(resolved):
+            _collect(violations, result, limit)
+        return _lint_response(run, path, violations)
+    except ValueError as e:
+        return create_error_response(str(e))
+    except Exception as e:
+        return create_error_response(f"Error linting form markup: {str(e)}")
+
+
+async def lint_form_markup_async(
+    path: str,
+    workers: Optional[int] = None,
+    max_violations: Optional[int] = DEFAULT_MAX_VIOLATIONS,
+) -> str:
+    """
+    Async variant of lint_form_markup() that never blocks the event loop.
+
+    Returns:
+        JSON string with the lint summary and the first violations
+    """
+    try:
+        limit = _violation_limit(max_violations)
+        resolved = resolve_lint_path(path)
+        run = LintRun(compile_rules(await get_theme_index_async()), workers)
+        violations: List[Dict[str, Any]] = []
+        async for result in run.results_async(resolved):
+            _collect(violations, result, limit)
+        return _lint_response(run, path, violations)
+    except ValueError as e:
+        return create_error_response(str(e))
+    except Exception as e:
+        return create_error_response(f"Error linting form markup: {str(e)}")
+
+
+async def stream_lint_form_markup_async(path: str, workers: Optional[int] = None) -> AsyncIterator[StreamEvent]:
+    """
+    Stream lint results file by file.
+
+    Args:
+        path (str): Directory, archive or HTML file to lint, inside MCP_LINT_ROOT
+        workers (int): Worker processes (default and maximum MCP_LINT_WORKERS)
+
+    Yields:
+        StreamEvent: ``meta`` with the path and rules version, one ``result``
+        per file that has violations, then ``summary``; or an ``error`` event
+    """
+    try:
+        resolved = resolve_lint_path(path)
+        run = LintRun(compile_rules(await get_theme_index_async()), workers)
+    except Exception as e:
+        yield stream_error(str(e))
+        return
+    yield "meta", {"path": path, "rules_version": run.rules.version, "workers": run.workers}
+    try:
+        async for result in run.results_async(resolved):
+            if result["violations"]:
+                yield "result", result
+    except Exception as e:
+        yield stream_error(f"Error linting form markup: {str(e)}")
+        return
+    yield "summary", run.summary()
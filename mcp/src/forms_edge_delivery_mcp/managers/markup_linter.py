@@ -0,0 +1,587 @@
+"""
+Bulk form markup linter for FORMS Edge Delivery MCP.
+
+Checks generated form field HTML against the structure documented under
+"Field Structure" in theme.md: the wrapper classes of every field, where its
+label and description sit, and the attributes that link them (``for``,
+``aria-describedby``, ``aria-live``). The rules are compiled once per theme.md
+version from the documented markup and shipped to a pool of worker processes,
+which lint the HTML files of a directory or archive in batches; results are
+streamed back file by file, in input order.
+"""
+
+import asyncio
+import multiprocessing
+import os
+import tarfile
+import time
+import zipfile
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from html.parser import HTMLParser
+from typing import Any, AsyncIterator, Callable, Deque, Dict, Iterator, List, Optional, Tuple
+
+from ..config import LINT_CONFIG
+from .section_index import SectionIndex
+from .selector_index import (
+    CONTROL_TAGS,
+    STATE_CLASSES,
+    TYPE_PLACEHOLDER,
+    code_blocks,
+    selector_index_for,
+    to_class_name,
+)
+
+HTML_SUFFIXES = (".html", ".htm")
+ARCHIVE_SUFFIXES = (".zip", ".tar", ".tar.gz", ".tgz", ".tar.bz2", ".tar.xz")
+
+GENERIC_CLASS = "field-wrapper"
+# "Every Form Field, except panels, follows below structure": panels only
+# need their wrapper classes and label; the fields inside are checked on their own
+CONTAINER_TYPES = {"panel"}
+REQUIRED_ATTRIBUTE = "data-required"
+FIELD_ID = "{FieldId}"
+
+# Used when theme.md no longer shows a {Type}-wrapper example
+DEFAULT_STRUCTURE: Dict[str, Optional[str]] = {"element": "div", "control": "input", "label": "label"}
+DEFAULT_LINKS = [
+    ("label", "for", FIELD_ID),
+    ("control", "id", FIELD_ID),
+    ("control", "aria-describedby", f"{FIELD_ID}-description"),
+    ("description", "id", f"{FIELD_ID}-description"),
+    ("description", "aria-live", "polite"),
+]
+
+_VOID_TAGS = {
+    "area", "base", "br", "col", "embed", "hr", "img", "input",
+    "link", "meta", "param", "source", "track", "wbr",
+}
+
+# (source name, file content)
+HtmlFile = Tuple[str, str]
+
+
+class Element:
+    """A parsed HTML element; only what the rules look at is kept."""
+
+    __slots__ = ("tag", "attrs", "classes", "children", "line")
+
+    def __init__(self, tag: str, attrs: Dict[str, str], line: int):
+        self.tag = tag
+        self.attrs = attrs
+        self.classes = attrs.get("class", "").split()
+        self.children: List["Element"] = []
+        self.line = line
+
+    def iter(self, stop_at_fields: bool = True) -> Iterator["Element"]:
+        """Yield descendants in document order, not entering nested fields."""
+        for child in self.children:
+            yield child
+            if not (stop_at_fields and GENERIC_CLASS in child.classes):
+                yield from child.iter(stop_at_fields)
+
+    def find(self, predicate: Callable[["Element"], bool]) -> Optional["Element"]:
+        """Return the first descendant of this field matching predicate."""
+        for element in self.iter():
+            if predicate(element):
+                return element
+        return None
+
+
+class _TreeBuilder(HTMLParser):
+    """Builds an Element tree from a fragment, tolerating unclosed tags."""
+
+    def __init__(self) -> None:
+        super().__init__(convert_charrefs=True)
+        self.roots: List[Element] = []
+        self._stack: List[Element] = []
+
+    def handle_starttag(self, tag: str, attrs: List[Tuple[str, Optional[str]]]) -> None:
+        element = Element(tag, {name: value or "" for name, value in attrs}, self.getpos()[0])
+        (self._stack[-1].children if self._stack else self.roots).append(element)
+        if tag not in _VOID_TAGS:
+            self._stack.append(element)
+
+    def handle_startendtag(self, tag: str, attrs: List[Tuple[str, Optional[str]]]) -> None:
+        self.handle_starttag(tag, attrs)
+        if tag not in _VOID_TAGS:
+            self._stack.pop()
+
+    def handle_endtag(self, tag: str) -> None:
+        for position in range(len(self._stack) - 1, -1, -1):
+            if self._stack[position].tag == tag:
+                del self._stack[position:]
+                return
+
+
+def parse_fragments(html: str) -> List[Element]:
+    """Parse HTML into its top-level elements; each one is a fragment."""
+    builder = _TreeBuilder()
+    builder.feed(html)
+    builder.close()
+    return builder.roots
+
+
+class MarkupRules:
+    """
+    Structural rules of the Field Structure spec for one theme.md version.
+
+    Plain data only, so it pickles cheaply into the worker processes.
+    """
+
+    def __init__(
+        self,
+        version: str,
+        url: str,
+        types: Dict[str, Dict[str, Optional[str]]],
+        options: Dict[str, str],
+        template: Dict[str, Optional[str]],
+        links: List[Tuple[str, str, str]],
+    ):
+        self.version = version
+        self.url = url
+        self.types = types
+        self.options = options
+        self.template = template
+        self.links = links
+
+
+def _template_links(index: SectionIndex) -> Tuple[Optional[Dict[str, Optional[str]]], List[Tuple[str, str, str]]]:
+    """Read the label/control/description attributes of the generic field example."""
+    for language, _, body in code_blocks(index.content):
+        if language != "html" or f"{TYPE_PLACEHOLDER}-wrapper" not in body:
+            continue
+        roots = parse_fragments(body)
+        if not roots:
+            continue
+        wrapper = roots[0]
+        roles = {
+            "label": wrapper.find(lambda e: "field-label" in e.classes),
+            "control": wrapper.find(lambda e: e.tag in CONTROL_TAGS),
+            "description": wrapper.find(lambda e: "field-description" in e.classes),
+        }
+        links = []
+        for role, element in roles.items():
+            for name, value in (element.attrs.items() if element is not None else ()):
+                # Placeholders other than {FieldId} (type, placeholder text) are free
+                if FIELD_ID in value or (name != "class" and value and "{" not in value):
+                    links.append((role, name, value))
+        structure = {
+            "element": wrapper.tag,
+            "control": roles["control"].tag if roles["control"] is not None else None,
+            "label": roles["label"].tag if roles["label"] is not None else None,
+        }
+        return structure, links
+    return None, []
+
+
+def compile_rules(index: SectionIndex) -> MarkupRules:
+    """Return the markup rules of a theme.md version, compiling them once."""
+
+    # Outside build(): derived() does not nest
+    selectors = selector_index_for(index)
+
+    def build() -> MarkupRules:
+        template, links = _template_links(index)
+        types: Dict[str, Dict[str, Optional[str]]] = {}
+        options: Dict[str, str] = {}
+        for name, entry in selectors.types.items():
+            if entry.parent:
+                options[name] = entry.parent
+            elif entry.label:
+                # Types only seen in CSS examples follow the template
+                types[name] = {"element": entry.element, "control": entry.control, "label": entry.label}
+        return MarkupRules(index.version, index.url, types, options, template or DEFAULT_STRUCTURE, links or DEFAULT_LINKS)
+
+    return index.derived("markup-rules", build)
+
+
+def _violation(field: Element, element: Element, rule: str, message: str) -> Dict[str, Any]:
+    wrapper = ".".join(c for c in field.classes if c.endswith("-wrapper") or c.startswith("field-"))
+    return {"line": element.line, "rule": rule, "field": f".{wrapper}" if wrapper else field.tag, "message": message}
+
+
+def _follows(root: Element, first: Element, second: Element) -> bool:
+    """Return True if second comes after first in document order."""
+    seen = False
+    for element in root.iter():
+        if element is first:
+            seen = True
+        elif element is second:
+            return seen
+    return False
+
+
+def lint_field(rules: MarkupRules, field: Element) -> List[Dict[str, Any]]:
+    """
+    Check one field wrapper element against the rules.
+
+    Args:
+        rules (MarkupRules): Compiled rules
+        field (Element): Element with the field-wrapper class
+
+    Returns:
+        List[Dict[str, Any]]: Violations with line, rule, field and message
+    """
+    found = []
+    type_classes = [c for c in field.classes if c.endswith("-wrapper") and c != GENERIC_CLASS]
+    if len(type_classes) != 1:
+        found.append(_violation(field, field, "wrapper-type-class",
+                                f"expected one {{Type}}-wrapper class, found {len(type_classes)}"))
+    field_type = type_classes[0][:-len("-wrapper")] if type_classes else None
+    structure = (rules.types.get(field_type) if field_type else None) or rules.template
+    if field_type in rules.types and field.tag != structure["element"]:
+        found.append(_violation(field, field, "wrapper-element",
+                                f"{field_type} fields are <{structure['element']}>, not <{field.tag}>"))
+    name_classes = [c for c in field.classes
+                    if c.startswith("field-") and c != GENERIC_CLASS and c not in STATE_CLASSES]
+    if not name_classes:
+        found.append(_violation(field, field, "wrapper-name-class", "missing field-{Name} class"))
+
+    label = field.find(lambda e: "field-label" in e.classes)
+    if label is None:
+        found.append(_violation(field, field, "label-missing", "missing .field-label"))
+    else:
+        if structure["label"] and label.tag != structure["label"]:
+            found.append(_violation(field, label, "label-element",
+                                    f".field-label should be <{structure['label']}>, not <{label.tag}>"))
+        if field.children and field.children[0] is not label:
+            found.append(_violation(field, label, "label-placement", ".field-label must be the first child"))
+
+    if field_type in CONTAINER_TYPES:
+        return found
+
+    description = field.find(lambda e: "field-description" in e.classes)
+    if "field-invalid" in field.classes and description is None:
+        found.append(_violation(field, field, "error-description",
+                                "invalid fields show their message in .field-description"))
+
+    control_tag = structure["control"]
+    control = field.find(lambda e: e.tag == control_tag) if control_tag else None
+    if control_tag and control is None:
+        found.append(_violation(field, field, "control-missing", f"missing <{control_tag}>"))
+    if control is not None:
+        if description is not None and not _follows(field, control, description):
+            found.append(_violation(field, description, "description-placement",
+                                    ".field-description must follow the control"))
+        name = control.attrs.get("name")
+        if name and f"field-{to_class_name(name)}" not in name_classes:
+            found.append(_violation(field, field, "wrapper-name-class",
+                                    f"name \"{name}\" needs the class field-{to_class_name(name)}"))
+        if "required" in control.attrs and field.attrs.get(REQUIRED_ATTRIBUTE, "false") in ("", "false"):
+            found.append(_violation(field, field, REQUIRED_ATTRIBUTE,
+                                    f"required control but wrapper lacks {REQUIRED_ATTRIBUTE}=\"true\""))
+        # Groups label their options instead (checked below)
+        if structure["label"] == rules.template["label"]:
+            found.extend(_lint_links(rules, field, {"label": label, "control": control, "description": description}))
+
+    for option in field.iter():
+        parents = [rules.options.get(c[:-len("-wrapper")]) for c in option.classes if c.endswith("-wrapper")]
+        if field_type and field_type in parents:
+            found.extend(_lint_option(field, option))
+    return found
+
+
+def _lint_links(rules: MarkupRules, field: Element, roles: Dict[str, Optional[Element]]) -> List[Dict[str, Any]]:
+    found = []
+    control = roles["control"]
+    field_id = control.attrs.get("id") if control is not None else None
+    for role, attribute, pattern in rules.links:
+        element = roles[role]
+        if element is None:
+            continue
+        if role == "control" and attribute != "id" and roles["description"] is None:
+            # Nothing to describe the control with
+            continue
+        value = element.attrs.get(attribute)
+        rule = f"{role}-{attribute}"
+        if value is None:
+            found.append(_violation(field, element, rule, f"{role} is missing {attribute}"))
+            continue
+        if FIELD_ID not in pattern:
+            if value != pattern:
+                found.append(_violation(field, element, rule, f"{attribute} should be \"{pattern}\""))
+        elif field_id and not (role == "control" and attribute == "id"):
+            expected = pattern.replace(FIELD_ID, field_id)
+            actual = value.split() if attribute.startswith("aria-") else [value]
+            if expected not in actual:
+                found.append(_violation(field, element, rule, f"{attribute} should reference \"{expected}\""))
+    return found
+
+
+def _lint_option(field: Element, option: Element) -> List[Dict[str, Any]]:
+    control = next((e for e in option.iter() if e.tag == "input"), None)
+    if control is None:
+        return [_violation(field, option, "option-control", "option without <input>")]
+    control_id = control.attrs.get("id")
+    label = next((e for e in option.iter() if e.tag == "label"), None)
+    if not control_id or label is None or label.attrs.get("for") != control_id:
+        return [_violation(field, label or option, "option-label-for",
+                           "option <label for> must match its input id")]
+    return []
+
+
+def lint_html(rules: MarkupRules, html: str) -> Tuple[int, List[Dict[str, Any]]]:
+    """
+    Lint every fragment of an HTML file.
+
+    Each top-level element is a fragment and must be a field (or a panel of
+    fields); fields nested in panels are checked too.
+
+    Args:
+        rules (MarkupRules): Compiled rules
+        html (str): File content
+
+    Returns:
+        Tuple[int, List[Dict[str, Any]]]: Number of fragments and their violations,
+        each tagged with its fragment number
+    """
+    roots = parse_fragments(html)
+    violations = []
+    for number, root in enumerate(roots, 1):
+        fields = [root] if GENERIC_CLASS in root.classes else []
+        if not fields:
+            violations.append({"fragment": number, "line": root.line, "rule": "wrapper-root",
+                               "field": root.tag, "message": "fragment root must have the field-wrapper class"})
+        fields.extend(e for e in root.iter(stop_at_fields=False) if GENERIC_CLASS in e.classes)
+        for field in fields:
+            for violation in lint_field(rules, field):
+                violation["fragment"] = number
+                violations.append(violation)
+    return len(roots), violations
+
+
+def _lint_file(rules: MarkupRules, source: str, html: str) -> Dict[str, Any]:
+    fragments, violations = lint_html(rules, html)
+    return {"source": source, "fragments": fragments, "violations": violations}
+
+
+# Set once per worker process by the pool initializer
+_worker_rules: Optional[MarkupRules] = None
+
+# Start method of the worker processes (see LintRun)
+_SPAWN = multiprocessing.get_context("spawn")
+
+
+def _init_worker(rules: MarkupRules) -> None:
+    global _worker_rules
+    _worker_rules = rules
+
+
+def _lint_batch(batch: List[HtmlFile]) -> List[Dict[str, Any]]:
+    rules = _worker_rules
+    if rules is None:
+        raise RuntimeError("Lint worker started without rules")
+    return [_lint_file(rules, source, html) for source, html in batch]
+
+
+def _next_batch(batches: Iterator[List[HtmlFile]]) -> Optional[List[HtmlFile]]:
+    return next(batches, None)
+
+
+def iter_html_files(path: str) -> Iterator[HtmlFile]:
+    """
+    Yield the HTML files of a directory (recursively), an archive or a single file.
+
+    Args:
+        path (str): Directory, .zip / .tar[.gz|.bz2|.xz] archive, or .html file
+
+    Yields:
+        HtmlFile: (name relative to path, content), in name order (tar archives
+        in archive order)
+
+    Raises:
+        ValueError: If path is neither a directory, an archive nor an HTML file
+    """
+    lower = path.lower()
+    if os.path.isdir(path):
+        names: List[str] = []
+        for directory, _, files in os.walk(path):
+            names.extend(os.path.join(directory, f) for f in files if f.lower().endswith(HTML_SUFFIXES))
+        for name in sorted(names):
+            with open(name, encoding="utf-8", errors="replace") as handle:
+                yield os.path.relpath(name, path), handle.read()
+    elif lower.endswith(".zip"):
+        with zipfile.ZipFile(path) as archive:
+            for name in sorted(archive.namelist()):
+                if name.lower().endswith(HTML_SUFFIXES):
+                    yield name, archive.read(name).decode("utf-8", errors="replace")
+    elif lower.endswith(ARCHIVE_SUFFIXES):
+        # Archive order: going back for a sorted order would decompress the stream again
+        with tarfile.open(path) as archive:
+            for member in archive:
+                if not member.name.lower().endswith(HTML_SUFFIXES):
+                    continue
+                data = archive.extractfile(member) if member.isfile() else None
+                if data is not None:
+                    yield member.name, data.read().decode("utf-8", errors="replace")
+    elif lower.endswith(HTML_SUFFIXES) and os.path.isfile(path):
+        with open(path, encoding="utf-8", errors="replace") as handle:
+            yield os.path.basename(path), handle.read()
+    else:
+        raise ValueError(f"Not a directory, archive or HTML file: {path}")
+
+
+def resolve_lint_path(path: str) -> str:
+    """
+    Resolve a tool or HTTP caller's path, keeping it inside LINT_CONFIG["root"].
+
+    The CLI lints the paths it is given directly; remote callers may only read
+    under the configured root, so without one they cannot lint at all.
+
+    Raises:
+        ValueError: If no root is configured, or the path is empty, missing or
+            outside the lint root
+    """
+    root = LINT_CONFIG["root"]
+    if not root:
+        raise ValueError("Linting server paths is disabled; set MCP_LINT_ROOT to the directory callers may read")
+    if not path or not path.strip():
+        raise ValueError("path is required")
+    real_root = os.path.realpath(root)
+    resolved = os.path.realpath(os.path.join(real_root, path))
+    if os.path.commonpath([resolved, real_root]) != real_root:
+        raise ValueError(f"Path is outside the lint root: {path}")
+    if not os.path.exists(resolved):
+        raise ValueError(f"Path not found: {path}")
+    return resolved
+
+
+class LintRun:
+    """
+    One linting pass over a directory or archive, with running totals.
+
+    Files are read in the calling process and sent to the pool in batches;
+    a bounded number of batches is in flight, so memory stays flat however
+    large the input is. With one worker (or a single batch) no pool is
+    started and the files are linted inline. Requested workers are capped at
+    LINT_CONFIG["workers"].
+
+    Workers are spawned rather than forked: the HTTP server calls this from a
+    multithreaded process, and a forked child can inherit locks held by other
+    threads.
+    """
+
+    def __init__(self, rules: MarkupRules, workers: Optional[int] = None, batch_size: Optional[int] = None):
+        self.rules = rules
+        self.workers = max(1, min(workers or LINT_CONFIG["workers"], LINT_CONFIG["workers"]))
+        self.batch_size = max(1, batch_size or LINT_CONFIG["batch_size"])
+        self.files = 0
+        self.fragments = 0
+        self.violations = 0
+        self.by_rule: Dict[str, int] = {}
+        self.started = time.perf_counter()
+        self.finished: Optional[float] = None
+
+    def _batches(self, path: str) -> Iterator[List[HtmlFile]]:
+        batch = []
+        for item in iter_html_files(path):
+            batch.append(item)
+            if len(batch) == self.batch_size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+
+    def _count(self, result: Dict[str, Any]) -> Dict[str, Any]:
+        self.files += 1
+        self.fragments += result["fragments"]
+        self.violations += len(result["violations"])
+        for violation in result["violations"]:
+            self.by_rule[violation["rule"]] = self.by_rule.get(violation["rule"], 0) + 1
+        return result
+
+    def _inline(self, batch: List[HtmlFile]) -> List[Dict[str, Any]]:
+        return [_lint_file(self.rules, source, html) for source, html in batch]
+
+    def _pool(self) -> ProcessPoolExecutor:
+        return ProcessPoolExecutor(
+            self.workers, mp_context=_SPAWN, initializer=_init_worker, initargs=(self.rules,)
+        )
+
+    def results(self, path: str) -> Iterator[Dict[str, Any]]:
+        """
+        Lint every HTML file under path, yielding one result per file in input order.
+
+        Yields:
+            Dict[str, Any]: ``source``, ``fragments`` and ``violations`` of a file
+        """
+        batches = self._batches(path)
+        first = next(batches, None)
+        second = next(batches, None) if first is not None else None
+        if first is None or second is None or self.workers == 1:
+            for batch in filter(None, (first, second)):
+                yield from map(self._count, self._inline(batch))
+            for batch in batches:
+                yield from map(self._count, self._inline(batch))
+            self.finished = time.perf_counter()
+            return
+
+        with self._pool() as pool:
+            pending: Deque[Future] = deque(pool.submit(_lint_batch, b) for b in (first, second))
+            for batch in batches:
+                if len(pending) >= 2 * self.workers:
+                    yield from map(self._count, pending.popleft().result())
+                pending.append(pool.submit(_lint_batch, batch))
+            while pending:
+                yield from map(self._count, pending.popleft().result())
+        self.finished = time.perf_counter()
+
+    async def results_async(self, path: str) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Async variant of results() that never blocks the event loop.
+
+        Yields:
+            Dict[str, Any]: ``source``, ``fragments`` and ``violations`` of a file
+        """
+        loop = asyncio.get_running_loop()
+        batches = self._batches(path)
+        # Reading files is blocking I/O too
+        first = await loop.run_in_executor(None, _next_batch, batches)
+        second = await loop.run_in_executor(None, _next_batch, batches) if first is not None else None
+        if first is None or second is None or self.workers == 1:
+            for ready in filter(None, (first, second)):
+                for result in await loop.run_in_executor(None, self._inline, ready):
+                    yield self._count(result)
+            while True:
+                batch = await loop.run_in_executor(None, _next_batch, batches)
+                if batch is None:
+                    break
+                for result in await loop.run_in_executor(None, self._inline, batch):
+                    yield self._count(result)
+            self.finished = time.perf_counter()
+            return
+        pool = self._pool()
+        pending: Deque[Future] = deque(pool.submit(_lint_batch, b) for b in (first, second))
+        try:
+            while True:
+                batch = await loop.run_in_executor(None, _next_batch, batches)
+                if batch is None:
+                    break
+                if len(pending) >= 2 * self.workers:
+                    for result in await asyncio.wrap_future(pending.popleft()):
+                        yield self._count(result)
+                pending.append(pool.submit(_lint_batch, batch))
+            while pending:
+                for result in await asyncio.wrap_future(pending.popleft()):
+                    yield self._count(result)
+        finally:
+            # Joining the workers would block the event loop; they exit on their own
+            for future in pending:
+                future.cancel()
+            pool.shutdown(wait=False)
+        self.finished = time.perf_counter()
+
+    def summary(self) -> Dict[str, Any]:
+        """Return the totals so far, with throughput in fragments per second."""
+        elapsed = (self.finished or time.perf_counter()) - self.started
+        return {
+            "files": self.files,
+            "fragments": self.fragments,
+            "violations": self.violations,
+            "by_rule": dict(sorted(self.by_rule.items(), key=lambda item: -item[1])),
+            "workers": self.workers,
+            "elapsed_seconds": round(elapsed, 3),
+            "fragments_per_second": round(self.fragments / elapsed, 1) if elapsed > 0 else None,
+            "rules_version": self.rules.version,
+        }
@@ -0,0 +1,344 @@
+"""
+Metrics registry for the FORMS Edge Delivery MCP server.
+
+A small thread-safe registry of counters, gauges and histograms, rendered as
+Prometheus text for the HTTP ``/metrics`` endpoint and as a JSON snapshot for
+the ``get_server_metrics`` tool. Components that already keep their own
+statistics (e.g. the document cache) register collectors that are read at
+render time instead of duplicating the bookkeeping.
+"""
+
+import functools
+import inspect
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, List, Sequence, Tuple, Type, TypeVar
+
+# Latency buckets in seconds
+DEFAULT_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# A collected metric family: (name, type, help, [(labels, value), ...])
+CollectedFamily = Tuple[str, str, str, List[Tuple[Dict[str, str], float]]]
+
+
+class _Metric:
+    type = "untyped"
+
+    def __init__(self, name: str, help_text: str, labelnames: Sequence[str]):
+        self.name = name
+        self.help = help_text
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+        self._values: Dict[Tuple[str, ...], Any] = {}
+
+    def _key(self, labels: Dict[str, Any]) -> Tuple[str, ...]:
+        if set(labels) != set(self.labelnames):
+            raise ValueError(f"{self.name} expects labels {self.labelnames}, got {tuple(labels)}")
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def _labels(self, key: Tuple[str, ...]) -> Dict[str, str]:
+        return dict(zip(self.labelnames, key))
+
+    def samples(self) -> List[Tuple[Dict[str, str], Any]]:
+        raise NotImplementedError
+
+
+class Counter(_Metric):
+    """Monotonically increasing value."""
+
+    type = "counter"
+
+    def inc(self, amount: float = 1, **labels: Any) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def samples(self) -> List[Tuple[Dict[str, str], float]]:
+        with self._lock:
+            return [(self._labels(key), value) for key, value in self._values.items()]
+
+
+class Gauge(_Metric):
+    """Value that can go up and down."""
+
+    type = "gauge"
+
+    def set(self, value: float, **labels: Any) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = value
+
+    def inc(self, amount: float = 1, **labels: Any) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def dec(self, amount: float = 1, **labels: Any) -> None:
+        self.inc(-amount, **labels)
+
+    def samples(self) -> List[Tuple[Dict[str, str], float]]:
+        with self._lock:
+            return [(self._labels(key), value) for key, value in self._values.items()]
+
+
+class Histogram(_Metric):
+    """Distribution of observed values over fixed buckets."""
+
+    type = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        help_text: str,
+        labelnames: Sequence[str],
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ):
+        super().__init__(name, help_text, labelnames)
+        self.buckets = tuple(sorted(buckets))
+
+    def observe(self, value: float, **labels: Any) -> None:
+        key = self._key(labels)
+        with self._lock:
+            state = self._values.get(key)
+            if state is None:
+                state = self._values[key] = {"counts": [0] * len(self.buckets), "sum": 0.0, "count": 0}
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    state["counts"][i] += 1
+                    break
+            state["sum"] += value
+            state["count"] += 1
+
+    def time(self, **labels: Any) -> "_Timer":
+        """Context manager observing the elapsed time of its block."""
+        return _Timer(self, labels)
+
+    def samples(self) -> List[Tuple[Dict[str, str], Dict[str, Any]]]:
+        with self._lock:
+            result = []
+            for key, state in self._values.items():
+                cumulative, buckets = 0, {}
+                for bound, count in zip(self.buckets, state["counts"]):
+                    cumulative += count
+                    buckets[_format_value(bound)] = cumulative
+                buckets["+Inf"] = state["count"]
+                result.append((self._labels(key), {
+                    "count": state["count"],
+                    "sum": state["sum"],
+                    "buckets": buckets,
+                }))
+            return result
+
+
+class _Timer:
+    def __init__(self, histogram: Histogram, labels: Dict[str, Any]):
+        self.histogram = histogram
+        self.labels = labels
+
+    def __enter__(self) -> "_Timer":
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.histogram.observe(time.perf_counter() - self.start, **self.labels)
+
+
+def _format_value(value: float) -> str:
+    return repr(float(value))
+
+
+def _escape_help(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n")
+
+
+def _escape(value: str) -> str:
+    return _escape_help(value).replace('"', '\\"')
+
+
+def _label_text(labels: Dict[str, str]) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(str(value))}"' for name, value in labels.items()) + "}"
+
+
+_M = TypeVar("_M", bound=_Metric)
+
+
+class MetricsRegistry:
+    """Named metrics plus collectors, rendered together."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._metrics: Dict[str, _Metric] = {}
+        self._collectors: List[Callable[[], Iterable[CollectedFamily]]] = []
+
+    def _get_or_create(
+        self, cls: Type[_M], name: str, help_text: str, labelnames: Sequence[str], **kwargs: Any
+    ) -> _M:
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                created = cls(name, help_text, labelnames, **kwargs)
+                self._metrics[name] = created
+                return created
+            if not isinstance(metric, cls):
+                raise ValueError(f"Metric {name} is already registered as a {metric.type}")
+            return metric
+
+    def counter(self, name: str, help_text: str, labelnames: Sequence[str] = ()) -> Counter:
+        """Return the counter with this name, creating it on first use."""
+        return self._get_or_create(Counter, name, help_text, labelnames)
+
+    def gauge(self, name: str, help_text: str, labelnames: Sequence[str] = ()) -> Gauge:
+        """Return the gauge with this name, creating it on first use."""
+        return self._get_or_create(Gauge, name, help_text, labelnames)
+
+    def histogram(
+        self,
+        name: str,
+        help_text: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        """Return the histogram with this name, creating it on first use."""
+        return self._get_or_create(Histogram, name, help_text, labelnames, buckets=buckets)
+
+    def register_collector(self, collector: Callable[[], Iterable[CollectedFamily]]) -> None:
+        """Register a callback returning metric families read at render time."""
+        with self._lock:
+            self._collectors.append(collector)
+
+    def _collected(self) -> List[CollectedFamily]:
+        with self._lock:
+            collectors = list(self._collectors)
+        families: List[CollectedFamily] = []
+        for collector in collectors:
+            try:
+                families.extend(collector())
+            except Exception:
+                # A broken collector must not take the metrics endpoint down
+                continue
+        return families
+
+    def render_prometheus(self) -> str:
+        """
+        Render every metric in the Prometheus text exposition format.
+
+        Returns:
+            str: Prometheus text (version 0.0.4)
+        """
+        with self._lock:
+            metrics = list(self._metrics.values())
+        lines = []
+        for metric in metrics:
+            lines.append(f"# HELP {metric.name} {_escape_help(metric.help)}")
+            lines.append(f"# TYPE {metric.name} {metric.type}")
+            if isinstance(metric, Histogram):
+                for labels, state in metric.samples():
+                    for bound, count in state["buckets"].items():
+                        lines.append(f"{metric.name}_bucket{_label_text({**labels, 'le': bound})} {count}")
+                    lines.append(f"{metric.name}_sum{_label_text(labels)} {state['sum']}")
+                    lines.append(f"{metric.name}_count{_label_text(labels)} {state['count']}")
+            else:
+                for labels, value in metric.samples():
+                    lines.append(f"{metric.name}{_label_text(labels)} {value}")
+        for name, kind, help_text, samples in self._collected():
+            lines.append(f"# HELP {name} {_escape_help(help_text)}")
+            lines.append(f"# TYPE {name} {kind}")
+            for labels, value in samples:
+                lines.append(f"{name}{_label_text(labels)} {value}")
+        return "\n".join(lines) + "\n"
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Return every metric as plain data for JSON responses.
+
+        Histograms report count, sum, average and cumulative bucket counts.
+
+        Returns:
+            Dict[str, Any]: Metric name -> type, help and samples
+        """
+        with self._lock:
+            metrics = list(self._metrics.values())
+        result: Dict[str, Any] = {}
+        for metric in metrics:
+            samples = []
+            for labels, value in metric.samples():
+                if isinstance(metric, Histogram):
+                    value = {
+                        "count": value["count"],
+                        "sum_seconds": round(value["sum"], 6),
+                        "avg_seconds": round(value["sum"] / value["count"], 6) if value["count"] else 0.0,
+                        "buckets": value["buckets"],
+                    }
+                samples.append({"labels": labels, "value": value})
+            result[metric.name] = {"type": metric.type, "help": metric.help, "samples": samples}
+        for name, kind, help_text, collected in self._collected():
+            result[name] = {
+                "type": kind,
+                "help": help_text,
+                "samples": [{"labels": labels, "value": value} for labels, value in collected],
+            }
+        return result
+
+
+# Process-wide registry
+metrics = MetricsRegistry()
+
+TOOL_DURATION = metrics.histogram(
+    "mcp_tool_duration_seconds", "MCP tool call latency", ["tool"]
+)
+TOOL_CALLS = metrics.counter(
+    "mcp_tool_calls_total", "MCP tool calls by outcome", ["tool", "status"]
+)
+TOOLS_IN_FLIGHT = metrics.gauge(
+    "mcp_tools_in_flight", "MCP tool calls currently running", ["tool"]
+)
+
+
+def _tool_status(result: Any) -> str:
+    # Managers report failures as {"status": "failure", ...} instead of raising
+    if isinstance(result, str) and result.startswith('{"status": "failure"'):
+        return "failure"
+    return "success"
+
+
+def track_tool(func: Callable) -> Callable:
+    """
+    Record latency, outcome and concurrency of an MCP tool function.
+
+    Apply below ``@mcp.tool``; the wrapper keeps the tool's name, docstring
+    and signature so the advertised schema does not change.
+    """
+    name = func.__name__
+
+    if inspect.iscoroutinefunction(func):
+        @functools.wraps(func)
+        async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+            TOOLS_IN_FLIGHT.inc(tool=name)
+            start = time.perf_counter()
+            status = "error"
+            try:
+                result = await func(*args, **kwargs)
+                status = _tool_status(result)
+                return result
+            finally:
+                TOOL_DURATION.observe(time.perf_counter() - start, tool=name)
+                TOOL_CALLS.inc(tool=name, status=status)
+                TOOLS_IN_FLIGHT.dec(tool=name)
+        return async_wrapper
+
+    @functools.wraps(func)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        TOOLS_IN_FLIGHT.inc(tool=name)
+        start = time.perf_counter()
+        status = "error"
+        try:
+            result = func(*args, **kwargs)
+            status = _tool_status(result)
+            return result
+        finally:
+            TOOL_DURATION.observe(time.perf_counter() - start, tool=name)
+            TOOL_CALLS.inc(tool=name, status=status)
+            TOOLS_IN_FLIGHT.dec(tool=name)
+    return wrapper
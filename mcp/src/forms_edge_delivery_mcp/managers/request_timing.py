@@ -0,0 +1,135 @@
+"""
+Per-request phase timing for FORMS Edge Delivery MCP managers.
+
+The HTTP transport starts a ``RequestTiming`` for every request; the document
+cache, section index and response cache then record how long each phase of
+producing the response took (upstream fetch, section extraction, content
+cleaning, serialization) and whether the documents came from cache. Outside
+of a timed request every helper here is a no-op.
+"""
+
+import contextvars
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional
+
+# Reported phases, in Server-Timing order
+PHASES = ("fetch", "extract", "clean", "serialize")
+
+# Document cache outcomes, least to most expensive
+CACHE_STATUSES = ("hit", "stale", "miss")
+
+
+class RequestTiming:
+    """
+    Accumulated phase durations and document cache status of one request.
+
+    Phases nest: time spent in an inner phase (e.g. ``clean`` inside
+    ``extract``) is only counted for the inner one, so the phase durations
+    add up to at most the request's total time.
+    """
+
+    def __init__(self) -> None:
+        self.start = time.perf_counter()
+        self.durations: Dict[str, float] = {}
+        self.cache_status: Optional[str] = None
+        self._lock = threading.Lock()
+        self._stack: Dict[int, List[List]] = {}
+
+    def _enter(self, phase: str) -> List:
+        frame = [phase, time.perf_counter(), 0.0]
+        with self._lock:
+            self._stack.setdefault(threading.get_ident(), []).append(frame)
+        return frame
+
+    def _exit(self, frame: List) -> None:
+        phase, started, nested = frame
+        elapsed = time.perf_counter() - started
+        with self._lock:
+            stack = self._stack.get(threading.get_ident(), [])
+            if stack and stack[-1] is frame:
+                stack.pop()
+            if stack:
+                stack[-1][2] += elapsed
+            else:
+                self._stack.pop(threading.get_ident(), None)
+            self.durations[phase] = self.durations.get(phase, 0.0) + elapsed - nested
+
+    def record_cache(self, status: str) -> None:
+        """Record a document cache outcome; the most expensive one wins."""
+        with self._lock:
+            if self.cache_status is None or CACHE_STATUSES.index(status) > CACHE_STATUSES.index(self.cache_status):
+                self.cache_status = status
+
+    def total(self) -> float:
+        """Return the seconds elapsed since the request started."""
+        return time.perf_counter() - self.start
+
+    def breakdown(self) -> Dict[str, object]:
+        """
+        Return the timing as plain data for JSON responses.
+
+        Returns:
+            Dict[str, object]: Milliseconds per phase, total and cache status
+        """
+        with self._lock:
+            durations = dict(self.durations)
+        return {
+            "phases_ms": {phase: round(durations.get(phase, 0.0) * 1000, 3) for phase in PHASES},
+            "total_ms": round(self.total() * 1000, 3),
+            "cache": self.cache_status,
+        }
+
+    def server_timing(self) -> str:
+        """
+        Return the timing as a Server-Timing header value.
+
+        Returns:
+            str: e.g. ``fetch;dur=0.012, ..., cache;desc="hit", total;dur=1.9``
+        """
+        with self._lock:
+            durations = dict(self.durations)
+        entries = [f"{phase};dur={durations.get(phase, 0.0) * 1000:.3f}" for phase in PHASES]
+        if self.cache_status:
+            entries.append(f'cache;desc="{self.cache_status}"')
+        entries.append(f"total;dur={self.total() * 1000:.3f}")
+        return ", ".join(entries)
+
+
+_current: contextvars.ContextVar[Optional[RequestTiming]] = contextvars.ContextVar(
+    "request_timing", default=None
+)
+
+
+def start_request_timing() -> RequestTiming:
+    """Start timing the current request and return its timing."""
+    timing = RequestTiming()
+    _current.set(timing)
+    return timing
+
+
+def current_timing() -> Optional[RequestTiming]:
+    """Return the timing of the current request, if one is being timed."""
+    return _current.get()
+
+
+@contextmanager
+def timed_phase(phase: str) -> Iterator[None]:
+    """Add the duration of the block to a phase of the current request."""
+    timing = _current.get()
+    if timing is None:
+        yield
+        return
+    frame = timing._enter(phase)
+    try:
+        yield
+    finally:
+        timing._exit(frame)
+
+
+def record_cache_status(status: str) -> None:
+    """Record a document cache outcome (hit, stale or miss) for the current request."""
+    timing = _current.get()
+    if timing is not None:
+        timing.record_cache(status)
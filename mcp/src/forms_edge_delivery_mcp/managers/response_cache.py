@@ -0,0 +1,158 @@
+"""
+Prepared tool responses for FORMS Edge Delivery MCP managers.
+
+A manager's JSON response only changes when its source document changes, so it
+is serialized and encoded once per document version and reused verbatim by the
+MCP tools and the HTTP routes. Under the HTTP transport, the compressed bodies
+are built right after the response, on a background thread, and kept with it.
+"""
+
+import gzip
+import hashlib
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional
+
+from .metrics import metrics
+from .request_timing import timed_phase
+
+try:
+    import brotli
+except ImportError:  # optional: pip install forms-edge-delivery-mcp[brotli]
+    brotli = None
+
+# Bodies smaller than this are sent uncompressed
+COMPRESSION_MIN_BYTES = 1024
+
+RESPONSE_CACHE_LOOKUPS = metrics.counter(
+    "mcp_response_cache_lookups_total", "Prepared response lookups by result", ["result"]
+)
+RESPONSE_CACHE_EVICTIONS = metrics.counter(
+    "mcp_response_cache_evictions_total", "Prepared responses replaced by a new doc version"
+)
+
+
+class PreparedResponse(str):
+    """
+    JSON text of a tool response with its UTF-8 body encoded once.
+
+    Being a str, it is returned as-is by MCP tools and existing callers; HTTP
+    routes send ``body`` directly instead of re-parsing and re-serializing.
+    ``etag`` is a strong validator derived from the content hash of the body;
+    ``content_hash`` is the hash of its ``data`` field, set by
+    content_delta.versioned_response.
+    Compressed variants are produced once by precompress() and kept with the
+    response; HTTP routes only offer the variants that are already built, so
+    no request waits for compression.
+    """
+
+    version: Optional[str]
+    source_url: Optional[str]
+    body: bytes
+    etag: str
+    content_hash: Optional[str]
+    _encoded: Dict[str, bytes]
+
+    def __new__(
+        cls,
+        text: str,
+        version: Optional[str] = None,
+        source_url: Optional[str] = None,
+    ) -> "PreparedResponse":
+        response = super().__new__(cls, text)
+        response.version = version
+        response.source_url = source_url
+        response.body = text.encode("utf-8")
+        response.etag = f'"{hashlib.sha256(response.body).hexdigest()[:24]}"'
+        response.content_hash = None
+        response._encoded = {}
+        return response
+
+    def codings(self) -> List[str]:
+        """Return the content codings worth compressing this response with, preferred first."""
+        if len(self.body) < COMPRESSION_MIN_BYTES:
+            return []
+        return ["br", "gzip"] if brotli is not None else ["gzip"]
+
+    def encodings(self) -> List[str]:
+        """Return the content codings this response can be sent with now, preferred first."""
+        return [coding for coding in self.codings() if coding in self._encoded]
+
+    def precompress(self) -> None:
+        """Build every compressed variant of the response."""
+        for coding in self.codings():
+            self.encoded(coding)
+
+    def encoded(self, encoding: str) -> bytes:
+        """
+        Return the body compressed with a content coding.
+
+        Args:
+            encoding (str): "gzip" or "br"
+
+        Returns:
+            bytes: The compressed body
+        """
+        data = self._encoded.get(encoding)
+        if data is None:
+            with timed_phase("serialize"):
+                if encoding == "gzip":
+                    data = gzip.compress(self.body, compresslevel=9, mtime=0)
+                elif encoding == "br" and brotli is not None:
+                    data = brotli.compress(self.body, quality=11)
+                else:
+                    raise ValueError(f"Unsupported content encoding: {encoding}")
+            data = self._encoded.setdefault(encoding, data)
+        return data
+
+    def encoded_etag(self, encoding: Optional[str]) -> str:
+        """Return the strong ETag of the response sent with a content coding."""
+        if not encoding:
+            return self.etag
+        return f'{self.etag[:-1]}-{encoding}"'
+
+
+_lock = threading.Lock()
+_responses: Dict[str, PreparedResponse] = {}
+
+# Builds the compressed variants of new responses; started by the HTTP transport
+_compressor: Optional[ThreadPoolExecutor] = None
+
+
+def enable_precompression() -> None:
+    """Compress every newly prepared response on a background thread."""
+    global _compressor
+    with _lock:
+        if _compressor is None:
+            _compressor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="precompress")
+
+
+def prepared_response(key: str, source: Any, build: Callable[[], str]) -> PreparedResponse:
+    """
+    Return the prepared response for a key, building it once per doc version.
+
+    Args:
+        key (str): Response identifier, e.g. the tool name
+        source: Document the response is built from - a CachedDocument or
+            SectionIndex, anything with ``version`` and ``url``
+        build (Callable[[], str]): Produces the JSON text on a cache miss
+
+    Returns:
+        PreparedResponse: The cached or newly built response
+    """
+    with _lock:
+        cached = _responses.get(key)
+    if cached is not None and cached.version == source.version:
+        RESPONSE_CACHE_LOOKUPS.inc(result="hit")
+        return cached
+    RESPONSE_CACHE_LOOKUPS.inc(result="miss")
+    with timed_phase("serialize"):
+        response = PreparedResponse(build(), source.version, source.url)
+    with _lock:
+        if key in _responses:
+            RESPONSE_CACHE_EVICTIONS.inc()
+        _responses[key] = response
+        compressor = _compressor
+    if compressor is not None and response.codings():
+        compressor.submit(response.precompress)
+    return response
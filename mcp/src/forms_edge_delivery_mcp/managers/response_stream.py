@@ -0,0 +1,60 @@
+"""
+Streamed responses for FORMS Edge Delivery MCP managers.
+
+A streamed response is a sequence of (event, data) pairs: ``meta`` once the
+source document is known, then one ``chunk`` per heading section (or bundle
+component), or ``error`` if the response cannot be produced. Concatenating the
+``text`` of every chunk gives exactly the ``data`` of the equivalent JSON
+response, so clients can render or tokenize each section as it arrives.
+Search streams one ``result`` event per ranked section instead of chunks.
+"""
+
+from typing import Any, Callable, Dict, Iterator, Optional, Tuple
+
+from .section_index import SectionIndex
+
+StreamEvent = Tuple[str, Dict[str, Any]]
+
+
+def chunk(section_id: Optional[str], text: str, title: Optional[str] = None) -> StreamEvent:
+    """Return a ``chunk`` event; section_id is None for titles and footers."""
+    return "chunk", {"id": section_id, "title": title, "text": text}
+
+
+def error(message: str) -> StreamEvent:
+    """Return an ``error`` event, which ends the stream."""
+    return "error", {"status": "failure", "errorMessage": message}
+
+
+def document_events(
+    index: SectionIndex,
+    title: str,
+    footer: str,
+    fallback: Callable[[], str],
+) -> Iterator[StreamEvent]:
+    """
+    Stream a whole document as title, heading sections and footer.
+
+    Args:
+        index (SectionIndex): Section index of the document version
+        title (str): Markdown title line, without the leading "# "
+        footer (str): Attribution line
+        fallback (Callable[[], str]): Content sent when the document is empty
+
+    Yields:
+        StreamEvent: ``meta``, then the chunks in document order
+    """
+    yield "meta", {"url": index.url, "version": index.version}
+    content = index.content
+    if not content.strip():
+        yield chunk(None, fallback())
+        return
+    yield chunk(None, f"# {title}\n\n")
+    for position, (node, start, end) in enumerate(index.spans()):
+        # Blank lines before the first heading belong to the first chunk
+        start = 0 if position == 0 else start
+        if node is None:
+            yield chunk("intro", content[start:end])
+        else:
+            yield chunk(node.id, content[start:end], node.title)
+    yield chunk(None, f"\n\n---\n\n{footer}")
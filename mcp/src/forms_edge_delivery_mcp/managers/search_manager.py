@@ -0,0 +1,330 @@
+"""
+Search Manager for FORMS Edge Delivery MCP server.
+
+Full-text search over every heading section of theme.md, layout.md and
+component.md. Sections come from each document's SectionIndex and are kept in
+an inverted index ranked with BM25; only the sections of a document whose
+version changed are re-indexed.
+"""
+
+import asyncio
+import heapq
+import json
+import math
+import re
+import threading
+from collections import Counter
+from typing import AsyncIterator, Dict, List, Optional, Set, Tuple
+
+from ..config import DOCS_URLS
+from .doc_cache import CachedDocument, document_cache
+from .response_stream import StreamEvent, error as stream_error
+from .section_index import SectionIndex, section_index_for
+from .shared_utils import create_success_response, create_error_response
+
+
+# BM25 parameters
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+# Heading words count this many times towards a section's term frequencies
+TITLE_WEIGHT = 3
+
+DEFAULT_LIMIT = 5
+MAX_LIMIT = 50
+SNIPPET_CHARS = 240
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+
+def tokenize(text: str) -> List[str]:
+    """Split text into lowercase alphanumeric terms."""
+    return _TOKEN_RE.findall(text.lower())
+
+
+class SearchSection:
+    """One heading section of a document, as indexed."""
+
+    def __init__(self, doc: str, url: str, section_id: str, title: str, text: str, length: int):
+        self.doc = doc
+        self.url = url
+        self.id = f"{doc}#{section_id}"
+        self.title = title
+        self.text = text
+        self.length = length
+
+
+def _document_sections(doc: str, index: SectionIndex) -> List[Tuple[str, str, str]]:
+    """Return (section id, title, text) for every heading section of a document."""
+    sections = []
+    for node, start, end in index.spans():
+        if node is None:
+            sections.append(("intro", doc, index.content[start:end]))
+        else:
+            sections.append((node.id, node.title, index.content[node.body_start:end]))
+    return sections
+
+
+class SearchIndex:
+    """
+    Inverted index with BM25 ranking over the sections of several documents.
+
+    Postings are kept per document so a new version of one document replaces
+    only that document's sections; collection statistics (section count and
+    average length) are maintained incrementally.
+    """
+
+    def __init__(self, k1: float = BM25_K1, b: float = BM25_B):
+        self.k1 = k1
+        self.b = b
+        self._lock = threading.Lock()
+        self._versions: Dict[str, str] = {}
+        self._sections: Dict[str, SearchSection] = {}
+        self._doc_sections: Dict[str, List[str]] = {}
+        self._doc_terms: Dict[str, Set[str]] = {}
+        # term -> {section id: term frequency}
+        self._postings: Dict[str, Dict[str, int]] = {}
+        self._total_length = 0
+
+    def version(self, doc: str) -> Optional[str]:
+        """Return the indexed version of a document."""
+        with self._lock:
+            return self._versions.get(doc)
+
+    def update(self, doc: str, index: SectionIndex) -> bool:
+        """
+        Index the sections of a document unless this version is already indexed.
+
+        Args:
+            doc (str): Document name, e.g. "theme"
+            index (SectionIndex): Section index of the document version
+
+        Returns:
+            bool: True if the document was (re)indexed
+        """
+        if self.version(doc) == index.version:
+            return False
+
+        # Tokenize outside the lock; only the swap below blocks searches
+        prepared = []
+        for section_id, title, text in _document_sections(doc, index):
+            terms = Counter(tokenize(text))
+            for term in tokenize(title):
+                terms[term] += TITLE_WEIGHT
+            length = sum(terms.values())
+            prepared.append((SearchSection(doc, index.url, section_id, title, text, length), terms))
+
+        with self._lock:
+            if self._versions.get(doc) == index.version:
+                return False
+            self._remove(doc)
+            ids = []
+            doc_terms: Set[str] = set()
+            for section, terms in prepared:
+                self._sections[section.id] = section
+                self._total_length += section.length
+                for term, frequency in terms.items():
+                    self._postings.setdefault(term, {})[section.id] = frequency
+                ids.append(section.id)
+                doc_terms.update(terms)
+            self._doc_sections[doc] = ids
+            self._doc_terms[doc] = doc_terms
+            self._versions[doc] = index.version
+        return True
+
+    def _remove(self, doc: str) -> None:
+        """Drop every section of a document (lock held)."""
+        ids = set(self._doc_sections.pop(doc, []))
+        for section_id in ids:
+            self._total_length -= self._sections.pop(section_id).length
+        for term in self._doc_terms.pop(doc, set()):
+            postings = self._postings[term]
+            for section_id in ids.intersection(postings):
+                del postings[section_id]
+            if not postings:
+                del self._postings[term]
+
+    def search(self, query: str, limit: int = DEFAULT_LIMIT) -> List[Dict[str, object]]:
+        """
+        Rank sections against a query with BM25.
+
+        Args:
+            query (str): Free-text query
+            limit (int): Maximum number of results
+
+        Returns:
+            List[Dict[str, object]]: Results with id, doc, title, score,
+            snippet and url, best first
+        """
+        terms = list(dict.fromkeys(tokenize(query)))
+        with self._lock:
+            count = len(self._sections)
+            if not terms or not count:
+                return []
+            avg_length = self._total_length / count
+            scores: Dict[str, float] = {}
+            for term in terms:
+                postings = self._postings.get(term)
+                if not postings:
+                    continue
+                idf = math.log(1 + (count - len(postings) + 0.5) / (len(postings) + 0.5))
+                for section_id, frequency in postings.items():
+                    norm = self.k1 * (1 - self.b + self.b * self._sections[section_id].length / avg_length)
+                    scores[section_id] = scores.get(section_id, 0.0) + idf * frequency * (self.k1 + 1) / (frequency + norm)
+            best = heapq.nlargest(limit, scores.items(), key=lambda item: item[1])
+            sections = [(self._sections[section_id], score) for section_id, score in best]
+
+        return [
+            {
+                "id": section.id,
+                "doc": section.doc,
+                "title": section.title,
+                "score": round(score, 4),
+                "snippet": _snippet(section.text, terms),
+                "url": section.url,
+            }
+            for section, score in sections
+        ]
+
+    def stats(self) -> Dict[str, object]:
+        """Return the indexed document versions and index size."""
+        with self._lock:
+            return {
+                "documents": dict(self._versions),
+                "sections": len(self._sections),
+                "terms": len(self._postings),
+            }
+
+
+def _snippet(text: str, terms: List[str]) -> str:
+    """Return a window of the section text around the first query term."""
+    flat = " ".join(text.split())
+    lowered = flat.lower()
+    positions = [match.start() for match in (
+        re.search(rf"\b{re.escape(term)}", lowered) for term in terms
+    ) if match]
+    start = max(0, min(positions) - SNIPPET_CHARS // 4) if positions else 0
+    snippet = flat[start:start + SNIPPET_CHARS]
+    if start > 0:
+        snippet = "…" + snippet
+    if start + SNIPPET_CHARS < len(flat):
+        snippet += "…"
+    return snippet
+
+
+# Process-wide index over every documentation file
+search_index = SearchIndex()
+
+
+def _search_response(query: str, limit: int, errors: Dict[str, str]) -> str:
+    results = search_index.search(query, limit)
+    payload: Dict[str, object] = {"query": query, "results": results}
+    if errors:
+        payload["unavailable"] = errors
+    return create_success_response(json.dumps(payload, indent=2))
+
+
+def _validate(query: str, limit: Optional[int]) -> Tuple[Optional[str], int]:
+    if not query or not query.strip():
+        return "Query must not be empty", 0
+    limit = DEFAULT_LIMIT if limit is None else limit
+    if limit < 1:
+        return "Limit must be a positive number", 0
+    return None, min(limit, MAX_LIMIT)
+
+
+def search_forms_docs(query: str, limit: Optional[int] = DEFAULT_LIMIT) -> str:
+    """
+    Search every section of the Adaptive Form theme, layout and component docs.
+
+    Args:
+        query (str): Free-text query, e.g. "wizard navigation buttons"
+        limit (int): Maximum number of results (1-50)
+
+    Returns:
+        JSON string with ranked sections: id, doc, title, score, snippet and url
+    """
+    error, limit = _validate(query, limit)
+    if error:
+        return create_error_response(error)
+    errors = {}
+    for doc, url in DOCS_URLS.items():
+        try:
+            search_index.update(doc, section_index_for(document_cache.get(url)))
+        except Exception as e:
+            errors[doc] = str(e)
+    if len(errors) == len(DOCS_URLS):
+        return create_error_response(f"Error fetching documentation for search: {errors}")
+    return _search_response(query, limit, errors)
+
+
+def _index_document(doc: str, document: CachedDocument) -> bool:
+    return search_index.update(doc, section_index_for(document))
+
+
+async def _refresh_index_async() -> Dict[str, str]:
+    """Bring the search index up to date with every document; return fetch errors by doc."""
+    documents = await asyncio.gather(
+        *(document_cache.get_async(url) for url in DOCS_URLS.values()),
+        return_exceptions=True,
+    )
+    errors = {}
+    stale = []
+    for doc, document in zip(DOCS_URLS, documents):
+        if isinstance(document, BaseException):
+            errors[doc] = str(document)
+        elif search_index.version(doc) != document.version:
+            stale.append((doc, document))
+    # Extracting and tokenizing a new version is CPU work: keep it off the event loop
+    loop = asyncio.get_running_loop()
+    await asyncio.gather(*(
+        loop.run_in_executor(None, _index_document, doc, document) for doc, document in stale
+    ))
+    return errors
+
+
+async def search_forms_docs_async(query: str, limit: Optional[int] = DEFAULT_LIMIT) -> str:
+    """
+    Async variant of search_forms_docs() that never blocks the event loop.
+
+    Args:
+        query (str): Free-text query
+        limit (int): Maximum number of results (1-50)
+
+    Returns:
+        JSON string with ranked sections: id, doc, title, score, snippet and url
+    """
+    error, limit = _validate(query, limit)
+    if error:
+        return create_error_response(error)
+    errors = await _refresh_index_async()
+    if len(errors) == len(DOCS_URLS):
+        return create_error_response(f"Error fetching documentation for search: {errors}")
+    return _search_response(query, limit, errors)
+
+
+async def stream_search_forms_docs_async(
+    query: str, limit: Optional[int] = DEFAULT_LIMIT
+) -> AsyncIterator[StreamEvent]:
+    """
+    Stream search results one ranked section at a time.
+
+    Args:
+        query (str): Free-text query
+        limit (int): Maximum number of results (1-50)
+
+    Yields:
+        StreamEvent: ``meta`` with the query and any unavailable documents,
+        then one ``result`` event per section, best first; or an ``error`` event
+    """
+    message, limit = _validate(query, limit)
+    if message:
+        yield stream_error(message)
+        return
+    errors = await _refresh_index_async()
+    if len(errors) == len(DOCS_URLS):
+        yield stream_error(f"Error fetching documentation for search: {errors}")
+        return
+    yield "meta", {"query": query, "unavailable": errors or None}
+    for result in search_index.search(query, limit):
+        yield "result", result
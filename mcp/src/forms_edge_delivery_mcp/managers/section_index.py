@@ -0,0 +1,289 @@
+"""
+Section index for FORMS Edge Delivery MCP managers.
+
+Parses a documentation file once per content version into a heading tree and
+pre-extracts the named sections the managers serve, so tool calls become
+dictionary lookups instead of regex scans over the whole document.
+"""
+
+import re
+import threading
+from typing import Any, Callable, Dict, List, Optional, Pattern, Tuple, TypeVar
+
+from ..config import DOCS_URLS
+from .doc_cache import CachedDocument, document_cache
+from .request_timing import timed_phase
+from .shared_utils import clean_content
+from .upstream_client import request_error
+
+
+# Named sections of theme.md: key -> (start pattern, terminator lookahead).
+# Each pair is the split form of the regex a manager used to run per call,
+# "<start>(.*?)(?=<terminator>)", and resolves to exactly the same text.
+THEME_SECTIONS: Dict[str, Tuple[str, str]] = {
+    "field-structure": (r"## \*\*Field Structure\*\*", r"###|\Z"),
+    "field-structure-markup": (r"Every Form Field.*?follows below structure", r"- \*\*Type\*\*|\Z"),
+    "dropdown": (r"### \*\*Dropdown\*\*", r"###|\Z"),
+    "radio-group": (r"### \*\*Radio Group\*\*", r"###|\Z"),
+    "checkbox-group": (r"### \*\*Checkbox Group\*\*", r"###|\Z"),
+    "panel-container": (r"## \*\*Panel/Container Structure\*\*", r"##|\Z"),
+    "styling-fields": (r"## \*\*Styling Fields\*\*", r"###|\Z"),
+    "styling-field-type": (r"### \*\*Styling based on Field Type\.\*\*", r"###|\Z"),
+    "styling-specific-field": (r"### \*\*Styling specific field type\.\*\*", r"###|\Z"),
+    "file-attachment": (r"### \*\*File Attachment\*\*", r"##|\Z"),
+    "error-messages": (r"## \*\*Styling Error Messages\*\*", r"\+---|$"),
+    "error-structure": (r"### Error Structure", r"###|\Z"),
+    "error-styling": (r"### Styling error message", r"\+---|$"),
+    "repeatable-panel": (r"## Repeatable Panel", r"##|\Z"),
+}
+
+_FLAGS = re.DOTALL | re.IGNORECASE
+_COMPILED_SECTIONS: Dict[str, Tuple[Pattern, Pattern]] = {
+    key: (re.compile(start, _FLAGS), re.compile(stop, _FLAGS))
+    for key, (start, stop) in THEME_SECTIONS.items()
+}
+
+_HEADING_RE = re.compile(r"^(#{1,6})[ \t]+(.*?)[ \t#]*$")
+_FENCE_RE = re.compile(r"^\s*(```|~~~)")
+
+# Data derived from a document version
+T = TypeVar("T")
+
+
+class HeadingNode:
+    """A markdown heading and the span of the document it owns."""
+
+    def __init__(self, node_id: str, level: int, title: str, start: int, body_start: int):
+        self.id = node_id
+        self.level = level
+        self.title = title
+        self.start = start
+        self.body_start = body_start
+        self.end = body_start
+        self.parent: Optional["HeadingNode"] = None
+        self.children: List["HeadingNode"] = []
+
+
+def _slugify(title: str) -> str:
+    slug = re.sub(r"[^a-z0-9]+", "-", title.lower()).strip("-")
+    return slug or "section"
+
+
+def parse_headings(content: str) -> List[HeadingNode]:
+    """
+    Parse markdown headings in a single pass, skipping fenced code blocks.
+
+    Args:
+        content (str): Markdown document
+
+    Returns:
+        List[HeadingNode]: Headings in document order, linked into a tree
+    """
+    nodes: List[HeadingNode] = []
+    stack: List[HeadingNode] = []
+    seen: Dict[str, int] = {}
+    in_fence = False
+    offset = 0
+
+    for line in content.splitlines(keepends=True):
+        line_start = offset
+        offset += len(line)
+        if _FENCE_RE.match(line):
+            in_fence = not in_fence
+            continue
+        if in_fence:
+            continue
+        match = _HEADING_RE.match(line.rstrip("\r\n"))
+        if not match:
+            continue
+
+        level = len(match.group(1))
+        title = match.group(2).replace("**", "").strip().rstrip(".")
+        slug = _slugify(title)
+        seen[slug] = seen.get(slug, 0) + 1
+        node_id = slug if seen[slug] == 1 else f"{slug}-{seen[slug]}"
+
+        # Close every open heading at the same or a deeper level
+        while stack and stack[-1].level >= level:
+            stack.pop().end = line_start
+        node = HeadingNode(node_id, level, title, line_start, offset)
+        if stack:
+            node.parent = stack[-1]
+            stack[-1].children.append(node)
+        stack.append(node)
+        nodes.append(node)
+
+    for node in stack:
+        node.end = len(content)
+    return nodes
+
+
+def _extract_section(content: str, start_re: Pattern, stop_re: Pattern) -> List[str]:
+    """Return the cleaned, non-empty captures of "<start>(.*?)(?=<stop>)"."""
+    fragments = []
+    pos = 0
+    while True:
+        start = start_re.search(content, pos)
+        if start is None:
+            break
+        stop = stop_re.search(content, start.end())
+        end = stop.start() if stop is not None else len(content)
+        fragment = content[start.end():end]
+        if fragment.strip():
+            fragments.append(clean_content(fragment))
+        pos = end
+    return fragments
+
+
+class SectionIndex:
+    """Heading tree and pre-cleaned named sections for one document version."""
+
+    def __init__(
+        self,
+        url: str,
+        content: str,
+        version: str,
+        sections: Optional[Dict[str, Tuple[Pattern, Pattern]]] = None,
+    ):
+        self.url = url
+        self.content = content
+        self.version = version
+        self.headings = parse_headings(content)
+        self.sections: Dict[str, List[str]] = {
+            key: _extract_section(content, start_re, stop_re)
+            for key, (start_re, stop_re) in (sections or {}).items()
+        }
+        self._rendered: Dict[Tuple[Tuple[str, ...], str], Optional[str]] = {}
+        self._derived: Dict[Any, Any] = {}
+        self._derived_lock = threading.Lock()
+
+    def heading(self, node_id: str) -> Optional[HeadingNode]:
+        """Look up a heading node by its id."""
+        for node in self.headings:
+            if node.id == node_id:
+                return node
+        return None
+
+    def fragments(self, keys: List[str]) -> List[str]:
+        """Return the cleaned fragments of the given sections, in order."""
+        result = []
+        for key in keys:
+            result.extend(self.sections.get(key, []))
+        return result
+
+    def spans(self) -> List[Tuple[Optional[HeadingNode], int, int]]:
+        """
+        Split the document into non-overlapping heading sections.
+
+        Each heading's span runs from its heading line to its first
+        sub-heading (or its end). Text before the first heading is returned
+        with heading None when it is not blank.
+
+        Returns:
+            List[Tuple[Optional[HeadingNode], int, int]]: (heading, start, end)
+            in document order
+        """
+        first = self.headings[0].start if self.headings else len(self.content)
+        spans: List[Tuple[Optional[HeadingNode], int, int]] = []
+        if self.content[:first].strip():
+            spans.append((None, 0, first))
+        for node in self.headings:
+            end = node.children[0].start if node.children else node.end
+            spans.append((node, node.start, end))
+        return spans
+
+    def derived(self, key: Any, build: Callable[[], T]) -> T:
+        """
+        Return data derived from this document version, building it once.
+
+        Args:
+            key: Identifier of the derived data
+            build (Callable[[], T]): Produces the data on first use
+
+        Returns:
+            The memoized data
+        """
+        with self._derived_lock:
+            if key in self._derived:
+                cached: T = self._derived[key]
+                return cached
+        # Built outside the lock so one slow build does not hold up other keys;
+        # concurrent first uses may build twice, and the first result published wins
+        value = build()
+        with self._derived_lock:
+            published: T = self._derived.setdefault(key, value)
+            return published
+
+    def render(self, keys: List[str], title: str) -> Optional[str]:
+        """
+        Render sections in the same format as extract_content_patterns.
+
+        Args:
+            keys (List[str]): Section keys, in output order
+            title (str): Title for the extracted content
+
+        Returns:
+            str: Formatted content or None if none of the sections were found
+        """
+        memo_key = (tuple(keys), title)
+        if memo_key not in self._rendered:
+            extracted_content = self.fragments(keys)
+            result = None
+            if extracted_content:
+                result = f"# {title}\n\n"
+                result += "\n\n---\n\n".join(extracted_content)
+                result += f"\n\n---\n\n*Information from [Adobe Adaptive Form Theme Documentation]({self.url})*"
+            self._rendered[memo_key] = result
+        return self._rendered[memo_key]
+
+
+_index_lock = threading.Lock()
+_indexes: Dict[str, SectionIndex] = {}
+
+
+def section_index_for(document: CachedDocument) -> SectionIndex:
+    """Return the section index of a document, building it once per version."""
+    with _index_lock:
+        index = _indexes.get(document.url)
+        if index is not None and index.version == document.version:
+            return index
+    sections = _COMPILED_SECTIONS if document.url == DOCS_URLS["theme"] else None
+    with timed_phase("extract"):
+        index = SectionIndex(document.url, document.content, document.version, sections)
+    with _index_lock:
+        _indexes[document.url] = index
+    return index
+
+
+def get_theme_index() -> SectionIndex:
+    """
+    Fetch theme.md through the document cache and return its section index.
+
+    Returns:
+        SectionIndex: Index for the current theme.md version
+
+    Raises:
+        Exception: If documentation cannot be fetched
+    """
+    try:
+        document = document_cache.get(DOCS_URLS["theme"])
+    except request_error() as e:
+        raise Exception(f"Unable to fetch documentation: {str(e)}")
+    return section_index_for(document)
+
+
+async def get_theme_index_async() -> SectionIndex:
+    """
+    Async variant of get_theme_index() that never blocks the event loop.
+
+    Returns:
+        SectionIndex: Index for the current theme.md version
+
+    Raises:
+        Exception: If documentation cannot be fetched
+    """
+    try:
+        document = await document_cache.get_async(DOCS_URLS["theme"])
+    except request_error() as e:
+        raise Exception(f"Unable to fetch documentation: {str(e)}")
+    return section_index_for(document)
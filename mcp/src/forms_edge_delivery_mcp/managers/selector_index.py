@@ -0,0 +1,238 @@
+"""
+CSS selector index for FORMS Edge Delivery MCP managers.
+
+Parses the HTML and CSS examples of theme.md once per document version into a
+lookup table of field types: the wrapper class and element of each type, its
+inner control, the classes used inside it, and every CSS example that targets
+it. Name-based selectors and state classes (e.g. ``.field-invalid``) are
+collected alongside, so a selector lookup is a dictionary access.
+"""
+
+import re
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from .section_index import SectionIndex
+
+_BLOCK_RE = re.compile(r"^\s*```(\w*)[^\n]*\n(.*?)^\s*```", re.MULTILINE | re.DOTALL)
+_TAG_RE = re.compile(r"<(\w+)([^>]*)>")
+_CLASS_ATTR_RE = re.compile(r"""class\s*=\s*["']([^"']*)["']""")
+_DATA_ATTR_RE = re.compile(r"\b(data-[\w-]+)")
+_RULE_RE = re.compile(r"([^{}]+)\{([^{}]*)\}")
+_WRAPPER_CLASS_RE = re.compile(r"\.([\w{}-]+?)-wrapper\b")
+_NAME_CLASS_RE = re.compile(r"\.field-([\w{}-]+)")
+
+CONTROL_TAGS = ("select", "textarea", "input", "button")
+# Classes every field has; they are not field types
+GENERIC_CLASSES = {"field-wrapper"}
+# Classes that describe a field's state rather than its type or name
+STATE_CLASSES = {"field-invalid", "field-valid"}
+# Placeholder the docs use for the type in ".{Type}-wrapper"
+TYPE_PLACEHOLDER = "{Type}"
+NAME_PLACEHOLDER = "{Name}"
+
+# Common names for documented field types; other names are matched ignoring hyphens
+ALIASES = {
+    "select": "drop-down",
+    "radio-button": "radio-group",
+    "checkboxes": "checkbox-group",
+    "file-input": "file",
+    "file-attachment": "file",
+    "fieldset": "panel",
+    "container": "panel",
+}
+
+
+def code_blocks(content: str) -> Iterator[Tuple[str, int, str]]:
+    """Yield (language, offset, body) of every fenced code block in a document."""
+    for match in _BLOCK_RE.finditer(content):
+        yield match.group(1).lower(), match.start(), match.group(2)
+
+
+def to_class_name(name: str) -> str:
+    """Turn a field name into its class suffix, like aem.js toClassName()."""
+    return re.sub(r"[^0-9a-z]+", "-", name.lower()).strip("-")
+
+
+class FieldTypeSelectors:
+    """Selectors and structure of one field type, as documented in theme.md."""
+
+    def __init__(self, field_type: str, element: str, section: Optional[str]):
+        self.field_type = field_type
+        self.element = element
+        self.section = section
+        self.control: Optional[str] = None
+        self.label: Optional[str] = None
+        self.parent: Optional[str] = None
+        self.classes: List[str] = []
+        self.attributes: List[str] = []
+        self.examples: List[str] = []
+
+    @property
+    def wrapper(self) -> str:
+        return f".{self.field_type}-wrapper"
+
+
+class SelectorIndex:
+    """Field types, name-based selectors and state classes of one theme.md version."""
+
+    def __init__(self, index: SectionIndex):
+        self.url = index.url
+        self.version = index.version
+        self.types: Dict[str, FieldTypeSelectors] = {}
+        self.template: Optional[FieldTypeSelectors] = None
+        self.name_examples: List[str] = []
+        self.state_examples: Dict[str, List[str]] = {}
+        self._parse(index)
+
+    def _parse(self, index: SectionIndex) -> None:
+        for language, offset, body in code_blocks(index.content):
+            heading = self._heading_at(index, offset)
+            if language == "html":
+                self._parse_html(body, heading)
+            elif language == "css":
+                self._parse_css(body)
+
+    @staticmethod
+    def _heading_at(index: SectionIndex, offset: int) -> Optional[str]:
+        title = None
+        for node in index.headings:
+            if node.start > offset:
+                break
+            title = node.title
+        return title
+
+    def _parse_html(self, body: str, heading: Optional[str]) -> None:
+        # The first wrapper of a block is the field; later ones are its parts
+        outer: Optional[FieldTypeSelectors] = None
+        for tag, attributes in _TAG_RE.findall(body):
+            tag = tag.lower()
+            class_match = _CLASS_ATTR_RE.search(attributes)
+            classes = class_match.group(1).split() if class_match else []
+            wrappers = [c[:-len("-wrapper")] for c in classes
+                        if c.endswith("-wrapper") and c not in GENERIC_CLASSES]
+            if wrappers:
+                entry = self._entry(wrappers[0], tag, heading)
+                if outer is None:
+                    outer = entry
+                elif entry is not outer and entry.parent is None:
+                    entry.parent = outer.field_type
+                for attribute in _DATA_ATTR_RE.findall(attributes):
+                    if attribute not in entry.attributes:
+                        entry.attributes.append(attribute)
+                continue
+            if outer is None:
+                continue
+            if tag in CONTROL_TAGS and outer.control is None:
+                outer.control = tag
+            if "field-label" in classes and outer.label is None:
+                outer.label = tag
+            for name in classes:
+                if name not in outer.classes:
+                    outer.classes.append(name)
+
+    def _entry(self, field_type: str, element: str, heading: Optional[str]) -> FieldTypeSelectors:
+        if field_type == TYPE_PLACEHOLDER:
+            if self.template is None:
+                self.template = FieldTypeSelectors(field_type, element, heading)
+            return self.template
+        entry = self.types.get(field_type)
+        if entry is None:
+            entry = self.types[field_type] = FieldTypeSelectors(field_type, element, heading)
+        return entry
+
+    def _parse_css(self, body: str) -> None:
+        for selectors, declarations in _RULE_RE.findall(body):
+            selectors = " ".join(selectors.split())
+            rule = f"{selectors} {{ {' '.join(declarations.split())} }}"
+            for field_type in dict.fromkeys(_WRAPPER_CLASS_RE.findall(selectors)):
+                if field_type in GENERIC_CLASSES or f"{field_type}-wrapper" in GENERIC_CLASSES:
+                    continue
+                entry = self.template if field_type == TYPE_PLACEHOLDER else self.types.get(field_type)
+                if entry is None:
+                    entry = self._entry(field_type, "div", None)
+                entry.examples.append(rule)
+            for name in dict.fromkeys(_NAME_CLASS_RE.findall(selectors)):
+                class_name = f"field-{name}"
+                if class_name in STATE_CLASSES:
+                    self.state_examples.setdefault(class_name, []).append(rule)
+                elif class_name not in GENERIC_CLASSES and rule not in self.name_examples:
+                    self.name_examples.append(rule)
+
+    def resolve(self, field_type: str) -> Optional[FieldTypeSelectors]:
+        """Return the documented entry for a field type or one of its aliases."""
+        key = to_class_name(field_type)
+        if key in self.types:
+            return self.types[key]
+        key = ALIASES.get(key, key)
+        if key in self.types:
+            return self.types[key]
+        loose = key.replace("-", "")
+        for name, entry in self.types.items():
+            if name.replace("-", "") == loose:
+                return entry
+        return None
+
+    def lookup(self, field_type: str, name: Optional[str] = None) -> Dict[str, object]:
+        """
+        Return the selectors for a field type, optionally narrowed to one field.
+
+        Types that theme.md does not show explicitly (e.g. "email") are answered
+        from the generic ``.{Type}-wrapper`` structure.
+
+        Args:
+            field_type (str): Field type, e.g. "drop-down", "email", "radio-group"
+            name (str): Field name, e.g. "country"
+
+        Returns:
+            Dict[str, object]: Wrapper, control, name and state selectors, the
+            classes inside the field and the documented CSS examples
+        """
+        found = self.resolve(field_type)
+        documented = found is not None
+        resolved_type = found.field_type if found is not None else to_class_name(field_type)
+        entry = found if found is not None else self.template
+        wrapper = f".{resolved_type}-wrapper"
+        # Types only seen in CSS examples take their structure from the template
+        structure = entry if entry is not None and entry.control else self.template
+        element = entry.element if entry is not None else "div"
+        control = structure.control if structure is not None else "input"
+
+        name_class = f".field-{to_class_name(name)}" if name else f".field-{NAME_PLACEHOLDER}"
+        field = f"{wrapper}{name_class}" if name else wrapper
+        examples = list(entry.examples) if entry is not None else []
+        if not documented:
+            examples = [rule.replace(TYPE_PLACEHOLDER, resolved_type) for rule in examples]
+
+        result: Dict[str, object] = {
+            "field_type": resolved_type,
+            "documented": documented,
+            "wrapper": wrapper,
+            "element": f"{element}{wrapper}",
+            "control": f"{field} {control}" if control else None,
+            "label": f"{field} .field-label",
+            "description": f"{field} .field-description",
+            "name_selector": name_class,
+            "field_selector": field,
+            "states": {
+                state: f"{field}.{state}" for state in sorted(STATE_CLASSES | set(self.state_examples))
+            },
+            "classes": list(structure.classes) if structure is not None else [],
+            "attributes": list(entry.attributes) if entry is not None else [],
+            "parent": f".{found.parent}-wrapper" if found is not None and found.parent else None,
+            "examples": examples,
+            "name_examples": list(self.name_examples),
+            "state_examples": {state: list(rules) for state, rules in self.state_examples.items()},
+            "section": entry.section if entry is not None else None,
+            "version": self.version,
+            "source": self.url,
+        }
+        return result
+
+    def field_types(self) -> List[str]:
+        """Return the documented field types."""
+        return list(self.types)
+
+
+def selector_index_for(index: SectionIndex) -> SelectorIndex:
+    """Return the selector index of a theme.md version, parsing it once."""
+    return index.derived("selectors", lambda: SelectorIndex(index))
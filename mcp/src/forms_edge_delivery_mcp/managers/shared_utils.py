@@ -4,11 +4,15 @@ Shared utilities for FORMS Edge Delivery MCP managers.
 Contains common functions used across different component managers.
 """
 
-import requests
 import re
 import json
 from typing import Tuple
 
+from ..config import DOCS_URLS
+from .doc_cache import document_cache
+from .upstream_client import request_error
+from .request_timing import timed_phase
+
 
 def fetch_adobe_docs() -> Tuple[str, str]:
     """
@@ -20,12 +24,29 @@ def fetch_adobe_docs() -> Tuple[str, str]:
     Raises:
         Exception: If documentation cannot be fetched
     """
-    DOCS_URL = "https://main--afb--adobe.aem.live/docs/developer/theme.md"
+    DOCS_URL = DOCS_URLS["theme"]
+    try:
+        document = document_cache.get(DOCS_URL)
+        return document.content, DOCS_URL
+    except request_error() as e:
+        raise Exception(f"Unable to fetch documentation: {str(e)}")
+
+
+async def fetch_adobe_docs_async() -> Tuple[str, str]:
+    """
+    Async variant of fetch_adobe_docs() that never blocks the event loop.
+    
+    Returns:
+        Tuple[str, str]: (content, url) - The documentation content and source URL
+        
+    Raises:
+        Exception: If documentation cannot be fetched
+    """
+    DOCS_URL = DOCS_URLS["theme"]
     try:
-        response = requests.get(DOCS_URL, timeout=10)
-        response.raise_for_status()
-        return response.text, DOCS_URL
-    except requests.exceptions.RequestException as e:
+        document = await document_cache.get_async(DOCS_URL)
+        return document.content, DOCS_URL
+    except request_error() as e:
         raise Exception(f"Unable to fetch documentation: {str(e)}")
 
 
@@ -39,10 +60,11 @@ def clean_content(content: str) -> str:
     Returns:
         str: Cleaned and formatted content
     """
-    cleaned = content.replace('\\*\\*', '**').replace('\\`\\`\\`', '```')
-    cleaned = cleaned.replace('\\#', '#').replace('\\-', '-')
-    cleaned = re.sub(r'\n\s*\n\s*\n', '\n\n', cleaned)
-    return cleaned.strip()
+    with timed_phase("clean"):
+        cleaned = content.replace('\\*\\*', '**').replace('\\`\\`\\`', '```')
+        cleaned = cleaned.replace('\\#', '#').replace('\\-', '-')
+        cleaned = re.sub(r'\n\s*\n\s*\n', '\n\n', cleaned)
+        return cleaned.strip()
 
 
 def create_success_response(data: str) -> str:
@@ -93,11 +115,12 @@ def extract_content_patterns(docs_content: str, patterns: list, docs_url: str, t
         str: Extracted and formatted content or None if no content found
     """
     extracted_content = []
-    for pattern in patterns:
-        matches = re.findall(pattern, docs_content, re.DOTALL | re.IGNORECASE)
-        for match in matches:
-            if match.strip():
-                extracted_content.append(clean_content(match))
+    with timed_phase("extract"):
+        for pattern in patterns:
+            matches = re.findall(pattern, docs_content, re.DOTALL | re.IGNORECASE)
+            for match in matches:
+                if match.strip():
+                    extracted_content.append(clean_content(match))
     
     if extracted_content:
         result = f"# {title}\n\n"
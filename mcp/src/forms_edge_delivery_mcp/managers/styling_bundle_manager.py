@@ -0,0 +1,199 @@
+"""
+Styling Bundle Manager for FORMS Edge Delivery MCP server.
+
+Combines the theme.md sections of several styling managers into one response,
+resolved from a single read of the document.
+"""
+
+from typing import AsyncIterator, Iterator, List, Optional, Tuple
+
+from .shared_utils import (
+    create_success_response,
+    create_error_response
+)
+from .section_index import SectionIndex, get_theme_index, get_theme_index_async
+from .content_delta import versioned_response
+from .response_stream import StreamEvent, chunk, error
+from . import (
+    css_selectors_manager,
+    dropdown_manager,
+    error_message_manager,
+    field_structure_manager,
+    file_attachment_manager,
+    panel_container_manager,
+    radio_checkbox_manager,
+    repeatable_panel_manager,
+)
+
+
+# Bundle component name -> (manager module, fallback), in bundle output order
+BUNDLE_COMPONENTS = {
+    "field-structure": (field_structure_manager, field_structure_manager.get_field_structure_fallback),
+    "css-selectors": (css_selectors_manager, css_selectors_manager.get_css_selectors_guide_fallback),
+    "error-messages": (error_message_manager, error_message_manager.get_error_message_styling_fallback),
+    "dropdown": (dropdown_manager, dropdown_manager.get_dropdown_styling_fallback),
+    "radio-checkbox": (radio_checkbox_manager, radio_checkbox_manager.get_radio_checkbox_styling_fallback),
+    "panel-container": (panel_container_manager, panel_container_manager.get_panel_container_styling_fallback),
+    "file-attachment": (file_attachment_manager, file_attachment_manager.get_file_attachment_styling_fallback),
+    "repeatable-panel": (repeatable_panel_manager, repeatable_panel_manager.get_repeatable_panel_styling_fallback),
+}
+
+# Components needed to theme a typical form
+DEFAULT_BUNDLE = ["field-structure", "css-selectors", "error-messages", "dropdown", "radio-checkbox"]
+
+
+def resolve_components(components: Optional[List[str]]) -> List[str]:
+    """
+    Validate requested bundle components and put them in bundle order.
+
+    Args:
+        components (List[str]): Requested component names; None for the default bundle
+
+    Returns:
+        List[str]: Unique component names in bundle output order
+
+    Raises:
+        ValueError: If components is not a non-empty list of strings, or a
+            component name is unknown
+    """
+    if components is None:
+        components = DEFAULT_BUNDLE
+    # HTTP bodies are untyped: a bare string would otherwise be read letter by letter
+    elif not isinstance(components, list) or not all(isinstance(name, str) for name in components):
+        raise ValueError("components must be a list of component names")
+    elif not components:
+        raise ValueError("components must name at least one component; omit it for the default bundle")
+    requested = components
+    unknown = [name for name in requested if name not in BUNDLE_COMPONENTS]
+    if unknown:
+        raise ValueError(
+            f"Unknown component(s): {', '.join(unknown)}. "
+            f"Available: {', '.join(BUNDLE_COMPONENTS)}"
+        )
+    return [name for name in BUNDLE_COMPONENTS if name in requested]
+
+
+def _bundle_parts(index: SectionIndex, components: List[str]) -> Iterator[Tuple[str, str]]:
+    """Yield (component, markdown) for every component with content, in bundle order."""
+    emitted_keys = set()
+    emitted_fragments: List[str] = []
+
+    for name in components:
+        manager, fallback = BUNDLE_COMPONENTS[name]
+        fragments = []
+        for key in manager.SECTION_KEYS:
+            if key in emitted_keys:
+                continue
+            emitted_keys.add(key)
+            for fragment in index.fragments([key]):
+                # Text already sent by another (or an enclosing) section is skipped
+                if not any(fragment in sent for sent in emitted_fragments):
+                    emitted_fragments.append(fragment)
+                    fragments.append(fragment)
+
+        if fragments:
+            yield name, f"# {manager.SECTION_TITLE}\n\n" + "\n\n---\n\n".join(fragments)
+        elif not index.fragments(manager.SECTION_KEYS):
+            yield name, fallback().strip()
+
+
+def _footer(index: SectionIndex) -> str:
+    return f"\n\n---\n\n*Information from [Adobe Adaptive Form Theme Documentation]({index.url})*"
+
+
+def _render_styling_bundle(index: SectionIndex, components: List[str]) -> str:
+    """Build the full bundle response from a theme.md section index."""
+    result = "\n\n---\n\n".join(text for _, text in _bundle_parts(index, components))
+    return create_success_response(result + _footer(index))
+
+
+def _build_styling_bundle(index: SectionIndex, names: List[str], if_changed_since: Optional[str] = None) -> str:
+    """Build the tool response from a theme.md section index, as a delta if requested."""
+    return versioned_response(
+        "get_styling_bundle:" + ",".join(names),
+        index,
+        lambda: _render_styling_bundle(index, names),
+        lambda: list(_bundle_parts(index, names)),
+        "Styling Bundle",
+        if_changed_since,
+    )
+
+
+def get_styling_bundle(
+    components: Optional[List[str]] = None,
+    if_changed_since: Optional[str] = None,
+) -> str:
+    """
+    Get the styling documentation of several components in one response.
+
+    Args:
+        components (List[str]): Component names (see BUNDLE_COMPONENTS); defaults
+            to field structure, CSS selectors, error messages, dropdown and
+            radio/checkbox
+        if_changed_since (str): Hash of an earlier response; returns a short "unchanged"
+            reply, or only the changed components, instead of the full bundle
+
+    Returns:
+        JSON string with the combined styling documentation
+    """
+    try:
+        names = resolve_components(components)
+    except ValueError as e:
+        return create_error_response(str(e))
+    try:
+        index = get_theme_index()
+        return _build_styling_bundle(index, names, if_changed_since)
+    except Exception as e:
+        return create_error_response(f"Error fetching styling bundle documentation: {str(e)}")
+
+
+async def get_styling_bundle_async(
+    components: Optional[List[str]] = None,
+    if_changed_since: Optional[str] = None,
+) -> str:
+    """
+    Async variant of get_styling_bundle() that never blocks the event loop.
+
+    Args:
+        components (List[str]): Component names (see BUNDLE_COMPONENTS)
+        if_changed_since (str): Hash of an earlier response
+
+    Returns:
+        JSON string with the combined styling documentation
+    """
+    try:
+        names = resolve_components(components)
+    except ValueError as e:
+        return create_error_response(str(e))
+    try:
+        index = await get_theme_index_async()
+        return _build_styling_bundle(index, names, if_changed_since)
+    except Exception as e:
+        return create_error_response(f"Error fetching styling bundle documentation: {str(e)}")
+
+
+async def stream_styling_bundle_async(components: Optional[List[str]] = None) -> AsyncIterator[StreamEvent]:
+    """
+    Stream a styling bundle one component at a time.
+
+    Args:
+        components (List[str]): Component names (see BUNDLE_COMPONENTS)
+
+    Yields:
+        StreamEvent: ``meta``, one ``chunk`` per component and the footer
+        (see response_stream), or an ``error`` event
+    """
+    try:
+        names = resolve_components(components)
+    except ValueError as e:
+        yield error(str(e))
+        return
+    try:
+        index = await get_theme_index_async()
+    except Exception as e:
+        yield error(f"Error fetching styling bundle documentation: {str(e)}")
+        return
+    yield "meta", {"url": index.url, "version": index.version, "components": names}
+    for position, (name, text) in enumerate(_bundle_parts(index, names)):
+        yield chunk(name, text if position == 0 else "\n\n---\n\n" + text)
+    yield chunk(None, _footer(index))
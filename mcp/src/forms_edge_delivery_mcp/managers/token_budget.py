@@ -0,0 +1,393 @@
+"""
+Token-budgeted responses for FORMS Edge Delivery MCP managers.
+
+A document (or a manager's theme.md sections) is split once per version into
+budget units: heading sections, with oversized sections cut further on blank
+lines outside code fences. Each unit carries a precomputed token estimate and
+byte size, so a request with ``max_tokens`` / ``max_bytes`` only has to pick
+the units that fit. Units not sent are reachable through a continuation cursor.
+A unit larger than the budget is sent in line-sized pieces, the cursor holding
+the offset reached, so every page stays within the budget.
+"""
+
+import base64
+import json
+import re
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+from .section_index import SectionIndex
+from .shared_utils import create_error_response, create_success_response
+
+# Sections longer than this are split into several units
+MAX_UNIT_TOKENS = 400
+
+# Longer cursors are rejected before being decoded; real ones stay far below
+MAX_CURSOR_LENGTH = 4096
+
+# Bytes of the blank line joining two parts of a response
+_SEPARATOR_BYTES = 2
+
+# Word runs and individual punctuation marks; close to (slightly above) the
+# token count of common BPE tokenizers for markdown and code
+_TOKEN_RE = re.compile(r"\w+|[^\w\s]")
+_FENCE_RE = re.compile(r"^\s*(```|~~~)", re.MULTILINE)
+
+
+def estimate_tokens(text: str) -> int:
+    """Estimate the number of LLM tokens in a text."""
+    return len(_TOKEN_RE.findall(text))
+
+
+class BudgetUnit:
+    """A piece of a response with its precomputed size."""
+
+    def __init__(self, text: str, depth: int):
+        self.text = text
+        self.depth = depth
+        self.tokens = estimate_tokens(text)
+        self.bytes = len(text.encode("utf-8"))
+
+
+def _split_blocks(text: str) -> List[str]:
+    """Split text on blank lines, keeping fenced code blocks whole."""
+    blocks: List[str] = []
+    current: List[str] = []
+    in_fence = False
+    for line in text.split("\n"):
+        if _FENCE_RE.match(line):
+            in_fence = not in_fence
+        if not line.strip() and not in_fence:
+            if current:
+                blocks.append("\n".join(current))
+                current = []
+            continue
+        current.append(line)
+    if current:
+        blocks.append("\n".join(current))
+    return blocks
+
+
+def _split_lines(block: str) -> List[str]:
+    """Split a block over MAX_UNIT_TOKENS into runs of whole lines (single lines may exceed it)."""
+    pieces: List[str] = []
+    current: List[str] = []
+    current_tokens = 0
+    for line in block.split("\n"):
+        tokens = estimate_tokens(line)
+        if current and current_tokens + tokens > MAX_UNIT_TOKENS:
+            pieces.append("\n".join(current))
+            current, current_tokens = [], 0
+        current.append(line)
+        current_tokens += tokens
+    if current:
+        pieces.append("\n".join(current))
+    return pieces
+
+
+def _units_of(text: str, depth: int) -> List[BudgetUnit]:
+    """Cut a section into units of at most MAX_UNIT_TOKENS (single lines may exceed it)."""
+    text = text.strip()
+    if not text:
+        return []
+    if estimate_tokens(text) <= MAX_UNIT_TOKENS:
+        return [BudgetUnit(text, depth)]
+    units: List[BudgetUnit] = []
+    current: List[str] = []
+    current_tokens = 0
+    blocks = []
+    for block in _split_blocks(text):
+        blocks.extend(_split_lines(block) if estimate_tokens(block) > MAX_UNIT_TOKENS else [block])
+    for block in blocks:
+        tokens = estimate_tokens(block)
+        if current and current_tokens + tokens > MAX_UNIT_TOKENS:
+            units.append(BudgetUnit("\n\n".join(current), depth))
+            current, current_tokens = [], 0
+        current.append(block)
+        current_tokens += tokens
+    if current:
+        units.append(BudgetUnit("\n\n".join(current), depth))
+    return units
+
+
+def document_units(index: SectionIndex) -> List[BudgetUnit]:
+    """
+    Return the budget units of a whole document, computed once per version.
+
+    Units are ranked by heading depth: the intro and top-level sections are
+    worth more than deeply nested ones.
+    """
+    def build() -> List[BudgetUnit]:
+        units = []
+        for node, start, end in index.spans():
+            units.extend(_units_of(index.content[start:end], node.level if node else 0))
+        return units
+    return index.derived("budget:document", build)
+
+
+def section_units(index: SectionIndex, keys: List[str]) -> List[BudgetUnit]:
+    """
+    Return the budget units of a manager's theme.md sections, computed once per version.
+
+    Units are ranked by section key order: managers list their primary
+    section first.
+    """
+    def build() -> List[BudgetUnit]:
+        units = []
+        for rank, key in enumerate(keys):
+            for fragment in index.sections.get(key, []):
+                units.extend(_units_of(fragment, rank))
+        return units
+    return index.derived(("budget:sections", tuple(keys)), build)
+
+
+def is_budgeted(max_tokens: Optional[int], max_bytes: Optional[int], cursor: Optional[str]) -> bool:
+    """Return True if a call asks for a budgeted response."""
+    return max_tokens is not None or max_bytes is not None or bool(cursor)
+
+
+# A unit sent in part: (unit index, offset of its first unsent character)
+Partial = Tuple[int, int]
+
+# A piece of a response: (unit index, start, end) of the unit's text
+Piece = Tuple[int, int, int]
+
+
+def _encode_cursor(key: str, version: str, sent: Set[int], partial: Optional[Partial] = None) -> str:
+    # Sent units as [start, end) ranges keep the cursor short
+    ranges: List[List[int]] = []
+    for i in sorted(sent):
+        if ranges and ranges[-1][1] == i:
+            ranges[-1][1] = i + 1
+        else:
+            ranges.append([i, i + 1])
+    payload: Dict[str, Any] = {"k": key, "v": version, "s": ranges}
+    if partial is not None:
+        payload["p"] = list(partial)
+    raw = json.dumps(payload, separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def _decode_cursor(cursor: str, key: str, version: str, total: int) -> Tuple[Set[int], Optional[Partial]]:
+    if len(cursor) > MAX_CURSOR_LENGTH:
+        raise ValueError("Invalid cursor")
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        data = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        cursor_key, cursor_version, ranges = data["k"], data["v"], data["s"]
+        partial = data.get("p")
+    except (ValueError, KeyError, TypeError, AttributeError):
+        raise ValueError("Invalid cursor")
+    if cursor_key != key:
+        raise ValueError("Cursor belongs to a different tool")
+    if cursor_version != version:
+        raise ValueError("The documentation changed since this cursor was issued; start again without a cursor")
+    # Only expand ranges that lie inside this response's units
+    if not isinstance(ranges, list) or len(ranges) > total:
+        raise ValueError("Invalid cursor")
+    sent: Set[int] = set()
+    for bounds in ranges:
+        if (not isinstance(bounds, list) or len(bounds) != 2
+                or not all(type(bound) is int for bound in bounds)
+                or not 0 <= bounds[0] < bounds[1] <= total):
+            raise ValueError("Invalid cursor")
+        sent.update(range(bounds[0], bounds[1]))
+    if partial is None:
+        return sent, None
+    if (not isinstance(partial, list) or len(partial) != 2
+            or not all(type(value) is int for value in partial)
+            or not 0 <= partial[0] < total or partial[0] in sent or partial[1] < 1):
+        raise ValueError("Invalid cursor")
+    return sent, (partial[0], partial[1])
+
+
+def _cut(text: str, max_tokens: Optional[int], max_bytes: Optional[int]) -> int:
+    """
+    Return the end of the longest prefix of text within the budget.
+
+    Cuts after whole lines where possible, else between tokens of the first
+    line; at least one token is kept, so a cursor always makes progress.
+    """
+    end, tokens, size = 0, 0, 0
+
+    def fits(extra_tokens: int, extra_bytes: int) -> bool:
+        return ((max_tokens is None or tokens + extra_tokens <= max_tokens)
+                and (max_bytes is None or size + extra_bytes <= max_bytes))
+
+    for line in text.splitlines(keepends=True):
+        line_tokens, line_bytes = estimate_tokens(line), len(line.encode("utf-8"))
+        if not fits(line_tokens, line_bytes):
+            break
+        end, tokens, size = end + len(line), tokens + line_tokens, size + line_bytes
+    if end:
+        return end
+    # The first line alone is over the budget: cut it between tokens
+    for count, match in enumerate(_TOKEN_RE.finditer(text), 1):
+        piece_bytes = len(text[end:match.end()].encode("utf-8"))
+        if end and not fits(count - tokens, piece_bytes):
+            break
+        end, tokens, size = match.end(), count, size + piece_bytes
+    return end or len(text)
+
+
+def select_units(
+    units: List[BudgetUnit],
+    max_tokens: Optional[int],
+    max_bytes: Optional[int],
+    sent: Set[int],
+    partial: Optional[Partial] = None,
+) -> List[Piece]:
+    """
+    Pick the most valuable unsent units that fit the budget.
+
+    The rest of a unit sent in part comes first. Other units are considered
+    by rank (depth), then document order; a unit that does not fit is skipped
+    in favour of smaller ones. When nothing fits, the first unit is cut down
+    to the budget, so a cursor always makes progress without exceeding it.
+
+    Returns:
+        List[Piece]: The chosen (unit, start, end) pieces, in document order
+    """
+    pieces: List[Piece] = []
+    tokens, size = 0, 0
+
+    def fits(unit_tokens: int, unit_bytes: int) -> bool:
+        return ((max_tokens is None or tokens + unit_tokens <= max_tokens)
+                and (max_bytes is None or size + unit_bytes + _SEPARATOR_BYTES <= max_bytes))
+
+    def room(total: Optional[int], used: int) -> Optional[int]:
+        return None if total is None else total - used
+
+    if partial is not None:
+        i, start = partial
+        rest = units[i].text[start:]
+        rest_tokens, rest_bytes = estimate_tokens(rest), len(rest.encode("utf-8"))
+        if not fits(rest_tokens, rest_bytes):
+            budget_bytes = room(max_bytes, _SEPARATOR_BYTES)
+            return [(i, start, start + _cut(rest, max_tokens, budget_bytes))]
+        pieces.append((i, start, len(units[i].text)))
+        tokens, size = rest_tokens, rest_bytes + _SEPARATOR_BYTES
+
+    remaining = [i for i in range(len(units)) if i not in sent and (partial is None or i != partial[0])]
+    for i in sorted(remaining, key=lambda i: (units[i].depth, i)):
+        unit = units[i]
+        if not fits(unit.tokens, unit.bytes):
+            continue
+        pieces.append((i, 0, len(unit.text)))
+        tokens += unit.tokens
+        size += unit.bytes + _SEPARATOR_BYTES
+    if not pieces and remaining:
+        i = remaining[0]
+        pieces = [(i, 0, _cut(units[i].text, max_tokens, room(max_bytes, _SEPARATOR_BYTES)))]
+    return sorted(pieces)
+
+
+def _continuation_note(returned: int, remaining: int, total: int) -> str:
+    return (
+        f"*Returned {returned} of {total} sections; {remaining} "
+        f"remaining. Call again with the cursor to continue.*"
+    )
+
+
+def budgeted_response(
+    key: str,
+    index: SectionIndex,
+    units: List[BudgetUnit],
+    title: str,
+    footer: str,
+    max_tokens: Optional[int] = None,
+    max_bytes: Optional[int] = None,
+    cursor: Optional[str] = None,
+    fallback: Optional[Callable[[], str]] = None,
+) -> str:
+    """
+    Build a response holding the units that fit a token and/or byte budget.
+
+    The title and the closing footer or continuation note count against the
+    budget, so ``data`` stays within it.
+
+    Args:
+        key (str): Tool name, bound into the cursor
+        index (SectionIndex): Document version the units come from
+        units (List[BudgetUnit]): Units of the full response
+        title (str): Markdown title line
+        footer (str): Attribution line
+        max_tokens (int): Token budget for the returned content
+        max_bytes (int): Byte budget for the returned content
+        cursor (str): Cursor of a previous budgeted call, to continue it
+        fallback (Callable[[], str]): Content returned when there are no units
+
+    Returns:
+        JSON string with the content, a ``cursor`` for the rest (None when
+        complete) and a ``budget`` summary
+    """
+    if not units and fallback is not None:
+        return create_success_response(fallback())
+    heading, closing = f"# {title}", f"---\n\n{footer}"
+    # The widest continuation note: every count at its largest
+    note = _continuation_note(len(units), len(units), len(units))
+    try:
+        sent, partial = _decode_cursor(cursor, key, index.version, len(units)) if cursor else (set(), None)
+        if partial is not None and partial[1] >= len(units[partial[0]].text):
+            raise ValueError("Invalid cursor")
+        budget: List[Optional[int]] = []
+        for name, value, measure in (
+            ("max_tokens", max_tokens, estimate_tokens),
+            ("max_bytes", max_bytes, lambda text: len(text.encode("utf-8")) + _SEPARATOR_BYTES),
+        ):
+            if value is None:
+                budget.append(None)
+                continue
+            overhead = measure(heading) + max(measure(closing), measure(note))
+            if value <= overhead:
+                raise ValueError(f"{name} must be more than {overhead} to fit the title and footer")
+            budget.append(value - overhead)
+    except ValueError as e:
+        return create_error_response(str(e))
+
+    pieces = select_units(units, budget[0], budget[1], sent, partial)
+    partial = None
+    for i, start, end in pieces:
+        if end < len(units[i].text):
+            partial = (i, end)
+        else:
+            sent.add(i)
+    complete = len(sent) >= len(units)
+
+    parts = [heading] + [units[i].text[start:end].strip() for i, start, end in pieces]
+    if complete:
+        parts.append(closing)
+    else:
+        parts.append(_continuation_note(len(pieces), len(units) - len(sent), len(units)))
+    data = "\n\n".join(parts)
+    return json.dumps({
+        "status": "success",
+        "data": data,
+        "errorMessage": None,
+        "cursor": None if complete else _encode_cursor(key, index.version, sent, partial),
+        "budget": {
+            "tokens": estimate_tokens(data),
+            "bytes": len(data.encode("utf-8")),
+            "sections_returned": len(pieces),
+            "sections_remaining": len(units) - len(sent),
+            "sections_total": len(units),
+            "version": index.version,
+        },
+    })
+
+
+def theme_budgeted_response(
+    key: str,
+    index: SectionIndex,
+    keys: List[str],
+    title: str,
+    fallback: Callable[[], str],
+    max_tokens: Optional[int] = None,
+    max_bytes: Optional[int] = None,
+    cursor: Optional[str] = None,
+) -> str:
+    """Budgeted response over a theme manager's sections (see budgeted_response)."""
+    footer = f"*Information from [Adobe Adaptive Form Theme Documentation]({index.url})*"
+    return budgeted_response(
+        key, index, section_units(index, keys), title, footer,
+        max_tokens, max_bytes, cursor, fallback,
+    )
@@ -0,0 +1,185 @@
+"""
+Upstream HTTP client for FORMS Edge Delivery MCP managers.
+
+Every documentation request to aem.live goes through one pooled keep-alive
+session, so cache misses and revalidations reuse open TCP/TLS connections
+instead of handshaking on every request.
+"""
+
+import threading
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Type
+
+from ..config import SERVER_CONFIG, UPSTREAM_CONFIG
+from .metrics import CollectedFamily, metrics
+
+if TYPE_CHECKING:
+    import requests
+
+
+def request_error() -> Type[Exception]:
+    """
+    Return the base exception of upstream requests.
+
+    Meant for ``except request_error():`` clauses, which only evaluate it
+    when an exception is raised, so handlers do not import requests up front.
+    """
+    import requests
+
+    return requests.exceptions.RequestException
+
+
+class UpstreamClient:
+    """
+    Thread-safe pooled HTTP client for upstream documentation requests.
+
+    Connections are kept alive per host and capped at ``pool_size``; when all
+    of them are busy further requests wait for a free connection instead of
+    opening extra ones.
+    """
+
+    def __init__(
+        self,
+        pool_size: int = 4,
+        connect_timeout: float = 5,
+        read_timeout: float = 10,
+        retries: int = 0,
+    ):
+        # requests is imported on first use to keep server startup fast
+        import requests
+        from requests.adapters import HTTPAdapter
+
+        self.pool_size = pool_size
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+        self._adapter = HTTPAdapter(
+            pool_connections=pool_size,
+            pool_maxsize=pool_size,
+            pool_block=True,
+            max_retries=retries,
+        )
+        self.session = requests.Session()
+        self.session.mount("https://", self._adapter)
+        self.session.mount("http://", self._adapter)
+        self.session.headers["User-Agent"] = f"{SERVER_CONFIG['name']}/{SERVER_CONFIG['version']}"
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.errors = 0
+        self.in_flight = 0
+
+    def get(self, url: str, headers: Optional[Dict[str, str]] = None) -> "requests.Response":
+        """
+        Send a GET request over the pooled session.
+
+        Args:
+            url (str): Upstream URL
+            headers (Dict[str, str]): Extra request headers, e.g. validators
+
+        Returns:
+            requests.Response: The upstream response
+
+        Raises:
+            requests.exceptions.RequestException: If the request fails
+        """
+        with self._lock:
+            self.requests += 1
+            self.in_flight += 1
+        try:
+            return self.session.get(
+                url,
+                headers=headers,
+                timeout=(self.connect_timeout, self.read_timeout),
+            )
+        except Exception:
+            with self._lock:
+                self.errors += 1
+            raise
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+
+    def close(self) -> None:
+        """Close every pooled connection."""
+        self.session.close()
+
+    def stats(self) -> Dict[str, Any]:
+        """Return request counters and per-host connection pool usage."""
+        pools = {}
+        manager = self._adapter.poolmanager
+        for key in list(manager.pools.keys()):
+            pool = manager.pools.get(key)
+            if pool is None:
+                continue
+            pools[f"{pool.scheme}://{pool.host}:{pool.port}"] = {
+                "connections_opened": pool.num_connections,
+                "requests": pool.num_requests,
+                # The pool queue is padded with None placeholders for unopened slots
+                "idle_connections": sum(
+                    1 for conn in list(getattr(pool.pool, "queue", ())) if conn is not None
+                ),
+            }
+        with self._lock:
+            return {
+                "pool_size": self.pool_size,
+                "connect_timeout": self.connect_timeout,
+                "read_timeout": self.read_timeout,
+                "requests": self.requests,
+                "errors": self.errors,
+                "in_flight": self.in_flight,
+                "pools": pools,
+            }
+
+
+_client_lock = threading.Lock()
+_client: Optional[UpstreamClient] = None
+
+
+def get_upstream_client() -> UpstreamClient:
+    """Return the process-wide upstream client, creating it on first use."""
+    global _client
+    with _client_lock:
+        if _client is None:
+            _client = UpstreamClient(
+                UPSTREAM_CONFIG["pool_size"],
+                UPSTREAM_CONFIG["connect_timeout"],
+                UPSTREAM_CONFIG["read_timeout"],
+                UPSTREAM_CONFIG["retries"],
+            )
+        return _client
+
+
+def set_upstream_client(client: Optional[UpstreamClient]) -> Optional[UpstreamClient]:
+    """
+    Replace the process-wide upstream client, e.g. with a stub in tests.
+
+    Args:
+        client (UpstreamClient): New client; None recreates the default on next use
+
+    Returns:
+        UpstreamClient: The previous client (not closed)
+    """
+    global _client
+    with _client_lock:
+        previous, _client = _client, client
+        return previous
+
+
+def _collect_pool_metrics() -> List[CollectedFamily]:
+    with _client_lock:
+        client = _client
+    if client is None:
+        return []
+    stats = client.stats()
+    pools = stats["pools"]
+    return [
+        ("mcp_upstream_requests_in_flight", "gauge", "Requests on the pooled upstream session",
+         [({}, stats["in_flight"])]),
+        ("mcp_upstream_pool_connections_opened_total", "counter", "Upstream connections opened per host",
+         [({"host": host}, pool["connections_opened"]) for host, pool in pools.items()]),
+        ("mcp_upstream_pool_requests_total", "counter", "Requests sent over each host's pool",
+         [({"host": host}, pool["requests"]) for host, pool in pools.items()]),
+        ("mcp_upstream_pool_idle_connections", "gauge", "Idle keep-alive connections per host",
+         [({"host": host}, pool["idle_connections"]) for host, pool in pools.items()]),
+    ]
+
+
+metrics.register_collector(_collect_pool_metrics)
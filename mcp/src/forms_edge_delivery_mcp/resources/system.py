@@ -7,6 +7,9 @@ import platform
 from datetime import datetime, timezone
 from typing import Dict, Any
 from ..config import SERVER_CONFIG
+from ..managers.doc_cache import document_cache
+from ..managers.doc_refresher import document_refresher
+from ..managers.upstream_client import get_upstream_client
 
 def get_server_info() -> Dict[str, Any]:
     """
@@ -25,18 +28,27 @@ def get_server_info() -> Dict[str, Any]:
             "get_radio_checkbox_styling", 
             "get_panel_container_styling",
             "get_css_selectors_guide",
+            "lookup_selectors",
             "get_file_attachment_styling",
             "get_error_message_styling",
             "get_repeatable_panel_styling",
+            "get_styling_bundle",
             "get_custom_component_creation",
             "get_layout_configuration",
             "system_info",
+            "get_server_metrics",
+            "search_forms_docs",
+            "lint_form_markup",
             "get_all_prompts"
         ],
         "available_resources": [
             "server-info",
             "system-info"
-        ]
+        ],
+        "document_cache": document_cache.stats(),
+        "document_refresher": document_refresher.stats(),
+        "shared_store": document_cache.store.stats() if document_cache.store is not None else None,
+        "upstream_client": get_upstream_client().stats()
     }
 
 def get_system_info() -> Dict[str, Any]:
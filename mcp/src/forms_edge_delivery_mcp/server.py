@@ -3,23 +3,15 @@ FORMS Edge Delivery MCP Server with FastMCP
 FORMS Edge Delivery MCP server providing tools and services for edge delivery operations
 """
 from fastmcp import FastMCP
-import json
+import argparse
+import atexit
 import os
-from .resources.system import get_server_info, get_system_info
-from .config import SERVER_CONFIG
-
-# Import managers for HTTP endpoints
-from .managers.field_structure_manager import get_field_structure_styling
-from .managers.dropdown_manager import get_dropdown_styling as dropdown_styling_manager
-from .managers.radio_checkbox_manager import get_radio_checkbox_styling as radio_checkbox_styling_manager
-from .managers.panel_container_manager import get_panel_container_styling as panel_container_styling_manager
-from .managers.css_selectors_manager import get_css_selectors_guide as css_selectors_guide_manager
-from .managers.file_attachment_manager import get_file_attachment_styling as file_attachment_styling_manager
-from .managers.error_message_manager import get_error_message_styling as error_message_styling_manager
-from .managers.repeatable_panel_manager import get_repeatable_panel_styling as repeatable_panel_styling_manager
-from .managers.custom_component_manager import get_custom_component_creation as custom_component_creation_manager
-from .managers.layout_manager import get_layout_configuration as layout_configuration_manager
-from .managers.system_info_manager import get_system_information
+import sys
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
+from .config import SERVER_CONFIG, SNAPSHOT_CONFIG, DOC_CACHE_CONFIG, WORKER_CONFIG
+
+if TYPE_CHECKING:
+    from fastapi import FastAPI
 
 # Import tool registration functions
 
@@ -31,36 +23,19 @@ from .tools.css_selectors_tools import register_css_selectors_tools
 from .tools.file_attachment_tools import register_file_attachment_tools
 from .tools.error_message_tools import register_error_message_tools
 from .tools.repeatable_panel_tools import register_repeatable_panel_tools
+from .tools.styling_bundle_tools import register_styling_bundle_tools
 from .tools.custom_component_tools import register_custom_component_tools
 from .tools.layout_tools import register_layout_tools
+from .tools.search_tools import register_search_tools
+from .tools.markup_lint_tools import register_markup_lint_tools
 from .tools.system_info_tools import register_system_info_tools
+from .tools.metrics_tools import register_metrics_tools
 
 # Import prompt registration functions
 from .prompts import register_all_prompts
 
 
 
-# Debug setup - enable remote debugging if debug mode is on
-if os.getenv('MCP_DEBUG', 'false').lower() == 'true' or os.getenv('DEBUG', 'false').lower() == 'true':
-    try:
-        import debugpy
-        print("🐛 Debug mode detected - Starting debugpy on port 5678")
-        try:
-            debugpy.listen(("0.0.0.0", 5678))
-            print("🔗 Waiting for debugger to attach on port 5678...")
-        except RuntimeError as e:
-            if "listen() has already been called" in str(e):
-                print("🔗 debugpy already listening - continuing...")
-            else:
-                raise e
-    except ImportError:
-        print("⚠️  debugpy not installed - install with: pip install debugpy")
-    except Exception as e:
-        print(f"⚠️  Debug setup failed: {e}")
-
-
-
-
 # Initialize the MCP server
 mcp = FastMCP(
     name=SERVER_CONFIG["name"],
@@ -77,8 +52,12 @@ register_css_selectors_tools(mcp)
 register_file_attachment_tools(mcp)
 register_error_message_tools(mcp)
 register_repeatable_panel_tools(mcp)
+register_styling_bundle_tools(mcp)
 register_custom_component_tools(mcp)
 register_layout_tools(mcp)
+register_search_tools(mcp)
+register_markup_lint_tools(mcp)
+register_metrics_tools(mcp)
 
 # Register prompt tools and resources
 register_all_prompts(mcp)
@@ -91,298 +70,579 @@ register_all_prompts(mcp)
 @mcp.resource("resource://server-info")
 def server_info_resource():
     """Provides information about the MCP server"""
+    from .resources.system import get_server_info
     return get_server_info()
 
 @mcp.resource("resource://system-info") 
 def system_info_resource():
     """Provides system information"""
+    from .resources.system import get_system_info
     return get_system_info()
 
+@mcp.resource("resource://docs/{doc}")
+async def doc_page_resource(doc: str) -> Dict[str, Any]:
+    """
+    Upstream documentation (theme, layout, component) one page at a time.
+    Read resource://docs/layout?page=2, or ?offset=N for the page holding character N.
+    """
+    from .managers.doc_pages import parse_doc_uri, read_doc_page_async
+    return await read_doc_page_async(**parse_doc_uri(doc))
+
 # =============================================================================
 # MAIN EXECUTION
 # =============================================================================
 
-def main():
-    """Main entry point for the MCP server"""
-    print(f"🚀 Starting {SERVER_CONFIG['name']} v{SERVER_CONFIG['version']}")
-    print(f"📡 Transport: {SERVER_CONFIG['transport']}")
+def start_debugger() -> None:
+    """Enable remote debugging with debugpy if debug mode is on"""
+    if os.getenv('MCP_DEBUG', 'false').lower() == 'true' or os.getenv('DEBUG', 'false').lower() == 'true':
+        try:
+            import debugpy
+            print("🐛 Debug mode detected - Starting debugpy on port 5678")
+            try:
+                debugpy.listen(("0.0.0.0", 5678))
+                print("🔗 Waiting for debugger to attach on port 5678...")
+            except RuntimeError as e:
+                if "listen() has already been called" in str(e):
+                    print("🔗 debugpy already listening - continuing...")
+                else:
+                    raise e
+        except ImportError:
+            print("⚠️  debugpy not installed - install with: pip install debugpy")
+        except Exception as e:
+            print(f"⚠️  Debug setup failed: {e}")
+
+
+def run_snapshot_command(args: argparse.Namespace) -> int:
+    """Handle `forms-edge-delivery-mcp snapshot ...` subcommands"""
+    if args.snapshot_command == "build":
+        from .managers.doc_snapshot import build_snapshot
+        print(f"📦 Building documentation snapshot in {args.output}")
+        try:
+            manifest = build_snapshot(args.output)
+        except Exception as e:
+            print(f"❌ Snapshot build failed: {e}", file=sys.stderr)
+            return 1
+        for name, meta in manifest["documents"].items():
+            print(f"   ✅ {name}: {meta['sha256'][:12]} ({meta['url']})")
+        return 0
+    return 1
+
+
+def run_lint_command(args: argparse.Namespace) -> int:
+    """Handle `forms-edge-delivery-mcp lint PATH`: stream violations, then the summary"""
+    import json
+    from .managers.doc_snapshot import enable_snapshot
+    from .managers.markup_linter import LintRun, compile_rules
+    from .managers.section_index import get_theme_index, section_index_for
+
+    try:
+        if args.theme:
+            from .config import DOCS_URLS
+            from .managers.doc_cache import CachedDocument
+            with open(args.theme, encoding="utf-8") as handle:
+                index = section_index_for(CachedDocument(DOCS_URLS["theme"], handle.read()))
+        else:
+            enable_snapshot()
+            index = get_theme_index()
+        run = LintRun(compile_rules(index), args.workers, args.batch_size)
+        for result in run.results(args.path):
+            for violation in result["violations"]:
+                if args.json:
+                    print(json.dumps({"source": result["source"], **violation}))
+                else:
+                    print(f"{result['source']}:{violation['line']}: [{violation['rule']}] "
+                          f"{violation['field']}: {violation['message']}")
+    except Exception as e:
+        print(f"❌ Lint failed: {e}", file=sys.stderr)
+        return 2
+
+    summary = run.summary()
+    if args.json:
+        print(json.dumps({"summary": summary}))
+    else:
+        icon = "✅" if summary["violations"] == 0 else "❌"
+        print(
+            f"{icon} {summary['fragments']} fragment(s) in {summary['files']} file(s): "
+            f"{summary['violations']} violation(s), {summary['fragments_per_second']} fragments/s "
+            f"with {summary['workers']} worker(s)",
+            file=sys.stderr
+        )
+    return 1 if summary["violations"] else 0
+
+
+def start_document_services(shared: bool = False) -> None:
+    """
+    Load the doc snapshot and start the background refresher.
+
+    Args:
+        shared (bool): Join the cross-process document store, so that worker
+            processes elect a single refresher and adopt each other's docs
+    """
+    from .managers.doc_refresher import document_refresher
+    from .managers.doc_snapshot import enable_snapshot
+
+    loaded = enable_snapshot()
+    if loaded:
+        print(f"📦 Loaded {loaded} document(s) from snapshot")
+    if shared:
+        from .managers.doc_cache import document_cache
+        from .managers.doc_store import open_shared_store, worker_id
+        store = open_shared_store()
+        document_cache.attach_store(store, worker_id(), WORKER_CONFIG['store_wait'])
+        document_refresher.attach_store(store, worker_id())
+        # Hand the refresher lease over right away on a clean shutdown
+        atexit.register(document_refresher.stop)
+        print(f"🗄️  Worker {worker_id()} sharing docs through {store.path}")
+    if DOC_CACHE_CONFIG['background_refresh']:
+        document_refresher.start()
+
+
+def create_http_app() -> "FastAPI":
+    """
+    Build the FastAPI app of the HTTP transport.
+
+    Returns:
+        FastAPI: App with the REST routes, discovery endpoints and middleware
+    """
+    from fastapi import FastAPI, Request, Response
+    from fastapi.middleware.cors import CORSMiddleware
+    from .http_responses import (
+        call_with_budget,
+        event_stream_response,
+        json_response,
+        metrics_middleware,
+        metrics_response,
+        server_timing_middleware,
+        wants_stream,
+    )
+    from .managers.response_cache import enable_precompression
+    from .resources.system import get_server_info, get_system_info
+    # Managers are only needed by the HTTP routes
+    from .managers.field_structure_manager import get_field_structure_styling_async
+    from .managers.dropdown_manager import get_dropdown_styling_async as dropdown_styling_manager
+    from .managers.radio_checkbox_manager import get_radio_checkbox_styling_async as radio_checkbox_styling_manager
+    from .managers.panel_container_manager import get_panel_container_styling_async as panel_container_styling_manager
+    from .managers.css_selectors_manager import get_css_selectors_guide_async as css_selectors_guide_manager
+    from .managers.css_selectors_manager import lookup_selectors_async as lookup_selectors_manager
+    from .managers.file_attachment_manager import get_file_attachment_styling_async as file_attachment_styling_manager
+    from .managers.error_message_manager import get_error_message_styling_async as error_message_styling_manager
+    from .managers.repeatable_panel_manager import get_repeatable_panel_styling_async as repeatable_panel_styling_manager
+    from .managers.styling_bundle_manager import get_styling_bundle_async as styling_bundle_manager
+    from .managers.styling_bundle_manager import stream_styling_bundle_async
+    from .managers.custom_component_manager import get_custom_component_creation_async as custom_component_creation_manager
+    from .managers.custom_component_manager import stream_custom_component_creation_async
+    from .managers.layout_manager import get_layout_configuration_async as layout_configuration_manager
+    from .managers.layout_manager import stream_layout_configuration_async
+    from .managers.search_manager import search_forms_docs_async as search_manager
+    from .managers.search_manager import stream_search_forms_docs_async
+    from .managers.markup_lint_manager import lint_form_markup_async as lint_manager
+    from .managers.markup_lint_manager import stream_lint_form_markup_async
+    from .managers.doc_pages import parse_doc_uri, read_doc_page_async
+    from .managers.system_info_manager import get_system_information
+    from .managers.shared_utils import create_error_response
     
-    if SERVER_CONFIG['transport'] == 'http':
-        print(f"🌐 HTTP Server: {SERVER_CONFIG['host']}:{SERVER_CONFIG['port']}")
+    # Compress responses as they are built, never while a request waits
+    enable_precompression()
+
+    # Create FastAPI app for HTTP transport
+    app = FastAPI(
+        title=SERVER_CONFIG['name'],
+        version=SERVER_CONFIG['version'],
+        description=SERVER_CONFIG['description']
+    )
     
-    if SERVER_CONFIG['debug']:
-        print("🐛 Debug mode enabled")
-    print("=" * 50)
+    # Add CORS middleware
+    app.add_middleware(
+        CORSMiddleware,
+        allow_origins=SERVER_CONFIG['allowed_origins'],
+        allow_credentials=True,
+        allow_methods=["*"],
+        allow_headers=["*"],
+    )
     
-    # Configure transport based on settings
-    if SERVER_CONFIG['transport'] == 'http':
-        # HTTP transport for Docker/API usage
-        import uvicorn
-        from fastapi import FastAPI
-        from fastapi.middleware.cors import CORSMiddleware
+    # Per-route latency and in-flight metrics
+    app.middleware("http")(metrics_middleware)
+    # Server-Timing breakdown (fetch/extract/clean/serialize, doc cache status)
+    app.middleware("http")(server_timing_middleware)
+
+    # Health check endpoint
+    @app.get("/health")
+    async def health_check():
+        return {"status": "healthy", "server": SERVER_CONFIG['name']}
+
+    # Prometheus metrics
+    @app.get("/metrics")
+    async def api_metrics() -> Response:
+        return metrics_response()
+    
+    # HTTP endpoints using managers directly. Styling routes also answer GET
+    # with ETag / Cache-Control so clients can revalidate instead of refetching,
+    # and take max_tokens / max_bytes / cursor for budgeted responses. Bundle,
+    # search, layout and custom component routes stream with ?stream=sse
+    @app.api_route("/field-structure", methods=["GET", "POST"])
+    async def api_field_structure(request: Request):
+        result = await call_with_budget(request, get_field_structure_styling_async)
+        return json_response(request, result)
         
-        # Create FastAPI app for HTTP transport
-        app = FastAPI(
-            title=SERVER_CONFIG['name'],
-            version=SERVER_CONFIG['version'],
-            description=SERVER_CONFIG['description']
-        )
+    @app.api_route("/dropdown-styling", methods=["GET", "POST"])
+    async def api_dropdown_styling(request: Request):
+        result = await call_with_budget(request, dropdown_styling_manager)
+        return json_response(request, result)
         
-        # Add CORS middleware
-        app.add_middleware(
-            CORSMiddleware,
-            allow_origins=SERVER_CONFIG['allowed_origins'],
-            allow_credentials=True,
-            allow_methods=["*"],
-            allow_headers=["*"],
-        )
+    @app.api_route("/radio-checkbox-styling", methods=["GET", "POST"])
+    async def api_radio_checkbox_styling(request: Request):
+        result = await call_with_budget(request, radio_checkbox_styling_manager)
+        return json_response(request, result)
+        
+    @app.api_route("/panel-container-styling", methods=["GET", "POST"])
+    async def api_panel_container_styling(request: Request):
+        result = await call_with_budget(request, panel_container_styling_manager)
+        return json_response(request, result)
+        
+    @app.api_route("/css-selectors-guide", methods=["GET", "POST"])
+    async def api_css_selectors_guide(request: Request):
+        result = await call_with_budget(request, css_selectors_guide_manager)
+        return json_response(request, result)
+        
+    @app.api_route("/lookup-selectors", methods=["GET", "POST"])
+    async def api_lookup_selectors(request: Request) -> Response:
+        # ?field_type=drop-down&name=country or a JSON body with the same keys
+        field_type = request.query_params.get("field_type", "")
+        name = request.query_params.get("name")
+        if request.method == "POST" and await request.body():
+            try:
+                body = await request.json()
+                field_type, name = body.get("field_type", field_type), body.get("name", name)
+            except (ValueError, AttributeError):
+                return json_response(request, create_error_response("Request body must be a JSON object"))
+        result = await lookup_selectors_manager(field_type, name)
+        return json_response(request, result)
+        
+    @app.api_route("/file-attachment-styling", methods=["GET", "POST"])
+    async def api_file_attachment_styling(request: Request):
+        result = await call_with_budget(request, file_attachment_styling_manager)
+        return json_response(request, result)
+        
+    @app.api_route("/error-message-styling", methods=["GET", "POST"])
+    async def api_error_message_styling(request: Request):
+        result = await call_with_budget(request, error_message_styling_manager)
+        return json_response(request, result)
         
-        # Health check endpoint
-        @app.get("/health")
-        async def health_check():
-            return {"status": "healthy", "server": SERVER_CONFIG['name']}
+    @app.api_route("/repeatable-panel-styling", methods=["GET", "POST"])
+    async def api_repeatable_panel_styling(request: Request):
+        result = await call_with_budget(request, repeatable_panel_styling_manager)
+        return json_response(request, result)
         
-        # HTTP endpoints using managers directly
-        @app.post("/field-structure")
-        async def api_field_structure():
-            result = get_field_structure_styling()
-            return json.loads(result)
-            
-        @app.post("/dropdown-styling")
-        async def api_dropdown_styling():
-            result = dropdown_styling_manager()
-            return json.loads(result)
-            
-        @app.post("/radio-checkbox-styling")
-        async def api_radio_checkbox_styling():
-            result = radio_checkbox_styling_manager()
-            return json.loads(result)
-            
-        @app.post("/panel-container-styling")
-        async def api_panel_container_styling():
-            result = panel_container_styling_manager()
-            return json.loads(result)
-            
-        @app.post("/css-selectors-guide")
-        async def api_css_selectors_guide():
-            result = css_selectors_guide_manager()
-            return json.loads(result)
-            
-        @app.post("/file-attachment-styling")
-        async def api_file_attachment_styling():
-            result = file_attachment_styling_manager()
-            return json.loads(result)
-            
-        @app.post("/error-message-styling")
-        async def api_error_message_styling():
-            result = error_message_styling_manager()
-            return json.loads(result)
-            
-        @app.post("/repeatable-panel-styling")
-        async def api_repeatable_panel_styling():
-            result = repeatable_panel_styling_manager()
-            return json.loads(result)
-            
-        @app.post("/custom-component-creation")
-        async def api_custom_component_creation():
-            result = custom_component_creation_manager()
-            return json.loads(result)
-            
-        @app.post("/layout-configuration")
-        async def api_layout_configuration():
-            result = layout_configuration_manager()
-            return json.loads(result)
-            
-        @app.post("/system-info")
-        async def api_system_info():
-            result = get_system_information()
-            return json.loads(result)
-
-        # MCP Resource endpoints accessible via HTTP
-        @app.get("/resource/server-info")
-        async def api_server_info():
-            return get_server_info()
-            
-        @app.get("/resource/system-info")
-        async def api_resource_system_info():
-            return get_system_info()
-
-        # ==========================================
-        # 🔍 API DISCOVERY ENDPOINTS
-        # ==========================================
+    @app.api_route("/styling-bundle", methods=["GET", "POST"])
+    async def api_styling_bundle(request: Request) -> Response:
+        # Components come from ?components=a,b or a JSON body {"components": [...]}
+        names = request.query_params.get("components")
+        components: Optional[List[str]] = [name.strip() for name in names.split(",")] if names else None
+        if_changed_since = request.query_params.get("if_changed_since")
+        if request.method == "POST" and await request.body():
+            try:
+                body = await request.json()
+                components = body.get("components", components)
+                if_changed_since = body.get("if_changed_since", if_changed_since)
+            except (ValueError, AttributeError):
+                return json_response(request, create_error_response("Request body must be a JSON object"))
+        if wants_stream(request):
+            return event_stream_response(stream_styling_bundle_async(components))
+        result = await styling_bundle_manager(components, if_changed_since)
+        return json_response(request, result)
+        
+    @app.api_route("/custom-component-creation", methods=["GET", "POST"])
+    async def api_custom_component_creation(request: Request):
+        if wants_stream(request):
+            return event_stream_response(stream_custom_component_creation_async())
+        result = await call_with_budget(request, custom_component_creation_manager)
+        return json_response(request, result)
+        
+    @app.api_route("/layout-configuration", methods=["GET", "POST"])
+    async def api_layout_configuration(request: Request):
+        if wants_stream(request):
+            return event_stream_response(stream_layout_configuration_async())
+        result = await call_with_budget(request, layout_configuration_manager)
+        return json_response(request, result)
+        
+    @app.api_route("/search", methods=["GET", "POST"])
+    async def api_search(request: Request) -> Response:
+        # Query comes from ?query=...&limit=N or a JSON body {"query": ..., "limit": N}
+        query = request.query_params.get("query", "")
+        raw_limit: Any = request.query_params.get("limit")
+        if request.method == "POST" and await request.body():
+            try:
+                body = await request.json()
+                query, raw_limit = body.get("query", query), body.get("limit", raw_limit)
+            except (ValueError, AttributeError):
+                return json_response(request, create_error_response("Request body must be a JSON object"))
+        try:
+            limit = int(raw_limit) if raw_limit is not None else None
+        except (TypeError, ValueError):
+            return json_response(request, create_error_response("Limit must be a positive number"))
+        if wants_stream(request):
+            return event_stream_response(stream_search_forms_docs_async(query, limit))
+        result = await search_manager(query, limit)
+        return json_response(request, result)
+
+    @app.api_route("/lint-form-markup", methods=["GET", "POST"])
+    async def api_lint_form_markup(request: Request) -> Response:
+        # ?path=...&workers=N&max_violations=N or a JSON body with the same keys
+        params = dict(request.query_params)
+        if request.method == "POST" and await request.body():
+            try:
+                params.update(await request.json())
+            except (ValueError, TypeError):
+                return json_response(request, create_error_response("Request body must be a JSON object"))
+        try:
+            workers = int(params["workers"]) if params.get("workers") is not None else None
+            max_violations = int(params.get("max_violations", 100))
+        except (TypeError, ValueError):
+            return json_response(request, create_error_response("workers and max_violations must be numbers"))
+        path = params.get("path", "")
+        if wants_stream(request):
+            return event_stream_response(stream_lint_form_markup_async(path, workers))
+        result = await lint_manager(path, workers, max_violations)
+        return json_response(request, result)
+
+    @app.post("/system-info")
+    async def api_system_info(request: Request):
+        result = get_system_information()
+        return json_response(request, result)
+
+    # MCP Resource endpoints accessible via HTTP
+    @app.get("/resource/server-info")
+    async def api_server_info():
+        return get_server_info()
         
-        @app.get("/")
-        async def root():
-            """Root endpoint with basic server info and links to discovery endpoints"""
-            return {
+    @app.get("/resource/system-info")
+    async def api_resource_system_info():
+        return get_system_info()
+
+    @app.get("/resource/docs/{doc}")
+    async def api_resource_doc_page(doc: str, request: Request) -> Union[Dict[str, Any], Response]:
+        try:
+            arguments = parse_doc_uri(f"{doc}?{request.url.query}")
+            return await read_doc_page_async(**arguments)
+        except ValueError as e:
+            return json_response(request, create_error_response(str(e)))
+        except Exception as e:
+            return json_response(request, create_error_response(f"Error fetching documentation: {str(e)}"))
+
+    # ==========================================
+    # 🔍 API DISCOVERY ENDPOINTS
+    # ==========================================
+    
+    @app.get("/")
+    async def root():
+        """Root endpoint with basic server info and links to discovery endpoints"""
+        return {
+            "name": "FORMS Edge Delivery MCP Server",
+            "version": "1.0.0",
+            "status": "running",
+            "description": "MCP server providing FORMS styling and structure data",
+            "discovery": {
+                "endpoints": "http://localhost:8080/api/discovery",
+                "schema": "http://localhost:8080/api/schema",
+                "health": "http://localhost:8080/health"
+            },
+            "documentation": "All endpoints return JSON data for FORMS Edge Delivery styling"
+        }
+
+    @app.get("/api/discovery")
+    async def api_discovery():
+        """Discover all available API endpoints"""
+        return {
+            "server": {
                 "name": "FORMS Edge Delivery MCP Server",
                 "version": "1.0.0",
-                "status": "running",
-                "description": "MCP server providing FORMS styling and structure data",
-                "discovery": {
-                    "endpoints": "http://localhost:8080/api/discovery",
-                    "schema": "http://localhost:8080/api/schema",
-                    "health": "http://localhost:8080/health"
+                "description": "Provides styling data and structure information for Adobe Experience Manager FORMS Edge Delivery"
+            },
+            "endpoints": {
+                "health": {
+                    "method": "GET",
+                    "path": "/health",
+                    "description": "Server health check",
+                    "returns": "Server status and basic info"
                 },
-                "documentation": "All endpoints return JSON data for FORMS Edge Delivery styling"
-            }
-
-        @app.get("/api/discovery")
-        async def api_discovery():
-            """Discover all available API endpoints"""
-            return {
-                "server": {
-                    "name": "FORMS Edge Delivery MCP Server",
-                    "version": "1.0.0",
-                    "description": "Provides styling data and structure information for Adobe Experience Manager FORMS Edge Delivery"
+                "metrics": {
+                    "method": "GET",
+                    "path": "/metrics",
+                    "description": "Prometheus metrics",
+                    "returns": "Tool/route latency histograms, cache and upstream counters in Prometheus text format"
                 },
-                "endpoints": {
-                    "health": {
-                        "method": "GET",
-                        "path": "/health",
-                        "description": "Server health check",
-                        "returns": "Server status and basic info"
-                    },
-                    "serverInfo": {
-                        "method": "GET", 
-                        "path": "/resource/server-info",
-                        "description": "Detailed server information",
-                        "returns": "Server details and capabilities"
-                    },
-                    "systemInfo": {
-                        "method": "GET",
-                        "path": "/resource/system-info", 
-                        "description": "System information",
-                        "returns": "System details and environment info"
-                    },
-                    "fieldStructure": {
-                        "method": "POST",
-                        "path": "/field-structure",
-                        "description": "Get field structure styling and markup patterns",
-                        "returns": "HTML structure and CSS for form fields"
-                    },
-                    "dropdownStyling": {
-                        "method": "POST",
-                        "path": "/dropdown-styling",
-                        "description": "Get dropdown component styling",
-                        "returns": "CSS and HTML for dropdown elements"
-                    },
-                    "radioCheckboxStyling": {
-                        "method": "POST", 
-                        "path": "/radio-checkbox-styling",
-                        "description": "Get radio button and checkbox styling",
-                        "returns": "CSS and HTML for radio/checkbox elements"
-                    },
-                    "panelContainerStyling": {
-                        "method": "POST",
-                        "path": "/panel-container-styling", 
-                        "description": "Get panel and container styling",
-                        "returns": "CSS and HTML for panels and containers"
-                    },
-                    "cssSelectorsGuide": {
-                        "method": "POST",
-                        "path": "/css-selectors-guide",
-                        "description": "Get CSS selectors guide for FORMS",
-                        "returns": "Complete guide to CSS selectors for form styling"
-                    },
-                    "fileAttachmentStyling": {
-                        "method": "POST",
-                        "path": "/file-attachment-styling",
-                        "description": "Get file attachment component styling", 
-                        "returns": "CSS and HTML for file upload elements"
-                    },
-                    "errorMessageStyling": {
-                        "method": "POST",
-                        "path": "/error-message-styling",
-                        "description": "Get error message styling",
-                        "returns": "CSS and HTML for form validation errors"
-                    },
-                    "repeatablePanelStyling": {
-                        "method": "POST", 
-                        "path": "/repeatable-panel-styling",
-                        "description": "Get repeatable panel styling",
-                        "returns": "CSS and HTML for dynamic repeatable form sections"
-                    },
-                    "customComponentCreation": {
-                        "method": "POST",
-                        "path": "/custom-component-creation",
-                        "description": "Get complete documentation for creating custom components (decorating fields)",
-                        "returns": "Complete guide with decorator functions, custom styling, and behavior implementation"
-                    },
-                    "layoutConfiguration": {
-                        "method": "POST",
-                        "path": "/layout-configuration",
-                        "description": "Get complete documentation for panel layout configuration",
-                        "returns": "Complete guide for implementing custom layouts like accordion, wizard, tabs, etc."
-                    },
-                    "systemInfoPost": {
-                        "method": "POST",
-                        "path": "/system-info",
-                        "description": "Get system information (POST endpoint)",
-                        "returns": "System details and environment info"
-                    }
+                "serverInfo": {
+                    "method": "GET", 
+                    "path": "/resource/server-info",
+                    "description": "Detailed server information",
+                    "returns": "Server details and capabilities"
+                },
+                "systemInfo": {
+                    "method": "GET",
+                    "path": "/resource/system-info", 
+                    "description": "System information",
+                    "returns": "System details and environment info"
+                },
+                "docPages": {
+                    "method": "GET",
+                    "path": "/resource/docs/{doc}",
+                    "description": "theme, layout or component docs one page at a time (?page=N or ?offset=N)",
+                    "returns": "Page content cut on section boundaries, section IDs and the next page URI"
+                },
+                "fieldStructure": {
+                    "method": "GET, POST",
+                    "path": "/field-structure",
+                    "description": "Get field structure styling and markup patterns",
+                    "returns": "HTML structure and CSS for form fields"
+                },
+                "dropdownStyling": {
+                    "method": "GET, POST",
+                    "path": "/dropdown-styling",
+                    "description": "Get dropdown component styling",
+                    "returns": "CSS and HTML for dropdown elements"
+                },
+                "radioCheckboxStyling": {
+                    "method": "GET, POST",
+                    "path": "/radio-checkbox-styling",
+                    "description": "Get radio button and checkbox styling",
+                    "returns": "CSS and HTML for radio/checkbox elements"
+                },
+                "panelContainerStyling": {
+                    "method": "GET, POST",
+                    "path": "/panel-container-styling", 
+                    "description": "Get panel and container styling",
+                    "returns": "CSS and HTML for panels and containers"
                 },
-                "usage": {
-                    "baseURL": "http://localhost:8080",
-                    "contentType": "application/json",
-                    "authentication": "none",
-                    "cors": "enabled"
+                "cssSelectorsGuide": {
+                    "method": "GET, POST",
+                    "path": "/css-selectors-guide",
+                    "description": "Get CSS selectors guide for FORMS",
+                    "returns": "Complete guide to CSS selectors for form styling"
+                },
+                "lookupSelectors": {
+                    "method": "GET, POST",
+                    "path": "/lookup-selectors",
+                    "description": "Look up the selectors of one field type (?field_type=drop-down&name=country or JSON body)",
+                    "returns": "Wrapper, control, name-based and state selectors with documented CSS examples"
+                },
+                "fileAttachmentStyling": {
+                    "method": "GET, POST",
+                    "path": "/file-attachment-styling",
+                    "description": "Get file attachment component styling", 
+                    "returns": "CSS and HTML for file upload elements"
+                },
+                "errorMessageStyling": {
+                    "method": "GET, POST",
+                    "path": "/error-message-styling",
+                    "description": "Get error message styling",
+                    "returns": "CSS and HTML for form validation errors"
+                },
+                "repeatablePanelStyling": {
+                    "method": "GET, POST",
+                    "path": "/repeatable-panel-styling",
+                    "description": "Get repeatable panel styling",
+                    "returns": "CSS and HTML for dynamic repeatable form sections"
+                },
+                "stylingBundle": {
+                    "method": "GET, POST",
+                    "path": "/styling-bundle",
+                    "description": "Get several styling sections in one call (?components=a,b or JSON body {\"components\": [...]})",
+                    "returns": "Combined CSS and HTML for the requested components"
+                },
+                "searchFormsDocs": {
+                    "method": "GET, POST",
+                    "path": "/search",
+                    "description": "Full-text search across theme, layout and component docs (?query=...&limit=N or JSON body)",
+                    "returns": "BM25-ranked sections with section IDs and snippets"
+                },
+                "lintFormMarkup": {
+                    "method": "GET, POST",
+                    "path": "/lint-form-markup",
+                    "description": "Lint a server-side directory or archive of form field HTML against the Field Structure spec (?path=...&workers=N, ?stream=sse for per-file results)",
+                    "returns": "Violations (wrapper classes, label/description placement, ARIA) with fragments per second"
+                },
+                "customComponentCreation": {
+                    "method": "GET, POST",
+                    "path": "/custom-component-creation",
+                    "description": "Get complete documentation for creating custom components (decorating fields)",
+                    "returns": "Complete guide with decorator functions, custom styling, and behavior implementation"
+                },
+                "layoutConfiguration": {
+                    "method": "GET, POST",
+                    "path": "/layout-configuration",
+                    "description": "Get complete documentation for panel layout configuration",
+                    "returns": "Complete guide for implementing custom layouts like accordion, wizard, tabs, etc."
+                },
+                "systemInfoPost": {
+                    "method": "POST",
+                    "path": "/system-info",
+                    "description": "Get system information (POST endpoint)",
+                    "returns": "System details and environment info"
                 }
+            },
+            "usage": {
+                "baseURL": "http://localhost:8080",
+                "contentType": "application/json",
+                "authentication": "none",
+                "cors": "enabled",
+                "budget": "Styling, layout and custom component routes accept max_tokens, max_bytes and cursor (query or JSON body) and return the sections that fit plus a cursor for the rest",
+                "changes": "Documentation responses carry the source doc version and a content hash; send it back as if_changed_since to get {\"unchanged\": true} or only the changed sections",
+                "streaming": "Styling bundle, search, layout and custom component routes stream Server-Sent Events (meta, chunk/result, done) with ?stream=sse or Accept: text/event-stream"
             }
+        }
 
-        @app.get("/api/schema")
-        async def api_schema():
-            """Get OpenAPI-like schema for all endpoints"""
-            return {
-                "openapi": "3.0.0",
-                "info": {
-                    "title": "FORMS Edge Delivery MCP Server",
-                    "version": "1.0.0",
-                    "description": "MCP server providing FORMS styling and structure data for Adobe Experience Manager"
-                },
-                "servers": [
-                    {"url": "http://localhost:8080", "description": "Local development server"}
-                ],
-                "paths": {
-                    "/health": {
-                        "get": {
-                            "summary": "Health Check",
-                            "description": "Check if server is running and healthy",
-                            "responses": {
-                                "200": {
-                                    "description": "Server is healthy",
-                                    "content": {
-                                        "application/json": {
-                                            "schema": {
-                                                "type": "object",
-                                                "properties": {
-                                                    "status": {"type": "string", "example": "healthy"},
-                                                    "timestamp": {"type": "string"},
-                                                    "server": {"type": "string"}
-                                                }
+    @app.get("/api/schema")
+    async def api_schema():
+        """Get OpenAPI-like schema for all endpoints"""
+        return {
+            "openapi": "3.0.0",
+            "info": {
+                "title": "FORMS Edge Delivery MCP Server",
+                "version": "1.0.0",
+                "description": "MCP server providing FORMS styling and structure data for Adobe Experience Manager"
+            },
+            "servers": [
+                {"url": "http://localhost:8080", "description": "Local development server"}
+            ],
+            "paths": {
+                "/health": {
+                    "get": {
+                        "summary": "Health Check",
+                        "description": "Check if server is running and healthy",
+                        "responses": {
+                            "200": {
+                                "description": "Server is healthy",
+                                "content": {
+                                    "application/json": {
+                                        "schema": {
+                                            "type": "object",
+                                            "properties": {
+                                                "status": {"type": "string", "example": "healthy"},
+                                                "timestamp": {"type": "string"},
+                                                "server": {"type": "string"}
                                             }
                                         }
                                     }
                                 }
                             }
                         }
-                    },
-                    "/field-structure": {
-                        "post": {
-                            "summary": "Get Field Structure Styling",
-                            "description": "Returns HTML structure and CSS styling for form fields",
-                            "responses": {
-                                "200": {
-                                    "description": "Field structure data",
-                                    "content": {
-                                        "application/json": {
-                                            "schema": {
-                                                "type": "object",
-                                                "properties": {
-                                                    "status": {"type": "string"},
-                                                    "data": {"type": "string"},
-                                                    "timestamp": {"type": "string"}
-                                                }
+                    }
+                },
+                "/field-structure": {
+                    "post": {
+                        "summary": "Get Field Structure Styling",
+                        "description": "Returns HTML structure and CSS styling for form fields",
+                        "responses": {
+                            "200": {
+                                "description": "Field structure data",
+                                "content": {
+                                    "application/json": {
+                                        "schema": {
+                                            "type": "object",
+                                            "properties": {
+                                                "status": {"type": "string"},
+                                                "data": {"type": "string"},
+                                                "timestamp": {"type": "string"}
                                             }
                                         }
                                     }
@@ -390,29 +650,102 @@ def main():
                             }
                         }
                     }
-                },
-                "components": {
-                    "schemas": {
-                        "ApiResponse": {
-                            "type": "object",
-                            "properties": {
-                                "status": {"type": "string", "enum": ["success", "error"]},
-                                "data": {"type": "string"},
-                                "errorMessage": {"type": "string"},
-                                "timestamp": {"type": "string"}
-                            }
+                }
+            },
+            "components": {
+                "schemas": {
+                    "ApiResponse": {
+                        "type": "object",
+                        "properties": {
+                            "status": {"type": "string", "enum": ["success", "error"]},
+                            "data": {"type": "string"},
+                            "errorMessage": {"type": "string"},
+                            "timestamp": {"type": "string"}
                         }
                     }
                 }
             }
-        
-        # Run HTTP server
-        uvicorn.run(
-            app,
-            host=SERVER_CONFIG['host'],
-            port=SERVER_CONFIG['port'],
-            log_level="info" if SERVER_CONFIG['debug'] else "warning"
-        )
+        }
+    return app
+
+
+def create_worker_app() -> "FastAPI":
+    """
+    uvicorn app factory for MCP_WORKERS > 1, called in every worker process.
+
+    Each worker joins the shared document store before building its app, so
+    only the elected worker fetches docs upstream.
+    """
+    start_document_services(shared=True)
+    return create_http_app()
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Main entry point for the MCP server"""
+    parser = argparse.ArgumentParser(
+        prog="forms-edge-delivery-mcp",
+        description=SERVER_CONFIG["description"]
+    )
+    subparsers = parser.add_subparsers(dest="command")
+    snapshot_parser = subparsers.add_parser("snapshot", help="Manage the offline documentation snapshot")
+    snapshot_commands = snapshot_parser.add_subparsers(dest="snapshot_command", required=True)
+    build_parser = snapshot_commands.add_parser("build", help="Fetch upstream docs and write a snapshot")
+    build_parser.add_argument(
+        "--output",
+        default=SNAPSHOT_CONFIG["directory"],
+        help="Snapshot directory (default: %(default)s)"
+    )
+    lint_parser = subparsers.add_parser("lint", help="Lint generated form markup against the Field Structure spec")
+    lint_parser.add_argument("path", help="Directory of .html fragments, .zip/.tar[.gz] archive, or .html file")
+    lint_parser.add_argument("--workers", type=int, default=None, help="Worker processes (default and maximum: MCP_LINT_WORKERS)")
+    lint_parser.add_argument("--batch-size", type=int, default=None, help="HTML files per worker task")
+    lint_parser.add_argument("--theme", default=None, help="Compile the rules from a local theme.md instead")
+    lint_parser.add_argument("--json", action="store_true", help="Print JSON lines instead of text")
+    args = parser.parse_args(argv)
+
+    if args.command == "snapshot":
+        sys.exit(run_snapshot_command(args))
+    if args.command == "lint":
+        sys.exit(run_lint_command(args))
+
+    start_debugger()
+
+    print(f"🚀 Starting {SERVER_CONFIG['name']} v{SERVER_CONFIG['version']}")
+    print(f"📡 Transport: {SERVER_CONFIG['transport']}")
+    
+    multi_worker = SERVER_CONFIG['transport'] == 'http' and WORKER_CONFIG['workers'] > 1
+    if SERVER_CONFIG['transport'] == 'http':
+        print(f"🌐 HTTP Server: {SERVER_CONFIG['host']}:{SERVER_CONFIG['port']}")
+    if multi_worker:
+        print(f"👷 Workers: {WORKER_CONFIG['workers']} (shared doc store: {WORKER_CONFIG['store_path']})")
+    
+    if SERVER_CONFIG['debug']:
+        print("🐛 Debug mode enabled")
+
+    # Multi-worker mode starts these in each worker process instead
+    if not multi_worker:
+        start_document_services()
+    print("=" * 50)
+    
+    # Configure transport based on settings
+    if SERVER_CONFIG['transport'] == 'http':
+        # HTTP transport for Docker/API usage
+        import uvicorn
+        run_options: Dict[str, Any] = {
+            "host": SERVER_CONFIG['host'],
+            "port": SERVER_CONFIG['port'],
+            "log_level": "info" if SERVER_CONFIG['debug'] else "warning",
+        }
+        if multi_worker:
+            # Workers are separate processes, so uvicorn needs an import string
+            uvicorn.run(
+                "forms_edge_delivery_mcp.server:create_worker_app",
+                factory=True,
+                workers=WORKER_CONFIG['workers'],
+                **run_options
+            )
+        else:
+            uvicorn.run(create_http_app(), **run_options)
     else:
         # Default STDIO transport for MCP protocol
         mcp.run()
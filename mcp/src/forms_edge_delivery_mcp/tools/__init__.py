@@ -1 +1,5 @@
 # Tools module for MCP Server
+#
+# Tool functions import their manager inside the function body, so starting the
+# server (and answering tools/list) does not load the managers and their
+# dependencies until a tool is first called.
@@ -1,23 +1,61 @@
 """
 CSS Selectors Tools for MCP server.
 
-Contains MCP tool wrapper for CSS selectors and targeting techniques.
+Contains MCP tool wrappers for CSS selectors and targeting techniques.
 """
 
+from typing import Optional
+
 from fastmcp import FastMCP
-from ..managers.css_selectors_manager import get_css_selectors_guide as css_selectors_guide_manager
+from ..managers.metrics import track_tool
 
 
 def register_css_selectors_tools(mcp: FastMCP):
     """Register CSS selectors tools with the MCP server."""
     
     @mcp.tool
-    def get_css_selectors_guide() -> str:
+    @track_tool
+    async def get_css_selectors_guide(
+        max_tokens: Optional[int] = None,
+        max_bytes: Optional[int] = None,
+        cursor: Optional[str] = None,
+        if_changed_since: Optional[str] = None,
+    ) -> str:
         """
         Get CSS selectors and targeting techniques for styling form fields.
         Covers type-based selectors, name-based targeting, and advanced styling patterns.
         
+        Args:
+            max_tokens: Optional token budget. Only the most relevant sections that fit
+                are returned, with a cursor for the rest.
+            max_bytes: Optional byte budget, like max_tokens
+            cursor: Cursor returned by a previous call, to fetch the remaining sections
+            if_changed_since: The "hash" of a response you already have. Returns
+                {"unchanged": true} if it is still current, otherwise only the changed sections.
+
         Returns:
             Comprehensive guide to CSS selectors with examples for different targeting strategies
         """
-        return css_selectors_guide_manager()
+        from ..managers.css_selectors_manager import get_css_selectors_guide_async as css_selectors_guide_manager
+        return await css_selectors_guide_manager(max_tokens, max_bytes, cursor, if_changed_since)
+
+
+    @mcp.tool
+    @track_tool
+    async def lookup_selectors(field_type: str, name: Optional[str] = None) -> str:
+        """
+        Look up the exact CSS selectors for a form field type, optionally for one named field.
+        Faster and much shorter than reading the full selectors guide.
+        
+        Args:
+            field_type: Field type, e.g. "drop-down", "radio-group", "checkbox-group",
+                "file", "panel", "email". Aliases like "select" or "checkbox" work too.
+            name: Optional field name (e.g. "country") to get name-based selectors
+
+        Returns:
+            JSON with the wrapper, control, label, name-based and state (.field-invalid)
+            selectors plus the CSS examples documented for that field type. Like the
+            other structured tools, ``data`` is a JSON-encoded string: parse it again
+        """
+        from ..managers.css_selectors_manager import lookup_selectors_async as lookup_selectors_manager
+        return await lookup_selectors_manager(field_type, name)
@@ -4,20 +4,37 @@ Custom Component Tools for MCP server.
 Contains MCP tool wrapper for custom component creation documentation.
 """
 
+from typing import Optional
+
 from fastmcp import FastMCP
-from ..managers.custom_component_manager import get_custom_component_creation as custom_component_manager
+from ..managers.metrics import track_tool
 
 
 def register_custom_component_tools(mcp: FastMCP):
     """Register custom component tools with the MCP server."""
     
     @mcp.tool
-    def get_custom_component_creation() -> str:
+    @track_tool
+    async def get_custom_component_creation(
+        max_tokens: Optional[int] = None,
+        max_bytes: Optional[int] = None,
+        cursor: Optional[str] = None,
+        if_changed_since: Optional[str] = None,
+    ) -> str:
         """
         Get complete documentation for creating custom components (decorating fields) in Adaptive Form Block.
         Covers the entire process from decorator functions to custom styling and behavior implementation.
         
+        Args:
+            max_tokens: Optional token budget. Only the most relevant sections that fit
+                are returned, with a cursor for the rest.
+            max_bytes: Optional byte budget, like max_tokens
+            cursor: Cursor returned by a previous call, to fetch the remaining sections
+            if_changed_since: The "hash" of a response you already have. Returns
+                {"unchanged": true} if it is still current, otherwise only the changed sections.
+
         Returns:
             Complete custom component creation guide with code examples and styling techniques
         """
-        return custom_component_manager()
+        from ..managers.custom_component_manager import get_custom_component_creation_async as custom_component_manager
+        return await custom_component_manager(max_tokens, max_bytes, cursor, if_changed_since)
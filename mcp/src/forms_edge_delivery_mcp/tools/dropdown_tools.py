@@ -4,20 +4,37 @@ Dropdown Tools for MCP server.
 Contains MCP tool wrapper for dropdown styling components.
 """
 
+from typing import Optional
+
 from fastmcp import FastMCP
-from ..managers.dropdown_manager import get_dropdown_styling as dropdown_styling_manager
+from ..managers.metrics import track_tool
 
 
 def register_dropdown_tools(mcp: FastMCP):
     """Register dropdown tools with the MCP server."""
     
-    @mcp.tool  
-    def get_dropdown_styling() -> str:
+    @mcp.tool
+    @track_tool
+    async def get_dropdown_styling(
+        max_tokens: Optional[int] = None,
+        max_bytes: Optional[int] = None,
+        cursor: Optional[str] = None,
+        if_changed_since: Optional[str] = None,
+    ) -> str:
         """
         Get dropdown/select component structure and styling information.
         Covers HTML structure, CSS selectors, and styling techniques for dropdown components.
         
+        Args:
+            max_tokens: Optional token budget. Only the most relevant sections that fit
+                are returned, with a cursor for the rest.
+            max_bytes: Optional byte budget, like max_tokens
+            cursor: Cursor returned by a previous call, to fetch the remaining sections
+            if_changed_since: The "hash" of a response you already have. Returns
+                {"unchanged": true} if it is still current, otherwise only the changed sections.
+
         Returns:
             Complete dropdown component implementation with HTML and CSS examples
         """
-        return dropdown_styling_manager()
+        from ..managers.dropdown_manager import get_dropdown_styling_async as dropdown_styling_manager
+        return await dropdown_styling_manager(max_tokens, max_bytes, cursor, if_changed_since)
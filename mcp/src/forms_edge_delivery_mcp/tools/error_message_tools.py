@@ -4,20 +4,37 @@ Error Message Tools for MCP server.
 Contains MCP tool wrapper for error message styling components.
 """
 
+from typing import Optional
+
 from fastmcp import FastMCP
-from ..managers.error_message_manager import get_error_message_styling as error_message_styling_manager
+from ..managers.metrics import track_tool
 
 
 def register_error_message_tools(mcp: FastMCP):
     """Register error message tools with the MCP server."""
     
     @mcp.tool
-    def get_error_message_styling() -> str:
+    @track_tool
+    async def get_error_message_styling(
+        max_tokens: Optional[int] = None,
+        max_bytes: Optional[int] = None,
+        cursor: Optional[str] = None,
+        if_changed_since: Optional[str] = None,
+    ) -> str:
         """
         Get form validation and error message styling techniques.
         Covers error states, validation feedback, and error message presentation.
         
+        Args:
+            max_tokens: Optional token budget. Only the most relevant sections that fit
+                are returned, with a cursor for the rest.
+            max_bytes: Optional byte budget, like max_tokens
+            cursor: Cursor returned by a previous call, to fetch the remaining sections
+            if_changed_since: The "hash" of a response you already have. Returns
+                {"unchanged": true} if it is still current, otherwise only the changed sections.
+
         Returns:
             Complete error handling implementation with validation styling and error states
         """
-        return error_message_styling_manager()
+        from ..managers.error_message_manager import get_error_message_styling_async as error_message_styling_manager
+        return await error_message_styling_manager(max_tokens, max_bytes, cursor, if_changed_since)
@@ -4,20 +4,37 @@ Field Structure Tools for MCP server.
 Contains MCP tool wrapper for field structure styling components.
 """
 
+from typing import Optional
+
 from fastmcp import FastMCP
-from ..managers.field_structure_manager import get_field_structure_styling
+from ..managers.metrics import track_tool
 
 
 def register_field_structure_tools(mcp: FastMCP):
     """Register field structure tools with the MCP server."""
     
     @mcp.tool
-    def get_field_structure() -> str:
+    @track_tool
+    async def get_field_structure(
+        max_tokens: Optional[int] = None,
+        max_bytes: Optional[int] = None,
+        cursor: Optional[str] = None,
+        if_changed_since: Optional[str] = None,
+    ) -> str:
         """
         Get HTML structure and markup patterns for Adaptive Form fields.
         Covers general field structure for text, number, email, and other input types.
         
+        Args:
+            max_tokens: Optional token budget. Only the most relevant sections that fit
+                are returned, with a cursor for the rest.
+            max_bytes: Optional byte budget, like max_tokens
+            cursor: Cursor returned by a previous call, to fetch the remaining sections
+            if_changed_since: The "hash" of a response you already have. Returns
+                {"unchanged": true} if it is still current, otherwise only the changed sections.
+
         Returns:
             Detailed HTML structure with classes, attributes, and field organization patterns
         """
-        return get_field_structure_styling()
+        from ..managers.field_structure_manager import get_field_structure_styling_async
+        return await get_field_structure_styling_async(max_tokens, max_bytes, cursor, if_changed_since)
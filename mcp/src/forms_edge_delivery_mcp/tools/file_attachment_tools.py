@@ -4,20 +4,37 @@ File Attachment Tools for MCP server.
 Contains MCP tool wrapper for file attachment styling components.
 """
 
+from typing import Optional
+
 from fastmcp import FastMCP
-from ..managers.file_attachment_manager import get_file_attachment_styling as file_attachment_styling_manager
+from ..managers.metrics import track_tool
 
 
 def register_file_attachment_tools(mcp: FastMCP):
     """Register file attachment tools with the MCP server."""
     
     @mcp.tool
-    def get_file_attachment_styling() -> str:
+    @track_tool
+    async def get_file_attachment_styling(
+        max_tokens: Optional[int] = None,
+        max_bytes: Optional[int] = None,
+        cursor: Optional[str] = None,
+        if_changed_since: Optional[str] = None,
+    ) -> str:
         """
         Get file upload component structure with drag-drop functionality.
         Covers file attachment HTML structure, drag-drop areas, and upload styling.
         
+        Args:
+            max_tokens: Optional token budget. Only the most relevant sections that fit
+                are returned, with a cursor for the rest.
+            max_bytes: Optional byte budget, like max_tokens
+            cursor: Cursor returned by a previous call, to fetch the remaining sections
+            if_changed_since: The "hash" of a response you already have. Returns
+                {"unchanged": true} if it is still current, otherwise only the changed sections.
+
         Returns:
             Complete file attachment component with drag-drop implementation and styling
         """
-        return file_attachment_styling_manager()
+        from ..managers.file_attachment_manager import get_file_attachment_styling_async as file_attachment_styling_manager
+        return await file_attachment_styling_manager(max_tokens, max_bytes, cursor, if_changed_since)
@@ -4,21 +4,38 @@ Layout Tools for MCP server.
 Contains MCP tool wrapper for panel layout configuration documentation.
 """
 
+from typing import Optional
+
 from fastmcp import FastMCP
-from ..managers.layout_manager import get_layout_configuration as layout_manager
+from ..managers.metrics import track_tool
 
 
 def register_layout_tools(mcp: FastMCP):
     """Register layout tools with the MCP server."""
     
     @mcp.tool
-    def get_layout_configuration() -> str:
+    @track_tool
+    async def get_layout_configuration(
+        max_tokens: Optional[int] = None,
+        max_bytes: Optional[int] = None,
+        cursor: Optional[str] = None,
+        if_changed_since: Optional[str] = None,
+    ) -> str:
         """
         Get complete documentation for panel layout configuration in Adaptive Form Block.
         Covers the entire process from componentDecorator function to layout implementation.
         Includes examples for accordion, wizard, tabs, and other panel layout types.
         
+        Args:
+            max_tokens: Optional token budget. Only the most relevant sections that fit
+                are returned, with a cursor for the rest.
+            max_bytes: Optional byte budget, like max_tokens
+            cursor: Cursor returned by a previous call, to fetch the remaining sections
+            if_changed_since: The "hash" of a response you already have. Returns
+                {"unchanged": true} if it is still current, otherwise only the changed sections.
+
         Returns:
             Complete layout configuration guide with code examples and implementation patterns
         """
-        return layout_manager()
+        from ..managers.layout_manager import get_layout_configuration_async as layout_manager
+        return await layout_manager(max_tokens, max_bytes, cursor, if_changed_since)
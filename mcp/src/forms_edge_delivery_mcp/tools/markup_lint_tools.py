@@ -0,0 +1,40 @@
+"""
+Markup Lint Tools for MCP server.
+
+Contains MCP tool wrapper for linting generated form markup against the Field Structure spec.
+"""
+
+from typing import Optional
+
+from fastmcp import FastMCP
+from ..managers.metrics import track_tool
+
+
+def register_markup_lint_tools(mcp: FastMCP) -> None:
+    """Register form markup lint tools with the MCP server."""
+
+    @mcp.tool
+    @track_tool
+    async def lint_form_markup(
+        path: str,
+        workers: Optional[int] = None,
+        max_violations: int = 100,
+    ) -> str:
+        """
+        Lint generated Adaptive Form field HTML against the documented Field Structure:
+        wrapper classes ({Type}-wrapper, field-{Name}, field-wrapper), label and
+        description placement, and the for / aria-describedby / aria-live attributes.
+
+        Args:
+            path: Directory of .html fragments, a .zip or .tar(.gz) archive of them,
+                or a single .html file, relative to the server's lint root
+                (MCP_LINT_ROOT; the tool is disabled when none is set)
+            workers: Number of worker processes (defaults to, and capped at, the server setting)
+            max_violations: Maximum number of violations to list (all are counted)
+
+        Returns:
+            Summary with files, fragments, violations by rule and fragments per second,
+            plus the first violations with source file, line, rule and message
+        """
+        from ..managers.markup_lint_manager import lint_form_markup_async as lint_manager
+        return await lint_manager(path, workers, max_violations)
@@ -0,0 +1,28 @@
+"""
+Metrics Tools for MCP server.
+
+Contains MCP tool wrapper for reading the server's metrics in stdio mode.
+"""
+
+from fastmcp import FastMCP
+from ..managers.metrics import track_tool
+
+
+def register_metrics_tools(mcp: FastMCP) -> None:
+    """Register metrics tools with the MCP server."""
+
+    @mcp.tool
+    @track_tool
+    def get_server_metrics() -> str:
+        """
+        Get server performance metrics: per-tool latency histograms, document
+        and response cache hit/miss/eviction counts, upstream fetch timings and
+        byte counts per doc URL, and in-flight request gauges.
+
+        Returns:
+            JSON formatted metrics snapshot
+        """
+        import json
+        from ..managers.metrics import metrics
+        from ..managers.shared_utils import create_success_response
+        return create_success_response(json.dumps(metrics.snapshot(), indent=2))
@@ -4,20 +4,37 @@ Panel & Container Tools for MCP server.
 Contains MCP tool wrapper for panel and container styling components.
 """
 
+from typing import Optional
+
 from fastmcp import FastMCP
-from ..managers.panel_container_manager import get_panel_container_styling as panel_container_styling_manager
+from ..managers.metrics import track_tool
 
 
 def register_panel_container_tools(mcp: FastMCP):
     """Register panel and container tools with the MCP server."""
     
     @mcp.tool
-    def get_panel_container_styling() -> str:
+    @track_tool
+    async def get_panel_container_styling(
+        max_tokens: Optional[int] = None,
+        max_bytes: Optional[int] = None,
+        cursor: Optional[str] = None,
+        if_changed_since: Optional[str] = None,
+    ) -> str:
         """
         Get panel and container component structures for grouping form elements.
         Covers fieldset implementation, panel organization, and container styling.
         
+        Args:
+            max_tokens: Optional token budget. Only the most relevant sections that fit
+                are returned, with a cursor for the rest.
+            max_bytes: Optional byte budget, like max_tokens
+            cursor: Cursor returned by a previous call, to fetch the remaining sections
+            if_changed_since: The "hash" of a response you already have. Returns
+                {"unchanged": true} if it is still current, otherwise only the changed sections.
+
         Returns:
             Panel and container implementation with HTML structure and styling techniques
         """
-        return panel_container_styling_manager()
+        from ..managers.panel_container_manager import get_panel_container_styling_async as panel_container_styling_manager
+        return await panel_container_styling_manager(max_tokens, max_bytes, cursor, if_changed_since)
@@ -4,20 +4,37 @@ Radio & Checkbox Tools for MCP server.
 Contains MCP tool wrapper for radio button and checkbox styling components.
 """
 
+from typing import Optional
+
 from fastmcp import FastMCP
-from ..managers.radio_checkbox_manager import get_radio_checkbox_styling as radio_checkbox_styling_manager
+from ..managers.metrics import track_tool
 
 
 def register_radio_checkbox_tools(mcp: FastMCP):
     """Register radio and checkbox tools with the MCP server."""
     
     @mcp.tool
-    def get_radio_checkbox_styling() -> str:
+    @track_tool
+    async def get_radio_checkbox_styling(
+        max_tokens: Optional[int] = None,
+        max_bytes: Optional[int] = None,
+        cursor: Optional[str] = None,
+        if_changed_since: Optional[str] = None,
+    ) -> str:
         """
         Get radio button and checkbox group component structures and styling.
         Covers fieldset implementation, group organization, and styling techniques.
         
+        Args:
+            max_tokens: Optional token budget. Only the most relevant sections that fit
+                are returned, with a cursor for the rest.
+            max_bytes: Optional byte budget, like max_tokens
+            cursor: Cursor returned by a previous call, to fetch the remaining sections
+            if_changed_since: The "hash" of a response you already have. Returns
+                {"unchanged": true} if it is still current, otherwise only the changed sections.
+
         Returns:
             Complete radio and checkbox group implementation with HTML structures and CSS
         """
-        return radio_checkbox_styling_manager()
+        from ..managers.radio_checkbox_manager import get_radio_checkbox_styling_async as radio_checkbox_styling_manager
+        return await radio_checkbox_styling_manager(max_tokens, max_bytes, cursor, if_changed_since)
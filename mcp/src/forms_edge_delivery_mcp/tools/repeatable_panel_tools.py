@@ -4,20 +4,37 @@ Repeatable Panel Tools for MCP server.
 Contains MCP tool wrapper for repeatable panel styling components.
 """
 
+from typing import Optional
+
 from fastmcp import FastMCP
-from ..managers.repeatable_panel_manager import get_repeatable_panel_styling as repeatable_panel_styling_manager
+from ..managers.metrics import track_tool
 
 
 def register_repeatable_panel_tools(mcp: FastMCP):
     """Register repeatable panel tools with the MCP server."""
     
     @mcp.tool
-    def get_repeatable_panel_styling() -> str:
+    @track_tool
+    async def get_repeatable_panel_styling(
+        max_tokens: Optional[int] = None,
+        max_bytes: Optional[int] = None,
+        cursor: Optional[str] = None,
+        if_changed_since: Optional[str] = None,
+    ) -> str:
         """
         Get repeatable panel component structure for dynamic form sections.
         Covers dynamic panel creation, repetition controls, and container styling.
         
+        Args:
+            max_tokens: Optional token budget. Only the most relevant sections that fit
+                are returned, with a cursor for the rest.
+            max_bytes: Optional byte budget, like max_tokens
+            cursor: Cursor returned by a previous call, to fetch the remaining sections
+            if_changed_since: The "hash" of a response you already have. Returns
+                {"unchanged": true} if it is still current, otherwise only the changed sections.
+
         Returns:
             Repeatable panel implementation with dynamic section controls and styling
         """
-        return repeatable_panel_styling_manager()
+        from ..managers.repeatable_panel_manager import get_repeatable_panel_styling_async as repeatable_panel_styling_manager
+        return await repeatable_panel_styling_manager(max_tokens, max_bytes, cursor, if_changed_since)
@@ -0,0 +1,30 @@
+"""
+Search Tools for MCP server.
+
+Contains MCP tool wrapper for full-text search across the Adaptive Form docs.
+"""
+
+from fastmcp import FastMCP
+from ..managers.metrics import track_tool
+
+
+def register_search_tools(mcp: FastMCP) -> None:
+    """Register documentation search tools with the MCP server."""
+
+    @mcp.tool
+    @track_tool
+    async def search_forms_docs(query: str, limit: int = 5) -> str:
+        """
+        Search every section of the Adaptive Form Block theme, layout and custom
+        component documentation. Use this first to find which section answers a
+        question instead of fetching whole documents.
+
+        Args:
+            query: Free-text query, e.g. "wizard navigation buttons"
+            limit: Maximum number of results (1-50)
+
+        Returns:
+            Ranked sections with section ID, title, score and a snippet
+        """
+        from ..managers.search_manager import search_forms_docs_async as search_manager
+        return await search_manager(query, limit)
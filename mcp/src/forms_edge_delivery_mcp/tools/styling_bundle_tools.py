@@ -0,0 +1,38 @@
+"""
+Styling Bundle Tools for MCP server.
+
+Contains MCP tool wrapper for fetching several styling sections in one call.
+"""
+
+from typing import List, Optional
+
+from fastmcp import FastMCP
+from ..managers.metrics import track_tool
+
+
+def register_styling_bundle_tools(mcp: FastMCP) -> None:
+    """Register styling bundle tools with the MCP server."""
+
+    @mcp.tool
+    @track_tool
+    async def get_styling_bundle(
+        components: Optional[List[str]] = None,
+        if_changed_since: Optional[str] = None,
+    ) -> str:
+        """
+        Get the styling documentation of several form components in one call.
+        Use this instead of calling the individual styling tools one after another.
+
+        Args:
+            components: Any of "field-structure", "css-selectors", "error-messages",
+                "dropdown", "radio-checkbox", "panel-container", "file-attachment",
+                "repeatable-panel". Defaults to field-structure, css-selectors,
+                error-messages, dropdown and radio-checkbox.
+            if_changed_since: The "hash" of a bundle you already have. Returns
+                {"unchanged": true} if it is still current, otherwise only the changed components.
+
+        Returns:
+            Combined HTML structure and CSS documentation for the requested components
+        """
+        from ..managers.styling_bundle_manager import get_styling_bundle_async as styling_bundle_manager
+        return await styling_bundle_manager(components, if_changed_since)
@@ -5,13 +5,14 @@ Contains MCP tool wrappers for system information functionality.
 """
 
 from fastmcp import FastMCP
-from ..managers.system_info_manager import get_system_information
+from ..managers.metrics import track_tool
 
 
 def register_system_info_tools(mcp: FastMCP):
     """Register system info tools with the MCP server."""
     
     @mcp.tool
+    @track_tool
     def system_info() -> str:
         """
         Get system information including platform, Python version, and environment details.
@@ -19,10 +20,12 @@ def register_system_info_tools(mcp: FastMCP):
         Returns:
             JSON formatted system information
         """
+        from ..managers.system_info_manager import get_system_information
         return get_system_information()
 
 
 # Direct function access for HTTP endpoints (without MCP decoration)
 def get_system_info_http():
     """HTTP endpoint wrapper for system information."""
+    from ..managers.system_info_manager import get_system_information
     return get_system_information()
@@ -0,0 +1,10 @@
+"""
+Shared pytest setup: keep the tests offline and away from the on-disk snapshot.
+
+Set before the package is imported, since config.py reads the environment once.
+"""
+
+import os
+
+os.environ["MCP_SNAPSHOT_ENABLED"] = "false"
+os.environ["MCP_DOC_BACKGROUND_REFRESH"] = "false"
@@ -0,0 +1,128 @@
+"""
+Documentation fixtures shared by the extraction tests and benchmarks.
+
+The checked-in docs under ``fixtures/docs`` are small copies of the upstream
+theme.md, layout.md and component.md. ``enlarge_document`` grows them for
+scaling runs, and ``LEGACY_PATTERNS`` keeps the per-call regexes the theme
+managers used before the section index. ``extract_content_patterns`` applied
+to those regexes is the reference output every faster extractor must match.
+"""
+
+import os
+from typing import Dict, List, Optional
+
+from forms_edge_delivery_mcp.managers.doc_cache import CachedDocument
+from forms_edge_delivery_mcp.managers.section_index import (
+    _COMPILED_SECTIONS,
+    SectionIndex,
+)
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+DOCS_DIR = os.path.join(FIXTURES_DIR, "docs")
+GOLDEN_DIR = os.path.join(FIXTURES_DIR, "golden")
+
+# Fixed, so golden files do not depend on MCP_DOCS_BASE_URL
+FIXTURE_BASE_URL = "https://main--afb--adobe.aem.live/docs/developer"
+
+# Theme manager module -> the regexes it ran on every call, in output order
+LEGACY_PATTERNS: Dict[str, List[str]] = {
+    "field_structure_manager": [
+        r"## \*\*Field Structure\*\*(.*?)(?=###|\Z)",
+        r"Every Form Field.*?follows below structure(.*?)(?=- \*\*Type\*\*|\Z)",
+    ],
+    "dropdown_manager": [
+        r"### \*\*Dropdown\*\*(.*?)(?=###|\Z)",
+    ],
+    "radio_checkbox_manager": [
+        r"### \*\*Radio Group\*\*(.*?)(?=###|\Z)",
+        r"### \*\*Checkbox Group\*\*(.*?)(?=###|\Z)",
+    ],
+    "panel_container_manager": [
+        r"## \*\*Panel/Container Structure\*\*(.*?)(?=##|\Z)",
+    ],
+    "css_selectors_manager": [
+        r"## \*\*Styling Fields\*\*(.*?)(?=###|\Z)",
+        r"### \*\*Styling based on Field Type\.\*\*(.*?)(?=###|\Z)",
+        r"### \*\*Styling specific field type\.\*\*(.*?)(?=###|\Z)",
+    ],
+    "file_attachment_manager": [
+        r"### \*\*File Attachment\*\*(.*?)(?=##|\Z)",
+    ],
+    "error_message_manager": [
+        r"## \*\*Styling Error Messages\*\*(.*?)(?=\+---|$)",
+        r"### Error Structure(.*?)(?=###|\Z)",
+        r"### Styling error message(.*?)(?=\+---|$)",
+    ],
+    "repeatable_panel_manager": [
+        r"## Repeatable Panel(.*?)(?=##|\Z)",
+    ],
+}
+
+# Added to every section of the extra copies, so clean_content has escaped
+# markdown and runs of blank lines to collapse in each one
+_FILLER = (
+    "\n\\*\\*Copy {copy}:\\*\\* wrapper classes \\- labels \\- descriptions "
+    "stay \\#{copy} in the generated markup.\n\n\n\n"
+    "\\`\\`\\`\n.copy-{copy}-wrapper input {{ color: inherit; }}\n\\`\\`\\`\n"
+)
+
+
+def doc_url(name: str) -> str:
+    """Return the fixture URL of a doc ("theme", "layout" or "component")."""
+    return f"{FIXTURE_BASE_URL}/{name}.md"
+
+
+def load_doc(name: str) -> str:
+    """Return the checked-in fixture of a doc."""
+    with open(
+        os.path.join(DOCS_DIR, f"{name}.md"), encoding="utf-8", newline=""
+    ) as handle:
+        return handle.read()
+
+
+def enlarge_document(content: str, factor: int) -> str:
+    """
+    Grow a document to roughly factor times its size.
+
+    Copy 1 is the document itself. Every further copy repeats it with a filler
+    paragraph after each heading, so the sections grow as well as multiply.
+
+    Args:
+        content (str): Document markdown
+        factor (int): Number of copies (1 returns content unchanged)
+
+    Returns:
+        str: The enlarged document
+    """
+    copies = [content]
+    for copy in range(2, factor + 1):
+        lines = []
+        for line in content.splitlines(keepends=True):
+            lines.append(line)
+            if line.startswith("#"):
+                lines.append(_FILLER.format(copy=copy))
+        copies.append("".join(lines))
+    return "\n".join(copies)
+
+
+def theme_index(content: str, url: Optional[str] = None) -> SectionIndex:
+    """Build the theme.md section index of content, as the managers see it."""
+    document = CachedDocument(url or doc_url("theme"), content)
+    return SectionIndex(
+        document.url, document.content, document.version, _COMPILED_SECTIONS
+    )
+
+
+def read_golden(name: str) -> str:
+    """Return a golden output file."""
+    with open(os.path.join(GOLDEN_DIR, name), encoding="utf-8", newline="") as handle:
+        return handle.read()
+
+
+def write_golden(name: str, text: str) -> None:
+    """Rewrite a golden output file (UPDATE_GOLDEN=1)."""
+    os.makedirs(GOLDEN_DIR, exist_ok=True)
+    with open(
+        os.path.join(GOLDEN_DIR, name), "w", encoding="utf-8", newline=""
+    ) as handle:
+        handle.write(text)
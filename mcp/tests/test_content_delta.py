@@ -0,0 +1,136 @@
+"""
+Tests for if_changed_since: an "unchanged" reply while the hash matches, only
+the changed and removed sections once the document changes, and the full
+response whenever the caller's copy is unknown.
+"""
+
+import json
+
+import pytest
+from doc_fixtures import doc_url, load_doc
+
+from forms_edge_delivery_mcp.managers import content_delta, response_cache
+from forms_edge_delivery_mcp.managers.content_delta import (
+    DELTA_MIN_BYTES,
+    document_sections,
+    versioned_response,
+)
+from forms_edge_delivery_mcp.managers.doc_cache import CachedDocument
+from forms_edge_delivery_mcp.managers.layout_manager import _build_layout_configuration
+from forms_edge_delivery_mcp.managers.section_index import SectionIndex
+from forms_edge_delivery_mcp.managers.shared_utils import create_success_response
+
+KEY = "test_delta"
+URL = "https://docs.example/delta.md"
+
+
+@pytest.fixture(autouse=True)
+def history():
+    # A response still cached from another test would skip recording its hashes
+    response_cache._responses.clear()
+    content_delta._history.clear()
+    yield
+    response_cache._responses.clear()
+    content_delta._history.clear()
+
+
+def _document(sections: dict) -> str:
+    body = "\n\n".join(f"## {title}\n\n{text}" for title, text in sections.items())
+    return f"# Delta\n\nIntro.\n\n{body}\n"
+
+
+def _paragraph(word: str) -> str:
+    return " ".join(f"{word}{n}" for n in range(300))
+
+
+SECTIONS = {"Alpha": _paragraph("a"), "Beta": _paragraph("b"), "Gamma": _paragraph("c")}
+
+
+def _call(content: str, if_changed_since=None, key: str = KEY) -> dict:
+    index = SectionIndex(URL, content, content_delta.content_hash(content))
+    response = versioned_response(
+        key,
+        index,
+        lambda: create_success_response(content),
+        lambda: document_sections(index),
+        "Delta",
+        if_changed_since,
+    )
+    return json.loads(response)
+
+
+def test_matching_hash_gets_unchanged():
+    content = _document(SECTIONS)
+    full = _call(content)
+    assert full["data"] == content and full["hash"]
+
+    reply = _call(content, full["hash"])
+    assert reply["unchanged"] is True and reply["data"] is None
+    assert (reply["hash"], reply["version"]) == (full["hash"], full["version"])
+
+
+def test_changed_section_is_sent_alone():
+    old = _call(_document(SECTIONS))
+    changed = dict(SECTIONS, Beta=_paragraph("new-b"))
+    reply = _call(_document(changed), old["hash"])
+
+    assert reply["delta"] == {
+        "since": old["hash"],
+        "changed": ["beta"],
+        "removed": [],
+        "unchanged_sections": 3,
+    }
+    assert reply["data"].startswith("# Delta (changed sections)")
+    assert "new-b0" in reply["data"] and "a0" not in reply["data"]
+    assert reply["hash"] == content_delta.content_hash(_document(changed))
+
+
+def test_removed_section_is_listed():
+    old = _call(_document(SECTIONS))
+    remaining = {title: text for title, text in SECTIONS.items() if title != "Gamma"}
+    reply = _call(_document(remaining), old["hash"])
+
+    assert reply["delta"]["removed"] == ["gamma"] and reply["delta"]["changed"] == []
+    assert reply["data"].endswith("*Removed sections: gamma*")
+
+
+def test_unknown_hash_gets_the_full_response():
+    content = _document(SECTIONS)
+    reply = _call(content, "0123456789abcdef")
+    assert (
+        reply["data"] == content and "delta" not in reply and "unchanged" not in reply
+    )
+
+
+def test_expired_hash_gets_the_full_response(monkeypatch):
+    monkeypatch.setattr(content_delta, "MAX_HISTORY", 1)
+    old = _call(_document(SECTIONS))
+    # Another response pushes the first one out of the history
+    _call(_document(SECTIONS), key="other")
+
+    content = _document(dict(SECTIONS, Beta=_paragraph("new-b")))
+    reply = _call(content, old["hash"])
+    assert reply["data"] == content and "delta" not in reply
+
+
+def test_small_response_is_sent_whole():
+    small = {"Alpha": "a", "Beta": "b"}
+    old = _call(_document(small))
+    content = _document(dict(small, Beta="changed"))
+    assert len(content) < DELTA_MIN_BYTES
+
+    reply = _call(content, old["hash"])
+    assert reply["data"] == content and "delta" not in reply
+
+
+def test_budgeted_call_ignores_if_changed_since():
+    document = CachedDocument(doc_url("layout"), load_doc("layout"))
+    full = json.loads(_build_layout_configuration(document))
+
+    page = json.loads(
+        _build_layout_configuration(
+            document, max_tokens=200, if_changed_since=full["hash"]
+        )
+    )
+    assert page["status"] == "success" and "unchanged" not in page
+    assert page["budget"]["tokens"] <= 200 and page["data"]
@@ -0,0 +1,201 @@
+"""
+Tests for the process-wide document cache: concurrent misses for one URL must
+share a single upstream request, whether it succeeds or fails, and expired
+entries move through stale-while-revalidate (hit, stale, miss) as documented.
+"""
+
+import asyncio
+import threading
+import time
+
+import pytest
+import requests
+from upstream_fixtures import FakeUpstream
+
+from forms_edge_delivery_mcp.managers.doc_cache import DocumentCache
+
+URL = "https://docs.example/theme.md"
+CALLERS = 16
+
+
+@pytest.fixture
+def upstream():
+    return FakeUpstream({URL: "# Theme\n\nBody\n"})
+
+
+def _cache(upstream: FakeUpstream, **options) -> DocumentCache:
+    options.setdefault("default_ttl", 300)
+    return DocumentCache(client=upstream, **options)
+
+
+def _get_concurrently(cache: DocumentCache, upstream: FakeUpstream):
+    """Call cache.get from CALLERS threads while the first upstream request is held."""
+    results, errors = [], []
+
+    def call():
+        try:
+            results.append(cache.get(URL))
+        except Exception as e:
+            errors.append(e)
+
+    upstream.release.clear()
+    threads = [threading.Thread(target=call) for _ in range(CALLERS)]
+    for thread in threads:
+        thread.start()
+    assert upstream.entered.wait(timeout=5)
+    # Let every other caller reach the cache and join the flight
+    while cache.coalesced < CALLERS - 1 and any(
+        thread.is_alive() for thread in threads
+    ):
+        threading.Event().wait(0.01)
+    upstream.release.set()
+    for thread in threads:
+        thread.join(timeout=5)
+    return results, errors
+
+
+def test_concurrent_misses_share_one_fetch(upstream):
+    cache = _cache(upstream)
+    results, errors = _get_concurrently(cache, upstream)
+
+    assert not errors
+    assert upstream.calls(URL) == 1
+    assert len(results) == CALLERS and len({id(document) for document in results}) == 1
+    assert cache.coalesced == CALLERS - 1
+    assert cache.stats()["in_flight"] == 0
+
+
+def test_concurrent_misses_share_one_error(upstream):
+    upstream.error = requests.exceptions.ConnectionError("upstream down")
+    cache = _cache(upstream)
+    results, errors = _get_concurrently(cache, upstream)
+
+    assert not results
+    assert len(errors) == CALLERS and all(error is upstream.error for error in errors)
+    assert upstream.calls(URL) == 1
+    assert cache.stats()["in_flight"] == 0
+
+    # The failed flight is retired, so the next lookup goes upstream again
+    upstream.error = None
+    assert cache.get(URL).content == upstream.bodies[URL]
+    assert upstream.calls(URL) == 2
+
+
+def test_async_misses_share_one_fetch(upstream):
+    cache = _cache(upstream)
+
+    async def main():
+        return await asyncio.gather(*(cache.get_async(URL) for _ in range(CALLERS)))
+
+    documents = asyncio.run(main())
+    assert upstream.calls(URL) == 1
+    assert len({id(document) for document in documents}) == 1
+
+
+def test_flight_is_retired_before_it_completes(upstream):
+    cache = _cache(upstream)
+    retired = []
+    join_flight = cache._join_flight
+
+    def join(url):
+        flight, leader = join_flight(url)
+        # Runs as the future completes: a caller arriving now must start a new flight
+        flight.add_done_callback(lambda _: retired.append(url not in cache._inflight))
+        return flight, leader
+
+    cache._join_flight = join
+    cache.get(URL)
+    upstream.error = requests.exceptions.ConnectionError("upstream down")
+    cache.invalidate()
+    with pytest.raises(requests.exceptions.ConnectionError):
+        cache.get(URL)
+    assert retired == [True, True]
+
+
+def _expire(cache: DocumentCache, seconds_ago: float) -> None:
+    cache.peek(URL).expires_at = time.time() - seconds_ago
+
+
+def _settle(cache: DocumentCache) -> None:
+    """Wait for background refreshes to finish."""
+    deadline = time.time() + 5
+    while cache.stats()["in_flight"] and time.time() < deadline:
+        time.sleep(0.01)
+    assert cache.stats()["in_flight"] == 0
+
+
+def test_fresh_entry_is_a_hit(upstream):
+    cache = _cache(upstream, stale_ttl=60)
+    cache.get(URL)
+    cache.get(URL)
+    assert (cache.misses, cache.hits, upstream.calls(URL)) == (1, 1, 1)
+
+
+def test_stale_entry_is_served_while_one_refresh_runs(upstream):
+    cache = _cache(upstream, stale_ttl=60)
+    first = cache.get(URL)
+    _expire(cache, 10)
+
+    upstream.release.clear()
+    upstream.entered.clear()
+    served = [cache.get(URL) for _ in range(5)]
+    assert upstream.entered.wait(timeout=5)
+    # Every lookup returned the stale copy at once; one refresh is in flight
+    assert all(document is first for document in served)
+    assert cache.stale_hits == 5 and cache.stats()["in_flight"] == 1
+    upstream.release.set()
+    _settle(cache)
+
+    assert upstream.calls(URL) == 2
+    assert cache.not_modified == 1 and cache.peek(URL).is_fresh()
+    cache.get(URL)
+    assert cache.hits == 1
+
+
+def test_stale_refresh_adopts_a_new_version(upstream):
+    cache = _cache(upstream, stale_ttl=60)
+    first = cache.get(URL)
+    _expire(cache, 10)
+    upstream.bodies[URL] = "# Theme\n\nUpdated\n"
+
+    assert cache.get(URL) is first
+    _settle(cache)
+    assert cache.get(URL).content == upstream.bodies[URL]
+
+
+def test_entry_past_the_stale_window_is_a_miss(upstream):
+    cache = _cache(upstream, stale_ttl=60)
+    cache.get(URL)
+    _expire(cache, 120)
+    upstream.bodies[URL] = "# Theme\n\nUpdated\n"
+
+    # Revalidated before returning, not served stale
+    assert cache.get(URL).content == upstream.bodies[URL]
+    assert (cache.misses, cache.stale_hits) == (2, 0)
+
+
+def test_failed_refresh_keeps_the_stale_copy_and_backs_off(upstream):
+    cache = _cache(upstream, stale_ttl=60, retry_interval=30)
+    first = cache.get(URL)
+    _expire(cache, 10)
+    upstream.error = requests.exceptions.ConnectionError("upstream down")
+
+    assert cache.get(URL) is first
+    _settle(cache)
+    assert first.last_error == "upstream down" and cache.refresh_errors == 1
+
+    # Backing off: served stale without another upstream request
+    for _ in range(3):
+        assert cache.get(URL) is first
+    assert upstream.calls(URL) == 2
+
+
+def test_upstream_error_past_the_stale_window_falls_back(upstream):
+    cache = _cache(upstream, stale_ttl=60)
+    first = cache.get(URL)
+    _expire(cache, 3600)
+    upstream.error = requests.exceptions.ConnectionError("upstream down")
+
+    # The lookup waited for upstream and only then fell back to the old copy
+    assert cache.get(URL) is first
+    assert cache.misses == 2 and first.last_error == "upstream down"
@@ -0,0 +1,97 @@
+"""
+Tests for paginated documentation resources: pages are contiguous runs of
+whole sections, offsets map to the page holding them, and page numbers outside
+the document are rejected.
+"""
+
+import pytest
+from doc_fixtures import doc_url, enlarge_document, load_doc
+
+from forms_edge_delivery_mcp.config import DOC_PAGE_CONFIG
+from forms_edge_delivery_mcp.managers.doc_pages import (
+    RESOURCE_PREFIX,
+    _page_payload,
+    document_pages,
+    parse_doc_uri,
+    read_doc_page,
+)
+from forms_edge_delivery_mcp.managers.section_index import SectionIndex
+
+PAGE_TOKENS = 300
+
+
+@pytest.fixture
+def index(monkeypatch):
+    monkeypatch.setitem(DOC_PAGE_CONFIG, "page_tokens", PAGE_TOKENS)
+    return SectionIndex(
+        doc_url("layout"), enlarge_document(load_doc("layout"), 3), "v1"
+    )
+
+
+def _all_pages(index):
+    pages, page = [], 1
+    while True:
+        payload = _page_payload("layout", index, page, None)
+        pages.append(payload)
+        if payload["next"] is None:
+            return pages
+        assert payload["next"] == f"{RESOURCE_PREFIX}layout?page={page + 1}"
+        page = parse_doc_uri(payload["next"][len(RESOURCE_PREFIX) :])["page"]
+
+
+def test_pages_reproduce_the_document(index):
+    pages = _all_pages(index)
+    assert len(pages) > 2
+    assert [page["page"] for page in pages] == list(range(1, len(pages) + 1))
+    assert all(page["pages"] == len(pages) for page in pages)
+    assert "".join(page["content"] for page in pages) == index.content
+    for previous, page in zip(pages, pages[1:]):
+        assert previous["end_offset"] == page["offset"]
+        # Pages start on a heading
+        assert page["content"].startswith("#")
+
+
+def test_pages_stay_near_the_token_target(index):
+    for page in document_pages(index, PAGE_TOKENS):
+        assert page.tokens <= PAGE_TOKENS or len(page.sections) == 1
+
+
+def test_default_page_is_the_first(index):
+    assert _page_payload("layout", index, None, None)["page"] == 1
+
+
+def test_offset_selects_the_page_holding_it(index):
+    for page in _all_pages(index):
+        for offset in (page["offset"], page["end_offset"] - 1):
+            assert _page_payload("layout", index, None, offset)["page"] == page["page"]
+    # An offset wins over a page number
+    assert _page_payload("layout", index, 1, len(index.content) - 1)["next"] is None
+
+
+@pytest.mark.parametrize("page", [0, -1, 10_000])
+def test_pages_outside_the_document_are_rejected(index, page):
+    with pytest.raises(ValueError, match="page must be between 1 and"):
+        _page_payload("layout", index, page, None)
+
+
+@pytest.mark.parametrize("offset", [-1, 10_000_000])
+def test_offsets_outside_the_document_are_rejected(index, offset):
+    with pytest.raises(ValueError, match="offset must be between 0 and"):
+        _page_payload("layout", index, None, offset)
+
+
+def test_resource_uris_are_parsed():
+    assert parse_doc_uri("layout") == {"doc": "layout"}
+    assert parse_doc_uri("theme?page=2") == {"doc": "theme", "page": 2}
+    assert parse_doc_uri("theme?offset=5000&page=1") == {
+        "doc": "theme",
+        "page": 1,
+        "offset": 5000,
+    }
+    with pytest.raises(ValueError, match="page must be a number"):
+        parse_doc_uri("theme?page=two")
+
+
+def test_unknown_document_is_rejected_before_fetching():
+    with pytest.raises(ValueError, match="Unknown document 'styles'"):
+        read_doc_page("styles")
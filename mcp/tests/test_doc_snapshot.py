@@ -0,0 +1,84 @@
+"""
+Tests for the on-disk documentation snapshot: a loaded document keeps the
+expiry it had when it was fetched, so an old snapshot is revalidated, and
+worker processes sharing the directory keep each other's manifest entries.
+"""
+
+import multiprocessing
+import sys
+import time
+
+import pytest
+
+from forms_edge_delivery_mcp.config import DOCS_URLS, SNAPSHOT_CONFIG
+from forms_edge_delivery_mcp.managers.doc_cache import CachedDocument, DocumentCache
+from forms_edge_delivery_mcp.managers.doc_snapshot import (
+    load_snapshot,
+    read_manifest,
+    save_document,
+)
+
+TTL = 300
+
+
+def _snapshot(directory, age: float) -> None:
+    for url in DOCS_URLS.values():
+        save_document(
+            CachedDocument(url, f"# {url}\n", fetched_at=time.time() - age),
+            str(directory),
+        )
+
+
+def test_recent_snapshot_is_fresh(tmp_path):
+    _snapshot(tmp_path, age=10)
+    cache = DocumentCache(TTL)
+    assert load_snapshot(cache, str(tmp_path)) == len(DOCS_URLS)
+    document = cache.peek(DOCS_URLS["theme"])
+    assert document.is_fresh()
+    assert abs(document.expires_at - (document.fetched_at + TTL)) < 1e-6
+
+
+def test_old_snapshot_is_expired(tmp_path):
+    _snapshot(tmp_path, age=7 * 86400)
+    cache = DocumentCache(TTL)
+    load_snapshot(cache, str(tmp_path))
+    assert not cache.peek(DOCS_URLS["theme"]).is_fresh()
+
+
+def test_tampered_snapshot_is_skipped(tmp_path):
+    _snapshot(tmp_path, age=10)
+    (tmp_path / "theme.md").write_text("# Edited by hand\n", encoding="utf-8")
+    cache = DocumentCache(TTL)
+    assert load_snapshot(cache, str(tmp_path)) == len(DOCS_URLS) - 1
+    assert cache.peek(DOCS_URLS["theme"]) is None
+
+
+def test_default_directory_is_outside_the_package():
+    import forms_edge_delivery_mcp
+
+    package_dir = forms_edge_delivery_mcp.__path__[0]
+    assert not SNAPSHOT_CONFIG["directory"].startswith(package_dir)
+
+
+def _save_repeatedly(url: str, directory: str, rounds: int) -> None:
+    for number in range(rounds):
+        save_document(CachedDocument(url, f"# {url} {number}\n"), directory)
+
+
+@pytest.mark.skipif(
+    sys.platform == "win32", reason="the manifest file lock needs fcntl"
+)
+def test_workers_do_not_drop_manifest_entries(tmp_path):
+    context = multiprocessing.get_context("spawn")
+    workers = [
+        context.Process(target=_save_repeatedly, args=(url, str(tmp_path), 40))
+        for url in DOCS_URLS.values()
+    ]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join(timeout=60)
+        assert worker.exitcode == 0
+
+    assert sorted(read_manifest(str(tmp_path))["documents"]) == sorted(DOCS_URLS)
+    assert load_snapshot(DocumentCache(TTL), str(tmp_path)) == len(DOCS_URLS)
@@ -0,0 +1,128 @@
+"""
+Tests for the shared document store of multi-worker HTTP mode. Each "worker"
+is a separate store handle (own SQLite connection) on one temporary file.
+"""
+
+import threading
+import time
+
+import pytest
+from upstream_fixtures import FakeUpstream
+
+from forms_edge_delivery_mcp.managers.doc_cache import CachedDocument, DocumentCache
+from forms_edge_delivery_mcp.managers.doc_refresher import DocumentRefresher
+from forms_edge_delivery_mcp.managers.doc_store import (
+    REFRESHER_LEASE,
+    SharedDocumentStore,
+)
+
+URL = "https://docs.example/theme.md"
+TTL = 300
+
+
+@pytest.fixture
+def path(tmp_path):
+    return str(tmp_path / "docs.sqlite")
+
+
+@pytest.fixture
+def upstream():
+    return FakeUpstream({URL: "# Theme\n\nBody\n"})
+
+
+def _worker(path: str, owner: str, upstream: FakeUpstream, wait: float = 5.0):
+    """Return (cache, refresher) of one worker sharing the store at path."""
+    store = SharedDocumentStore(path)
+    cache = DocumentCache(TTL, client=upstream)
+    cache.attach_store(store, owner, wait)
+    refresher = DocumentRefresher(cache, [URL], interval=1, lease_ttl=30)
+    refresher.attach_store(store, owner)
+    return cache, refresher
+
+
+def test_lease_is_held_by_one_worker(path):
+    first, second = SharedDocumentStore(path), SharedDocumentStore(path)
+    assert first.acquire_lease(REFRESHER_LEASE, "a", 30)
+    assert not second.acquire_lease(REFRESHER_LEASE, "b", 30)
+    # Renewal by the holder succeeds
+    assert first.acquire_lease(REFRESHER_LEASE, "a", 30)
+    assert second.lease_holder(REFRESHER_LEASE) == "a"
+
+
+def test_expired_lease_is_taken_over(path):
+    first, second = SharedDocumentStore(path), SharedDocumentStore(path)
+    assert first.acquire_lease(REFRESHER_LEASE, "a", 0.2)
+    assert not second.acquire_lease(REFRESHER_LEASE, "b", 30)
+    time.sleep(0.3)
+    assert second.lease_holder(REFRESHER_LEASE) is None
+    assert second.acquire_lease(REFRESHER_LEASE, "b", 30)
+    assert not first.acquire_lease(REFRESHER_LEASE, "a", 30)
+
+
+def test_released_lease_is_handed_over_at_once(path, upstream):
+    _, leader = _worker(path, "a", upstream)
+    _, follower = _worker(path, "b", upstream)
+    assert leader._elect() and not follower._elect()
+
+    leader.stop()
+    assert not leader.leader
+    assert follower._elect() and follower.leader
+
+
+def test_follower_adopts_what_the_leader_publishes(path, upstream):
+    leader_cache, leader = _worker(path, "a", upstream)
+    follower_cache, follower = _worker(path, "b", upstream)
+    leader.run_once()
+    follower.run_once()
+
+    assert leader.leader and not follower.leader
+    assert follower_cache.peek(URL).version == leader_cache.peek(URL).version
+    assert upstream.calls(URL) == 1
+
+
+def test_cold_follower_waits_for_the_leader(path, upstream):
+    leader_cache, leader = _worker(path, "a", upstream)
+    follower_cache, follower = _worker(path, "b", upstream)
+    assert leader._elect() and not follower._elect()
+
+    # The leader publishes while the follower's lookup is already waiting
+    publisher = threading.Timer(0.3, leader_cache.refresh, args=(URL,))
+    publisher.start()
+    document = follower_cache.get(URL)
+    publisher.join()
+
+    assert document.content == upstream.bodies[URL]
+    assert upstream.calls(URL) == 1 and follower_cache.adopted == 1
+
+
+def test_cold_follower_falls_back_after_the_wait(path, upstream):
+    _, leader = _worker(path, "a", upstream)
+    follower_cache, follower = _worker(path, "b", upstream, wait=0.3)
+    assert leader._elect() and not follower._elect()
+
+    start = time.monotonic()
+    follower_cache.get(URL)
+    assert time.monotonic() - start >= 0.3
+    assert upstream.calls(URL) == 1 and follower_cache.adopted == 0
+
+
+def test_without_a_live_leader_nobody_waits(path, upstream):
+    cache, _ = _worker(path, "b", upstream)
+    start = time.monotonic()
+    cache.get(URL)
+    assert time.monotonic() - start < 1
+    assert upstream.calls(URL) == 1
+
+
+def test_published_document_round_trips(path):
+    first, second = SharedDocumentStore(path), SharedDocumentStore(path)
+    document = CachedDocument(
+        URL, "# Theme\n", etag='"1"', expires_at=time.time() + TTL
+    )
+    first.publish(document)
+    loaded = second.load(URL)
+    assert (loaded.version, loaded.etag, loaded.expires_at) == (
+        document.version,
+        '"1"',
+        document.expires_at,
+    )
@@ -0,0 +1,150 @@
+"""
+Golden-output tests for documentation extraction.
+
+Every theme manager must return byte-for-byte what extract_content_patterns
+returned with the manager's original regexes, on the checked-in docs and on
+enlarged copies of them. Golden files under fixtures/golden hold the expected
+output for the checked-in docs. They are written by the reference extractor,
+never by the code under test. To regenerate them after changing a fixture doc:
+
+    UPDATE_GOLDEN=1 python -m pytest tests/test_extraction_golden.py
+"""
+
+import importlib
+import json
+import os
+
+import pytest
+from doc_fixtures import (
+    LEGACY_PATTERNS,
+    doc_url,
+    enlarge_document,
+    load_doc,
+    read_golden,
+    theme_index,
+    write_golden,
+)
+
+from forms_edge_delivery_mcp.managers.response_stream import document_events
+from forms_edge_delivery_mcp.managers.section_index import SectionIndex
+from forms_edge_delivery_mcp.managers.shared_utils import (
+    clean_content,
+    extract_content_patterns,
+)
+from forms_edge_delivery_mcp.managers.styling_bundle_manager import (
+    BUNDLE_COMPONENTS,
+    _bundle_parts,
+)
+
+UPDATE_GOLDEN = os.getenv("UPDATE_GOLDEN") == "1"
+
+# Sizes the equivalence is checked at, as multiples of the checked-in theme.md
+SCALE_FACTORS = [1, 3, 10]
+
+# Theme managers: manager module -> function rendering its full response
+THEME_RENDERERS = {
+    "css_selectors_manager": "_render_css_selectors_guide",
+    "dropdown_manager": "_render_dropdown_styling",
+    "error_message_manager": "_render_error_message_styling",
+    "field_structure_manager": "_render_field_structure_styling",
+    "file_attachment_manager": "_render_file_attachment_styling",
+    "panel_container_manager": "_render_panel_container_styling",
+    "radio_checkbox_manager": "_render_radio_checkbox_styling",
+    "repeatable_panel_manager": "_render_repeatable_panel_styling",
+}
+
+# Whole-document managers: doc name -> (manager module, function rendering its response)
+DOCUMENT_MANAGERS = {
+    "layout": ("layout_manager", "_render_layout_configuration"),
+    "component": ("custom_component_manager", "_render_custom_component_creation"),
+}
+
+
+def _manager(name: str):
+    return importlib.import_module(f"forms_edge_delivery_mcp.managers.{name}")
+
+
+def _reference(content: str, manager: str) -> str:
+    module = _manager(manager)
+    return extract_content_patterns(
+        content, LEGACY_PATTERNS[manager], doc_url("theme"), module.SECTION_TITLE
+    )
+
+
+def _check_golden(name: str, expected: str) -> None:
+    if UPDATE_GOLDEN:
+        write_golden(name, expected)
+    assert (
+        read_golden(name) == expected
+    ), f"{name} is out of date; rerun with UPDATE_GOLDEN=1"
+
+
+@pytest.mark.parametrize("manager", sorted(LEGACY_PATTERNS))
+def test_reference_matches_golden(manager):
+    reference = _reference(load_doc("theme"), manager)
+    assert reference is not None, "fixture theme.md lacks the manager's sections"
+    _check_golden(f"{manager}.md", reference)
+
+
+@pytest.mark.parametrize("factor", SCALE_FACTORS)
+@pytest.mark.parametrize("manager", sorted(LEGACY_PATTERNS))
+def test_section_index_matches_reference(manager, factor):
+    content = enlarge_document(load_doc("theme"), factor)
+    module = _manager(manager)
+    rendered = theme_index(content).render(module.SECTION_KEYS, module.SECTION_TITLE)
+    assert rendered == _reference(content, manager)
+
+
+def test_every_theme_manager_has_a_renderer():
+    assert sorted(THEME_RENDERERS) == sorted(LEGACY_PATTERNS)
+
+
+@pytest.mark.parametrize("manager", sorted(THEME_RENDERERS))
+def test_manager_response_matches_golden(manager):
+    render = getattr(_manager(manager), THEME_RENDERERS[manager])
+    payload = json.loads(render(theme_index(load_doc("theme"))))
+    assert payload["status"] == "success"
+    assert payload["data"] == read_golden(f"{manager}.md")
+
+
+def test_missing_sections_render_none():
+    index = theme_index("# Adaptive Form Theme\n\nNothing documented yet.\n")
+    for manager in LEGACY_PATTERNS:
+        module = _manager(manager)
+        assert index.render(module.SECTION_KEYS, module.SECTION_TITLE) is None
+        assert _reference(index.content, manager) is None
+
+
+def test_bundle_parts_match_reference_sections():
+    index = theme_index(load_doc("theme"))
+    parts = dict(_bundle_parts(index, list(BUNDLE_COMPONENTS)))
+    for name, (module, _) in BUNDLE_COMPONENTS.items():
+        reference = _reference(index.content, module.__name__.rsplit(".", 1)[1])
+        body = reference.split("\n\n---\n\n*Information from")[0]
+        # The bundle drops fragments another component already sent, never adds any
+        for fragment in parts[name].split("\n\n---\n\n")[1:]:
+            assert fragment in body
+
+
+@pytest.mark.parametrize("doc", sorted(DOCUMENT_MANAGERS))
+def test_document_manager_matches_golden(doc):
+    manager, renderer = DOCUMENT_MANAGERS[doc]
+    module = _manager(manager)
+    content = load_doc(doc)
+    payload = json.loads(getattr(module, renderer)(content, doc_url(doc)))
+    _check_golden(f"{manager}.md", payload["data"])
+
+    # Streamed chunks join into exactly the JSON data
+    index = SectionIndex(doc_url(doc), content, "fixture")
+    events = document_events(
+        index, module.DOC_TITLE, module._footer(index.url), lambda: ""
+    )
+    chunks = [data["text"] for event, data in events if event == "chunk"]
+    assert "".join(chunks) == payload["data"]
+
+
+@pytest.mark.parametrize("factor", SCALE_FACTORS)
+def test_clean_content_is_idempotent(factor):
+    cleaned = clean_content(enlarge_document(load_doc("theme"), factor))
+    assert clean_content(cleaned) == cleaned
+    assert "\\*\\*" not in cleaned and "\n\n\n" not in cleaned
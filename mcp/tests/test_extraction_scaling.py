@@ -0,0 +1,60 @@
+"""
+Scaling guards for documentation extraction.
+
+Building the section index, rendering from it and cleaning content must grow
+linearly with the document. The checks compare tracemalloc peaks, which are
+deterministic, so they catch quadratic behaviour regardless of machine load.
+Timing is left to benchmarks/extraction_benchmark.py, which fails when time
+per byte grows past --max-scaling.
+"""
+
+import tracemalloc
+
+import pytest
+from doc_fixtures import enlarge_document, load_doc, theme_index
+
+from forms_edge_delivery_mcp.managers import css_selectors_manager
+from forms_edge_delivery_mcp.managers.shared_utils import clean_content
+
+# Enlargement factors compared; the input grows about 10x between them
+SMALL, LARGE = 2, 20
+
+
+def _peak_kib(function) -> float:
+    tracemalloc.start()
+    try:
+        function()
+        return tracemalloc.get_traced_memory()[1] / 1024
+    finally:
+        tracemalloc.stop()
+
+
+def _render(content: str) -> str:
+    index = theme_index(content)
+    return index.render(
+        css_selectors_manager.SECTION_KEYS, css_selectors_manager.SECTION_TITLE
+    )
+
+
+OPERATIONS = {
+    "index-build": theme_index,
+    "index-render": _render,
+    "clean-content": clean_content,
+}
+
+
+@pytest.fixture(scope="module")
+def documents():
+    theme = load_doc("theme")
+    small, large = enlarge_document(theme, SMALL), enlarge_document(theme, LARGE)
+    return small, large, len(large) / len(small)
+
+
+@pytest.mark.parametrize("operation", sorted(OPERATIONS))
+def test_peak_memory_is_linear(documents, operation):
+    small, large, growth = documents
+    function = OPERATIONS[operation]
+    ratio = _peak_kib(lambda: function(large)) / _peak_kib(lambda: function(small))
+    assert (
+        ratio < 2 * growth
+    ), f"{operation}: peak memory grew {ratio:.1f}x for {growth:.1f}x input"
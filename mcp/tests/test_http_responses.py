@@ -0,0 +1,136 @@
+"""
+Tests for HTTP caching of prepared responses: conditional GETs, ETag matching,
+a validator per content coding, and a max-age that follows the source
+document's remaining TTL.
+"""
+
+import gzip
+import time
+
+import pytest
+from fastapi import FastAPI, Request
+from fastapi.testclient import TestClient
+
+from forms_edge_delivery_mcp.http_responses import (
+    cache_max_age,
+    etag_matches,
+    json_response,
+)
+from forms_edge_delivery_mcp.managers.doc_cache import CachedDocument, document_cache
+from forms_edge_delivery_mcp.managers.response_cache import PreparedResponse
+from forms_edge_delivery_mcp.managers.shared_utils import create_error_response
+
+URL = "https://docs.example/http.md"
+BODY = '{"status": "success", "data": "' + "wrapper " * 400 + '", "errorMessage": null}'
+
+
+@pytest.fixture
+def document():
+    document = CachedDocument(URL, "# Doc\n", expires_at=time.time() + 120)
+    document_cache.put(document)
+    yield document
+    document_cache.invalidate(URL)
+
+
+@pytest.fixture
+def prepared(document):
+    response = PreparedResponse(BODY, document.version, URL)
+    response.precompress()
+    return response
+
+
+@pytest.fixture
+def client(prepared):
+    app = FastAPI()
+
+    @app.api_route("/doc", methods=["GET", "POST"])
+    async def doc(request: Request):
+        return json_response(request, prepared)
+
+    @app.get("/error")
+    async def error(request: Request):
+        return json_response(request, create_error_response("nope"))
+
+    return TestClient(app)
+
+
+@pytest.mark.parametrize(
+    "header, matches",
+    [
+        ('"abc"', True),
+        ('W/"abc"', True),
+        ('"x", "abc"', True),
+        ('"x",W/"abc" ', True),
+        ("*", True),
+        ('"abcd"', False),
+        ('"x", "y"', False),
+        ("", False),
+        (None, False),
+    ],
+)
+def test_etag_matching(header, matches):
+    assert etag_matches(header, '"abc"') is matches
+
+
+def test_current_if_none_match_gets_304(client, prepared):
+    first = client.get("/doc", headers={"Accept-Encoding": "identity"})
+    assert first.status_code == 200 and first.headers["etag"] == prepared.etag
+
+    again = client.get(
+        "/doc",
+        headers={
+            "Accept-Encoding": "identity",
+            "If-None-Match": f'W/"old", {prepared.etag}',
+        },
+    )
+    assert again.status_code == 304 and again.content == b""
+    assert again.headers["etag"] == prepared.etag
+
+    stale = client.get(
+        "/doc", headers={"Accept-Encoding": "identity", "If-None-Match": '"old"'}
+    )
+    assert stale.status_code == 200
+
+
+def test_each_encoding_has_its_own_etag(client, prepared):
+    plain = client.get("/doc", headers={"Accept-Encoding": "identity"})
+    gzipped = client.get("/doc", headers={"Accept-Encoding": "gzip"})
+
+    assert plain.headers["vary"] == gzipped.headers["vary"] == "Accept-Encoding"
+    assert "content-encoding" not in plain.headers
+    assert gzipped.headers["content-encoding"] == "gzip"
+    assert (
+        gzipped.headers["etag"]
+        == prepared.encoded_etag("gzip")
+        != plain.headers["etag"]
+    )
+    assert plain.content == gzipped.content == prepared.body
+
+    # The identity validator does not revalidate the gzip variant
+    cross = client.get(
+        "/doc",
+        headers={"Accept-Encoding": "gzip", "If-None-Match": plain.headers["etag"]},
+    )
+    assert cross.status_code == 200
+    assert gzip.decompress(prepared.encoded("gzip")) == prepared.body
+
+
+def test_max_age_follows_the_remaining_ttl(client, prepared, document):
+    max_age = cache_max_age(prepared)
+    assert 115 <= max_age <= 120
+    cache_control = client.get("/doc").headers["cache-control"]
+    assert cache_control.startswith("public, max-age=")
+    assert abs(int(cache_control.split("max-age=")[1].split(",")[0]) - max_age) <= 1
+
+    document.expires_at = time.time() + 30
+    assert 25 <= cache_max_age(prepared) <= 30
+    document.expires_at = time.time() - 30
+    assert cache_max_age(prepared) == 0
+    document_cache.invalidate(URL)
+    assert cache_max_age(prepared) == 0
+
+
+def test_post_and_error_responses_are_not_cached(client):
+    assert client.post("/doc").headers["cache-control"] == "no-cache"
+    error = client.get("/error")
+    assert error.headers["cache-control"] == "no-store" and "etag" not in error.headers
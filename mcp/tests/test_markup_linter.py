@@ -0,0 +1,139 @@
+"""
+Tests for the bulk markup linter: remote callers stay inside the lint root,
+requested workers are capped, pooled runs match inline ones, and the listed
+violations follow max_violations.
+"""
+
+import asyncio
+import json
+
+import pytest
+from doc_fixtures import load_doc, theme_index
+
+from forms_edge_delivery_mcp.config import LINT_CONFIG
+from forms_edge_delivery_mcp.managers import markup_lint_manager
+from forms_edge_delivery_mcp.managers.markup_linter import (
+    LintRun,
+    compile_rules,
+    resolve_lint_path,
+)
+
+VALID = (
+    '<div class="text-wrapper field-name field-wrapper" data-required="true">\n'
+    '  <label for="name" class="field-label">Name</label>\n'
+    '  <input type="text" id="name" name="name" aria-describedby="name-description">\n'
+    '  <div class="field-description" id="name-description" aria-live="polite">Your name</div>\n'
+    "</div>\n"
+)
+INVALID = '<div class="text-wrapper"><input type="text" id="age"></div>\n'
+
+
+@pytest.fixture(scope="module")
+def rules():
+    return compile_rules(theme_index(load_doc("theme")))
+
+
+@pytest.fixture
+def markup(tmp_path):
+    for number in range(6):
+        (tmp_path / f"form{number}.html").write_text(
+            VALID if number % 2 else INVALID, encoding="utf-8"
+        )
+    return tmp_path
+
+
+def test_remote_paths_need_a_lint_root(monkeypatch, markup):
+    monkeypatch.setitem(LINT_CONFIG, "root", None)
+    with pytest.raises(ValueError, match="MCP_LINT_ROOT"):
+        resolve_lint_path(str(markup))
+
+
+def test_remote_paths_stay_inside_the_lint_root(monkeypatch, markup):
+    monkeypatch.setitem(LINT_CONFIG, "root", str(markup))
+    assert resolve_lint_path("form1.html") == str((markup / "form1.html").resolve())
+    for outside in ("..", "/etc/passwd", "../" + markup.name + "-other"):
+        with pytest.raises(ValueError, match="outside the lint root"):
+            resolve_lint_path(outside)
+
+
+def test_requested_workers_are_capped(monkeypatch, rules):
+    monkeypatch.setitem(LINT_CONFIG, "workers", 2)
+    assert LintRun(rules, 64).workers == 2
+    assert LintRun(rules, 1).workers == 1
+    assert LintRun(rules).workers == 2
+
+
+def test_pooled_async_run_matches_inline_run(monkeypatch, rules, markup):
+    monkeypatch.setitem(LINT_CONFIG, "workers", 2)
+    inline = LintRun(rules, 1)
+    expected = list(inline.results(str(markup)))
+
+    pooled = LintRun(rules, 2, batch_size=1)
+
+    async def collect():
+        return [result async for result in pooled.results_async(str(markup))]
+
+    assert asyncio.run(collect()) == expected
+    assert pooled.summary()["violations"] == inline.summary()["violations"] > 0
+    with pooled._pool() as pool:
+        assert pool._mp_context.get_start_method() == "spawn"
+
+
+def test_single_batch_is_linted_without_a_pool(monkeypatch, rules, markup):
+    monkeypatch.setitem(LINT_CONFIG, "workers", 4)
+    run = LintRun(rules, 4, batch_size=64)
+
+    def no_pool():
+        raise AssertionError("a single batch must not start a process pool")
+
+    monkeypatch.setattr(run, "_pool", no_pool)
+
+    async def collect():
+        return [result async for result in run.results_async(str(markup))]
+
+    assert len(asyncio.run(collect())) == 6
+    assert run.summary()["files"] == 6
+
+
+@pytest.fixture
+def lint(monkeypatch, rules, markup):
+    """Call the lint tool (sync and async) on the markup directory."""
+    index = theme_index(load_doc("theme"))
+    monkeypatch.setitem(LINT_CONFIG, "root", str(markup))
+    monkeypatch.setattr(markup_lint_manager, "get_theme_index", lambda: index)
+
+    async def get_theme_index_async():
+        return index
+
+    monkeypatch.setattr(
+        markup_lint_manager, "get_theme_index_async", get_theme_index_async
+    )
+
+    def call(max_violations):
+        payload = json.loads(
+            markup_lint_manager.lint_form_markup(".", 1, max_violations)
+        )
+        async_payload = json.loads(
+            asyncio.run(
+                markup_lint_manager.lint_form_markup_async(".", 1, max_violations)
+            )
+        )
+        return payload, async_payload
+
+    return call
+
+
+@pytest.mark.parametrize("max_violations, listed", [(0, 0), (1, 1), (None, None)])
+def test_max_violations_limits_the_list(lint, max_violations, listed):
+    for payload in lint(max_violations):
+        data = json.loads(payload["data"])
+        total = data["summary"]["violations"]
+        assert total > 1
+        assert len(data["violations"]) == (total if listed is None else listed)
+        assert data["truncated"] is (listed is not None)
+
+
+def test_negative_max_violations_is_rejected(lint):
+    for payload in lint(-1):
+        assert payload["status"] == "failure"
+        assert payload["errorMessage"] == "max_violations must not be negative"
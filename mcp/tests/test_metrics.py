@@ -0,0 +1,177 @@
+"""
+Tests for the metrics registry: Prometheus text output (label escaping,
+histogram buckets) and the per-tool outcome recorded by track_tool.
+"""
+
+import asyncio
+import re
+
+import pytest
+
+from forms_edge_delivery_mcp.managers.metrics import (
+    TOOL_CALLS,
+    TOOL_DURATION,
+    TOOLS_IN_FLIGHT,
+    MetricsRegistry,
+    track_tool,
+)
+from forms_edge_delivery_mcp.managers.shared_utils import (
+    create_error_response,
+    create_success_response,
+)
+
+_SAMPLE_RE = re.compile(r"^([a-zA-Z_:][a-zA-Z0-9_:]*)(?:\{(.*)\})? (\S+)$")
+_LABEL_RE = re.compile(r'([a-zA-Z_][a-zA-Z0-9_]*)="((?:[^"\\]|\\.)*)"(?:,|$)')
+_UNESCAPE = {"\\\\": "\\", '\\"': '"', "\\n": "\n"}
+
+
+def _parse(text: str) -> list:
+    """Parse Prometheus text into (name, labels, value), failing on any malformed line."""
+    assert text.endswith("\n")
+    samples = []
+    for line in text.splitlines():
+        if line.startswith("# "):
+            assert re.match(r"^# (HELP|TYPE) [a-zA-Z_:][a-zA-Z0-9_:]* \S", line), line
+            continue
+        match = _SAMPLE_RE.match(line)
+        assert match, line
+        name, label_text, value = match.groups()
+        labels = {}
+        if label_text:
+            pairs = _LABEL_RE.findall(label_text)
+            assert ",".join(f'{k}="{v}"' for k, v in pairs) == label_text, line
+            labels = {
+                key: re.sub(r"\\.", lambda m: _UNESCAPE[m.group()], raw)
+                for key, raw in pairs
+            }
+        samples.append((name, labels, float(value)))
+    return samples
+
+
+def test_label_values_and_help_are_escaped():
+    registry = MetricsRegistry()
+    calls = registry.counter("calls_total", "Calls\nby path \\ kind", ["path"])
+    tricky = 'a "quoted" \\ value\nwith a newline'
+    calls.inc(path=tricky)
+    calls.inc(2, path="plain")
+
+    text = registry.render_prometheus()
+    assert "# HELP calls_total Calls\\nby path \\\\ kind\n" in text
+    assert sorted(_parse(text), key=lambda sample: sample[2]) == [
+        ("calls_total", {"path": tricky}, 1.0),
+        ("calls_total", {"path": "plain"}, 2.0),
+    ]
+
+
+def test_histogram_buckets_are_cumulative_and_ordered():
+    registry = MetricsRegistry()
+    latency = registry.histogram(
+        "latency_seconds", "Latency", ["op"], buckets=(1, 0.1, 0.5)
+    )
+    for value in (0.05, 0.3, 0.3, 0.7, 4.0):
+        latency.observe(value, op="read")
+
+    samples = _parse(registry.render_prometheus())
+    buckets = [
+        (labels["le"], value)
+        for name, labels, value in samples
+        if name == "latency_seconds_bucket"
+    ]
+    assert buckets == [("0.1", 1), ("0.5", 3), ("1.0", 4), ("+Inf", 5)]
+    assert all(
+        labels == {"op": "read"}
+        for name, labels, _ in samples
+        if name != "latency_seconds_bucket"
+    )
+    totals = {
+        name: value for name, _, value in samples if name != "latency_seconds_bucket"
+    }
+    assert totals == {
+        "latency_seconds_sum": pytest.approx(5.35),
+        "latency_seconds_count": 5,
+    }
+
+
+def test_collectors_are_rendered_and_broken_ones_skipped():
+    registry = MetricsRegistry()
+    registry.register_collector(
+        lambda: [("cache_entries", "gauge", "Entries", [({"cache": "docs"}, 3)])]
+    )
+
+    def broken():
+        raise RuntimeError("collector failed")
+
+    registry.register_collector(broken)
+    assert _parse(registry.render_prometheus()) == [
+        ("cache_entries", {"cache": "docs"}, 3.0)
+    ]
+    assert registry.snapshot()["cache_entries"]["samples"] == [
+        {"labels": {"cache": "docs"}, "value": 3}
+    ]
+
+
+def test_labels_and_types_are_checked():
+    registry = MetricsRegistry()
+    calls = registry.counter("calls_total", "Calls", ["tool"])
+    assert registry.counter("calls_total", "Calls", ["tool"]) is calls
+    with pytest.raises(ValueError, match="expects labels"):
+        calls.inc(status="ok")
+    with pytest.raises(ValueError, match="already registered as a counter"):
+        registry.gauge("calls_total", "Calls")
+
+
+def _outcomes(tool: str) -> dict:
+    return {
+        labels["status"]: value
+        for labels, value in TOOL_CALLS.samples()
+        if labels["tool"] == tool
+    }
+
+
+def _observed(tool: str) -> int:
+    return sum(
+        state["count"]
+        for labels, state in TOOL_DURATION.samples()
+        if labels["tool"] == tool
+    )
+
+
+def _in_flight(tool: str) -> float:
+    return sum(
+        value for labels, value in TOOLS_IN_FLIGHT.samples() if labels["tool"] == tool
+    )
+
+
+def test_track_tool_records_outcomes():
+    @track_tool
+    def metrics_test_tool(fail: bool, raise_error: bool = False) -> str:
+        if raise_error:
+            raise RuntimeError("boom")
+        return create_error_response("no") if fail else create_success_response("ok")
+
+    metrics_test_tool(False)
+    metrics_test_tool(True)
+    with pytest.raises(RuntimeError):
+        metrics_test_tool(False, raise_error=True)
+
+    assert metrics_test_tool.__name__ == "metrics_test_tool"
+    assert _outcomes("metrics_test_tool") == {"success": 1, "failure": 1, "error": 1}
+    assert _observed("metrics_test_tool") == 3
+    assert _in_flight("metrics_test_tool") == 0
+
+
+def test_track_tool_records_async_errors():
+    @track_tool
+    async def metrics_test_async_tool(raise_error: bool) -> str:
+        assert _in_flight("metrics_test_async_tool") == 1
+        if raise_error:
+            raise RuntimeError("boom")
+        return create_success_response("ok")
+
+    asyncio.run(metrics_test_async_tool(False))
+    with pytest.raises(RuntimeError):
+        asyncio.run(metrics_test_async_tool(True))
+
+    assert _outcomes("metrics_test_async_tool") == {"success": 1, "error": 1}
+    assert _observed("metrics_test_async_tool") == 2
+    assert _in_flight("metrics_test_async_tool") == 0
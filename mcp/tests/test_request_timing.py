@@ -0,0 +1,108 @@
+"""
+Tests for per-request phase timing: nested phases, the cache status that is
+reported, the Server-Timing header, and isolation between concurrent requests.
+"""
+
+import asyncio
+import contextvars
+import re
+import time
+
+import httpx
+from fastapi import FastAPI
+
+from forms_edge_delivery_mcp.http_responses import server_timing_middleware
+from forms_edge_delivery_mcp.managers.request_timing import (
+    PHASES,
+    current_timing,
+    record_cache_status,
+    start_request_timing,
+    timed_phase,
+)
+
+_ENTRY_RE = re.compile(r'^(\w+);(?:dur=(\d+\.\d{3})|desc="(\w+)")$')
+
+
+def _in_new_context(function):
+    # Timings live in a ContextVar; keep the test's own context clean
+    return contextvars.Context().run(function)
+
+
+def _parse(header: str) -> dict:
+    entries = {}
+    for entry in header.split(", "):
+        match = _ENTRY_RE.match(entry)
+        assert match, entry
+        name, duration, description = match.groups()
+        entries[name] = float(duration) if duration is not None else description
+    return entries
+
+
+def test_helpers_are_no_ops_outside_a_request():
+    def run():
+        with timed_phase("extract"):
+            record_cache_status("miss")
+        return current_timing()
+
+    assert _in_new_context(run) is None
+
+
+def test_nested_phases_are_counted_once():
+    def run():
+        timing = start_request_timing()
+        with timed_phase("extract"):
+            time.sleep(0.02)
+            with timed_phase("clean"):
+                time.sleep(0.03)
+        return timing
+
+    timing = _in_new_context(run)
+    assert timing.durations["clean"] >= 0.03
+    assert 0.02 <= timing.durations["extract"] < 0.03
+    assert timing.durations["extract"] + timing.durations["clean"] <= timing.total()
+
+
+def test_most_expensive_cache_status_is_reported():
+    def run():
+        timing = start_request_timing()
+        for status in ("hit", "miss", "stale", "hit"):
+            record_cache_status(status)
+        return timing
+
+    timing = _in_new_context(run)
+    assert timing.cache_status == "miss"
+    entries = _parse(timing.server_timing())
+    assert list(entries) == [*PHASES, "cache", "total"]
+    assert entries["cache"] == "miss"
+
+
+def test_concurrent_requests_keep_their_own_timing():
+    app = FastAPI()
+    app.middleware("http")(server_timing_middleware)
+
+    @app.get("/work")
+    async def work(status: str, delay: float):
+        record_cache_status(status)
+        with timed_phase("fetch"):
+            await asyncio.sleep(delay)
+        return {"cache": current_timing().cache_status}
+
+    async def requests():
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(
+            transport=transport, base_url="http://test"
+        ) as client:
+            return await asyncio.gather(
+                client.get("/work", params={"status": "miss", "delay": 0.1}),
+                client.get("/work", params={"status": "hit", "delay": 0.01}),
+            )
+
+    slow, fast = _in_new_context(lambda: asyncio.run(requests()))
+    slow_timing = _parse(slow.headers["server-timing"])
+    fast_timing = _parse(fast.headers["server-timing"])
+
+    assert (slow.json(), slow_timing["cache"]) == ({"cache": "miss"}, "miss")
+    assert (fast.json(), fast_timing["cache"]) == ({"cache": "hit"}, "hit")
+    # The requests overlap, yet each reports only its own fetch
+    assert slow_timing["fetch"] >= 100 > fast_timing["fetch"]
+    assert fast_timing["total"] < slow_timing["fetch"]
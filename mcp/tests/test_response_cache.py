@@ -0,0 +1,109 @@
+"""
+Tests for prepared responses: compressed variants are built once per version,
+off the request path, and only offered once they exist.
+"""
+
+import gzip
+import json
+import time
+
+from doc_fixtures import load_doc
+
+from forms_edge_delivery_mcp.config import DOCS_URLS
+from forms_edge_delivery_mcp.managers import response_cache
+from forms_edge_delivery_mcp.managers.doc_cache import CachedDocument, document_cache
+from forms_edge_delivery_mcp.managers.layout_manager import get_layout_configuration
+from forms_edge_delivery_mcp.managers.response_cache import (
+    RESPONSE_CACHE_EVICTIONS,
+    PreparedResponse,
+    prepared_response,
+)
+
+
+class Source:
+    url = "https://docs.example/theme.md"
+
+    def __init__(self, version: str):
+        self.version = version
+
+
+BODY = '{"status": "success", "data": "' + "wrapper " * 400 + '", "errorMessage": null}'
+
+
+def _wait_for_variants(response: PreparedResponse) -> None:
+    deadline = time.time() + 5
+    while response.encodings() != response.codings() and time.time() < deadline:
+        time.sleep(0.01)
+
+
+def test_variants_are_not_built_on_lookup():
+    response = PreparedResponse(BODY, "v1")
+    assert response.codings() and response.encodings() == []
+
+
+def test_prepared_response_is_precompressed_once(monkeypatch):
+    monkeypatch.setattr(response_cache, "_compressor", None)
+    response_cache.enable_precompression()
+    builds = []
+
+    def build():
+        builds.append(1)
+        return BODY
+
+    response = prepared_response("test:precompress", Source("v1"), build)
+    _wait_for_variants(response)
+    assert response.encodings() == response.codings()
+    assert gzip.decompress(response.encoded("gzip")) == response.body
+
+    # Same version: the same response and variants, nothing rebuilt
+    assert prepared_response("test:precompress", Source("v1"), build) is response
+    assert builds == [1]
+
+
+def test_small_responses_are_never_compressed():
+    response = PreparedResponse(
+        '{"status": "success", "data": "x", "errorMessage": null}', "v1"
+    )
+    response.precompress()
+    assert response.codings() == [] and response.encodings() == []
+
+
+def _evictions() -> float:
+    return sum(value for _, value in RESPONSE_CACHE_EVICTIONS.samples())
+
+
+def test_new_version_rebuilds_the_response():
+    builds = []
+
+    def build():
+        builds.append(1)
+        return BODY
+
+    first = prepared_response("test:versions", Source("v1"), build)
+    assert prepared_response("test:versions", Source("v1"), build) is first
+
+    evictions = _evictions()
+    second = prepared_response("test:versions", Source("v2"), build)
+    assert second is not first and second.version == "v2"
+    assert prepared_response("test:versions", Source("v2"), build) is second
+    assert len(builds) == 2
+    assert _evictions() == evictions + 1
+
+
+def test_tool_calls_share_the_prepared_response():
+    url = DOCS_URLS["layout"]
+    content = load_doc("layout")
+    document_cache.put(CachedDocument(url, content, expires_at=time.time() + 300))
+    try:
+        first = get_layout_configuration()
+        assert isinstance(first, PreparedResponse)
+        assert get_layout_configuration() is first
+
+        changed = content + "\n## Added Section\n\nNew layout text.\n"
+        document_cache.put(CachedDocument(url, changed, expires_at=time.time() + 300))
+        rebuilt = get_layout_configuration()
+        assert rebuilt is not first and rebuilt.version != first.version
+        assert "New layout text." in json.loads(rebuilt)["data"]
+        assert get_layout_configuration() is rebuilt
+    finally:
+        document_cache.invalidate(url)
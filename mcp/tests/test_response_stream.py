@@ -0,0 +1,108 @@
+"""
+Tests for streamed responses: Server-Sent Event framing, chunks that add up
+to the data of the equivalent JSON response, and failures sent as events.
+"""
+
+import asyncio
+import json
+import time
+
+import pytest
+from doc_fixtures import load_doc
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from forms_edge_delivery_mcp.config import DOCS_URLS
+from forms_edge_delivery_mcp.http_responses import event_stream_response
+from forms_edge_delivery_mcp.managers import layout_manager
+from forms_edge_delivery_mcp.managers.doc_cache import CachedDocument, document_cache
+from forms_edge_delivery_mcp.managers.layout_manager import (
+    get_layout_configuration_async,
+    stream_layout_configuration_async,
+)
+from forms_edge_delivery_mcp.managers.styling_bundle_manager import (
+    get_styling_bundle_async,
+    stream_styling_bundle_async,
+)
+
+
+@pytest.fixture(autouse=True)
+def docs():
+    for doc in ("theme", "layout"):
+        document_cache.put(
+            CachedDocument(DOCS_URLS[doc], load_doc(doc), expires_at=time.time() + 300)
+        )
+    yield
+    for doc in ("theme", "layout"):
+        document_cache.invalidate(DOCS_URLS[doc])
+
+
+def _stream(events) -> tuple:
+    """Send events through an SSE route; return the response and the parsed events."""
+    app = FastAPI()
+
+    @app.get("/stream")
+    async def route():
+        return event_stream_response(events())
+
+    response = TestClient(app).get("/stream")
+    body = response.text
+    assert body.startswith(": stream open\n\n") and body.endswith("\n\n")
+    parsed = []
+    for frame in body[: -len("\n\n")].split("\n\n")[1:]:
+        event, data = frame.split("\n")
+        assert event.startswith("event: ") and data.startswith("data: ")
+        parsed.append((event[len("event: ") :], json.loads(data[len("data: ") :])))
+    return response, parsed
+
+
+def _chunks_match(parsed: list, expected: str) -> None:
+    names = [event for event, _ in parsed]
+    assert names[0] == "meta" and names[-1] == "done"
+    assert set(names[1:-1]) == {"chunk"}
+    assert parsed[-1][1]["events"] == len(parsed) - 1
+    assert "".join(data["text"] for _, data in parsed[1:-1]) == expected
+
+
+def test_layout_chunks_add_up_to_the_json_data():
+    response, parsed = _stream(stream_layout_configuration_async)
+    assert response.headers["content-type"].startswith("text/event-stream")
+    assert response.headers["cache-control"] == "no-store"
+
+    expected = json.loads(asyncio.run(get_layout_configuration_async()))["data"]
+    _chunks_match(parsed, expected)
+    assert parsed[0][1]["url"] == DOCS_URLS["layout"]
+
+
+def test_bundle_chunks_add_up_to_the_json_data():
+    components = ["field-structure", "dropdown"]
+    _, parsed = _stream(lambda: stream_styling_bundle_async(components))
+
+    expected = json.loads(asyncio.run(get_styling_bundle_async(components)))["data"]
+    _chunks_match(parsed, expected)
+    assert parsed[0][1]["components"] == components
+
+
+def test_fetch_failure_arrives_as_an_error_event(monkeypatch):
+    async def unavailable():
+        raise Exception("Unable to fetch layout documentation: timed out")
+
+    monkeypatch.setattr(layout_manager, "_fetch_layout_document_async", unavailable)
+    response, parsed = _stream(stream_layout_configuration_async)
+
+    assert response.status_code == 200
+    assert [event for event, _ in parsed] == ["error"]
+    assert parsed[0][1]["status"] == "failure"
+    assert "timed out" in parsed[0][1]["errorMessage"]
+
+
+def test_exception_mid_stream_ends_with_an_error_event():
+    async def broken():
+        yield "meta", {"url": "https://docs.example/broken.md"}
+        raise RuntimeError("section index failed")
+
+    _, parsed = _stream(broken)
+    assert [event for event, _ in parsed] == ["meta", "error"]
+    assert (
+        parsed[1][1]["errorMessage"] == "Error streaming response: section index failed"
+    )
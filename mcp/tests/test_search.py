@@ -0,0 +1,153 @@
+"""
+Tests for documentation search: BM25 ranking, re-indexing a changed document
+without stale postings, request validation, and async indexing off the event
+loop.
+"""
+
+import asyncio
+import json
+import threading
+
+import pytest
+from doc_fixtures import load_doc
+
+from forms_edge_delivery_mcp.config import DOCS_URLS
+from forms_edge_delivery_mcp.managers import search_manager
+from forms_edge_delivery_mcp.managers.doc_cache import CachedDocument
+from forms_edge_delivery_mcp.managers.search_manager import (
+    MAX_LIMIT,
+    SearchIndex,
+    search_forms_docs,
+    search_forms_docs_async,
+)
+from forms_edge_delivery_mcp.managers.section_index import SectionIndex
+
+URL = "https://docs.example/search.md"
+
+DOCUMENT = """# Guide
+
+Overview of the guide.
+
+## Wizard navigation
+
+Wizard panels move with next and previous buttons. The wizard keeps its step.
+
+## Accordion
+
+An accordion expands one panel at a time.
+
+## Buttons
+
+Buttons submit or reset the form. A wizard uses them too.
+"""
+
+
+def _index(content: str, version: str) -> SectionIndex:
+    return SectionIndex(URL, content, version)
+
+
+def test_sections_are_ranked_with_bm25():
+    index = SearchIndex()
+    index.update("guide", _index(DOCUMENT, "v1"))
+
+    results = index.search("wizard")
+    assert [result["id"] for result in results] == [
+        "guide#wizard-navigation",
+        "guide#buttons",
+    ]
+    assert results[0]["score"] > results[1]["score"] > 0
+    assert "Wizard panels" in results[0]["snippet"]
+
+    # A rare term outweighs a common one
+    best = index.search("accordion panel")[0]
+    assert best["id"] == "guide#accordion"
+
+
+def test_limit_caps_the_results():
+    index = SearchIndex()
+    index.update("guide", _index(DOCUMENT, "v1"))
+    assert len(index.search("wizard accordion buttons", limit=1)) == 1
+    assert index.search("") == [] and index.search("zebra") == []
+
+
+def test_same_version_is_not_reindexed():
+    index = SearchIndex()
+    assert index.update("guide", _index(DOCUMENT, "v1"))
+    assert not index.update("guide", _index(DOCUMENT, "v1"))
+
+
+def test_new_version_drops_stale_postings():
+    index = SearchIndex()
+    index.update("guide", _index(DOCUMENT, "v1"))
+    index.update("other", _index("# Other\n\nAn accordion elsewhere.\n", "o1"))
+
+    changed = DOCUMENT.replace(
+        "## Accordion\n\nAn accordion expands", "## Tabs\n\nTabs show"
+    )
+    assert index.update("guide", _index(changed, "v2"))
+
+    assert [result["id"] for result in index.search("accordion")] == ["other#other"]
+    assert [result["id"] for result in index.search("tabs")] == ["guide#tabs"]
+    assert "expands" not in index._postings
+    assert all(
+        section_id in index._sections
+        for postings in index._postings.values()
+        for section_id in postings
+    )
+    assert index._total_length == sum(
+        section.length for section in index._sections.values()
+    )
+    assert index.stats()["documents"] == {"guide": "v2", "other": "o1"}
+
+
+@pytest.mark.parametrize(
+    "query, limit, message",
+    [
+        ("", 5, "Query must not be empty"),
+        ("   ", 5, "Query must not be empty"),
+        ("wizard", 0, "Limit must be a positive number"),
+        ("wizard", -3, "Limit must be a positive number"),
+    ],
+)
+def test_invalid_requests_are_rejected(query, limit, message):
+    for response in (
+        search_forms_docs(query, limit),
+        asyncio.run(search_forms_docs_async(query, limit)),
+    ):
+        payload = json.loads(response)
+        assert payload["status"] == "failure" and payload["errorMessage"] == message
+
+
+def test_large_limit_is_capped():
+    assert search_manager._validate("wizard", 10_000) == (None, MAX_LIMIT)
+
+
+def test_async_search_indexes_off_the_event_loop(monkeypatch):
+    documents = {
+        url: CachedDocument(url, load_doc(doc) if doc != "theme" else DOCUMENT)
+        for doc, url in DOCS_URLS.items()
+    }
+    index = SearchIndex()
+    threads = []
+    update = index.update
+
+    def recording_update(doc, section_index):
+        threads.append(threading.current_thread())
+        return update(doc, section_index)
+
+    async def get_async(url):
+        return documents[url]
+
+    monkeypatch.setattr(index, "update", recording_update)
+    monkeypatch.setattr(search_manager, "search_index", index)
+    monkeypatch.setattr(search_manager.document_cache, "get_async", get_async)
+
+    payload = json.loads(asyncio.run(search_forms_docs_async("wizard", 3)))
+    assert payload["status"] == "success"
+    assert json.loads(payload["data"])["results"]
+    assert len(threads) == len(DOCS_URLS)
+    assert threading.main_thread() not in threads
+
+    # Up-to-date documents are not handed to the executor again
+    asyncio.run(search_forms_docs_async("wizard", 3))
+    assert len(threads) == len(DOCS_URLS)
@@ -0,0 +1,61 @@
+"""
+Tests for data derived from a SectionIndex: a slow build must not hold up
+lookups of other keys, and concurrent first uses publish a single value.
+"""
+
+import threading
+
+from doc_fixtures import doc_url, load_doc
+
+from forms_edge_delivery_mcp.managers.section_index import SectionIndex
+
+
+def _index() -> SectionIndex:
+    return SectionIndex(doc_url("theme"), load_doc("theme"), "v1")
+
+
+def test_slow_build_does_not_block_other_keys():
+    index = _index()
+    entered, release = threading.Event(), threading.Event()
+
+    def slow():
+        entered.set()
+        release.wait(timeout=5)
+        return "slow"
+
+    thread = threading.Thread(target=index.derived, args=("slow", slow))
+    thread.start()
+    assert entered.wait(timeout=5)
+    try:
+        fast = []
+        lookup = threading.Thread(
+            target=lambda: fast.append(index.derived("fast", lambda: "fast"))
+        )
+        lookup.start()
+        lookup.join(timeout=1)
+        # Answered while the slow build is still running
+        assert fast == ["fast"]
+    finally:
+        release.set()
+        thread.join(timeout=5)
+    assert index.derived("slow", lambda: "rebuilt") == "slow"
+
+
+def test_concurrent_builds_publish_one_value():
+    index = _index()
+    barrier = threading.Barrier(4)
+    results = []
+
+    def build():
+        barrier.wait(timeout=5)
+        return object()
+
+    threads = [
+        threading.Thread(target=lambda: results.append(index.derived("key", build)))
+        for _ in range(4)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=5)
+    assert len(results) == 4 and len({id(value) for value in results}) == 1
@@ -0,0 +1,72 @@
+"""
+Tests for the styling bundle: requested components are validated and put in
+bundle order before the document is read.
+"""
+
+import asyncio
+import json
+
+import pytest
+from doc_fixtures import load_doc, theme_index
+
+from forms_edge_delivery_mcp.managers.styling_bundle_manager import (
+    BUNDLE_COMPONENTS,
+    DEFAULT_BUNDLE,
+    _build_styling_bundle,
+    get_styling_bundle,
+    get_styling_bundle_async,
+    resolve_components,
+    stream_styling_bundle_async,
+)
+
+
+def test_default_bundle_when_no_components_are_given():
+    assert resolve_components(None) == DEFAULT_BUNDLE
+
+
+def test_components_are_deduplicated_in_bundle_order():
+    assert resolve_components(["dropdown", "field-structure", "dropdown"]) == [
+        "field-structure",
+        "dropdown",
+    ]
+
+
+@pytest.mark.parametrize(
+    "components, message",
+    [
+        ("dropdown", "must be a list"),
+        ({"dropdown": True}, "must be a list"),
+        (["dropdown", 3], "must be a list"),
+        ([], "at least one component"),
+        (["dropdown", "carousel"], "Unknown component(s): carousel"),
+    ],
+)
+def test_invalid_components_are_rejected(components, message):
+    with pytest.raises(ValueError) as raised:
+        resolve_components(components)
+    assert message in str(raised.value)
+
+
+def test_rejected_components_become_error_responses():
+    # Validation runs before the document is fetched
+    for payload in (
+        json.loads(get_styling_bundle("dropdown")),
+        json.loads(asyncio.run(get_styling_bundle_async([]))),
+    ):
+        assert payload["status"] == "failure" and payload["data"] is None
+
+    async def events():
+        return [event async for event in stream_styling_bundle_async("dropdown")]
+
+    assert [event for event, _ in asyncio.run(events())] == ["error"]
+
+
+def test_bundle_holds_only_the_requested_components():
+    index = theme_index(load_doc("theme"))
+    response = _build_styling_bundle(index, resolve_components(["dropdown"]))
+    data = json.loads(response)["data"]
+    dropdown = BUNDLE_COMPONENTS["dropdown"][0]
+    assert data.startswith(f"# {dropdown.SECTION_TITLE}\n\n")
+    for name, (manager, _) in BUNDLE_COMPONENTS.items():
+        if name != "dropdown":
+            assert f"# {manager.SECTION_TITLE}\n" not in data
@@ -0,0 +1,191 @@
+"""
+Tests for budgeted responses and their continuation cursors.
+"""
+
+import base64
+import json
+import time
+
+import pytest
+from doc_fixtures import doc_url, enlarge_document, load_doc
+
+from forms_edge_delivery_mcp.managers.section_index import SectionIndex
+from forms_edge_delivery_mcp.managers.token_budget import (
+    MAX_CURSOR_LENGTH,
+    MAX_UNIT_TOKENS,
+    _decode_cursor,
+    budgeted_response,
+    document_units,
+)
+
+KEY = "get_layout_configuration"
+
+
+def _cursor(payload) -> str:
+    raw = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+@pytest.fixture(scope="module")
+def index():
+    return SectionIndex(
+        doc_url("layout"), enlarge_document(load_doc("layout"), 3), "v1"
+    )
+
+
+def _page(index, cursor=None):
+    units = document_units(index)
+    return json.loads(
+        budgeted_response(
+            KEY, index, units, "Layout", "footer", max_tokens=150, cursor=cursor
+        )
+    )
+
+
+def _body(page) -> str:
+    """The page content between the title and the closing note, without whitespace."""
+    parts = page["data"].split("\n\n")
+    # The last page closes with "---" and the footer, the others with the note
+    closing = 1 if page["cursor"] else 2
+    return "".join("".join(parts[1:-closing]).split())
+
+
+def _pages(index, units, max_tokens):
+    pages, cursor = [], None
+    while True:
+        page = json.loads(
+            budgeted_response(
+                KEY,
+                index,
+                units,
+                "Layout",
+                "footer",
+                max_tokens=max_tokens,
+                cursor=cursor,
+            )
+        )
+        assert page["status"] == "success", page["errorMessage"]
+        assert page["budget"]["tokens"] <= max_tokens
+        pages.append(page)
+        cursor = page["cursor"]
+        if cursor is None:
+            return pages
+        assert len(pages) < 1000
+
+
+def test_cursor_pages_through_every_unit_once(index):
+    units = document_units(index)
+    pages = _pages(index, units, 150)
+    assert len(pages) > 1 and pages[-1]["budget"]["sections_remaining"] == 0
+    # Pages come in rank order, so compare the sets of sent characters per unit
+    sent = "".join(sorted("".join(_body(page) for page in pages)))
+    assert sent == "".join(
+        sorted("".join("".join(unit.text.split()) for unit in units))
+    )
+
+
+def test_section_larger_than_the_budget_is_sent_in_pieces():
+    lines = [
+        f"- option {n}: value-{n} with a description of the choice" for n in range(200)
+    ]
+    index = SectionIndex(doc_url("layout"), "# Big\n\n" + "\n".join(lines) + "\n", "v1")
+    units = document_units(index)
+    assert max(unit.tokens for unit in units) <= MAX_UNIT_TOKENS
+    assert max(unit.tokens for unit in units) > 60
+
+    pages = _pages(index, units, 60)
+    assert all(
+        page["budget"]["bytes"] == len(page["data"].encode("utf-8")) for page in pages
+    )
+    assert "".join(_body(page) for page in pages) == "".join(
+        "".join(unit.text for unit in units).split()
+    )
+
+
+def test_single_line_larger_than_the_budget_is_cut_between_tokens():
+    index = SectionIndex(
+        doc_url("layout"),
+        "# Big\n\n" + " ".join(f"word{n}" for n in range(300)) + "\n",
+        "v1",
+    )
+    units = document_units(index)
+    pages = _pages(index, units, 40)
+    assert len(pages) > 5
+    assert "".join(_body(page) for page in pages) == "".join(
+        "".join(unit.text for unit in units).split()
+    )
+
+
+def test_budget_must_fit_the_title_and_footer(index):
+    page = json.loads(
+        budgeted_response(
+            KEY, index, document_units(index), "Layout", "footer", max_tokens=3
+        )
+    )
+    assert (
+        page["status"] == "failure"
+        and "to fit the title and footer" in page["errorMessage"]
+    )
+
+
+@pytest.mark.parametrize("partial", [[0, 0], [10, 5], [1, 5], ["0", 5], [0, 1, 2], 3])
+def test_malformed_partial_is_rejected(partial):
+    with pytest.raises(ValueError, match="Invalid cursor"):
+        _decode_cursor(
+            _cursor({"k": KEY, "v": "v1", "s": [[1, 2]], "p": partial}), KEY, "v1", 10
+        )
+
+
+def test_partial_past_the_unit_is_rejected(index):
+    units = document_units(index)
+    cursor = _cursor({"k": KEY, "v": "v1", "s": [], "p": [0, len(units[0].text)]})
+    assert _page(index, cursor)["errorMessage"] == "Invalid cursor"
+
+
+def test_forged_range_is_rejected_without_expanding_it(index):
+    cursor = _cursor({"k": KEY, "v": "v1", "s": [[0, 30_000_000]]})
+    start = time.perf_counter()
+    page = _page(index, cursor)
+    assert time.perf_counter() - start < 0.5
+    assert page["status"] == "failure" and page["errorMessage"] == "Invalid cursor"
+
+
+def test_key_and_version_are_checked_before_the_ranges():
+    forged = [[0, 30_000_000]]
+    with pytest.raises(ValueError, match="different tool"):
+        _decode_cursor(_cursor({"k": "other", "v": "v1", "s": forged}), KEY, "v1", 10)
+    with pytest.raises(ValueError, match="documentation changed"):
+        _decode_cursor(_cursor({"k": KEY, "v": "v0", "s": forged}), KEY, "v1", 10)
+
+
+@pytest.mark.parametrize(
+    "ranges",
+    [
+        [[3, 2]],
+        [[-1, 2]],
+        [[0, 11]],
+        [[0, 1, 2]],
+        [["0", "1"]],
+        [[0.0, 1.0]],
+        [[True, 2]],
+        "0-1",
+        [[i, i + 1] for i in range(11)],
+    ],
+)
+def test_malformed_ranges_are_rejected(ranges):
+    with pytest.raises(ValueError, match="Invalid cursor"):
+        _decode_cursor(_cursor({"k": KEY, "v": "v1", "s": ranges}), KEY, "v1", 10)
+
+
+def test_oversized_cursor_is_rejected_before_decoding():
+    with pytest.raises(ValueError, match="Invalid cursor"):
+        _decode_cursor("A" * (MAX_CURSOR_LENGTH + 1), KEY, "v1", 10)
+
+
+def test_valid_ranges_decode():
+    assert _decode_cursor(
+        _cursor({"k": KEY, "v": "v1", "s": [[0, 2], [5, 6]]}), KEY, "v1", 10
+    ) == ({0, 1, 5}, None)
+    assert _decode_cursor(
+        _cursor({"k": KEY, "v": "v1", "s": [], "p": [3, 7]}), KEY, "v1", 10
+    ) == (set(), (3, 7))
@@ -0,0 +1,98 @@
+"""
+Tests for the pooled upstream client: sequential requests reuse one
+keep-alive connection, and the reuse shows up in its stats and metrics.
+"""
+
+import socket
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+import requests
+
+from forms_edge_delivery_mcp.managers import upstream_client
+from forms_edge_delivery_mcp.managers.upstream_client import (
+    UpstreamClient,
+    set_upstream_client,
+)
+
+
+class _DocHandler(BaseHTTPRequestHandler):
+    # HTTP/1.1 with a Content-Length keeps the connection open between requests
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        body = f"# {self.path}\n".encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "text/markdown")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), _DocHandler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{httpd.server_port}"
+    httpd.shutdown()
+    httpd.server_close()
+
+
+@pytest.fixture
+def client():
+    client = UpstreamClient(pool_size=2, connect_timeout=2, read_timeout=2)
+    yield client
+    client.close()
+
+
+def _closed_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def test_sequential_requests_reuse_one_connection(server, client):
+    for doc in ("theme", "layout", "component"):
+        response = client.get(f"{server}/{doc}.md")
+        assert response.text == f"# /{doc}.md\n"
+
+    stats = client.stats()
+    assert (stats["requests"], stats["errors"], stats["in_flight"]) == (3, 0, 0)
+    assert stats["pools"] == {
+        server: {
+            "connections_opened": 1,
+            "requests": 3,
+            "idle_connections": 1,
+        }
+    }
+
+
+def test_failed_requests_are_counted(client):
+    with pytest.raises(requests.exceptions.ConnectionError):
+        client.get(f"http://127.0.0.1:{_closed_port()}/theme.md")
+    stats = client.stats()
+    assert (stats["requests"], stats["errors"], stats["in_flight"]) == (1, 1, 0)
+
+
+def test_pool_stats_are_exported_as_metrics(server, client):
+    previous = set_upstream_client(client)
+    try:
+        client.get(f"{server}/theme.md")
+        client.get(f"{server}/layout.md")
+        families = {
+            name: samples
+            for name, _, _, samples in upstream_client._collect_pool_metrics()
+        }
+    finally:
+        set_upstream_client(previous)
+
+    host = {"host": server}
+    assert families["mcp_upstream_requests_in_flight"] == [({}, 0)]
+    assert families["mcp_upstream_pool_connections_opened_total"] == [(host, 1)]
+    assert families["mcp_upstream_pool_requests_total"] == [(host, 2)]
+    assert families["mcp_upstream_pool_idle_connections"] == [(host, 1)]
@@ -0,0 +1,69 @@
+"""
+Fake upstream documentation server shared by the document cache tests.
+
+``FakeUpstream`` stands in for the pooled upstream client: it serves a fixed
+body per URL, answers conditional requests with 304 when the ETag matches,
+counts every request, and can be told to fail or to hold requests until the
+test releases them.
+"""
+
+import threading
+from typing import Dict, List, Optional
+
+import requests
+
+
+class FakeResponse:
+    """The parts of requests.Response the document cache reads."""
+
+    def __init__(
+        self,
+        url: str,
+        status_code: int,
+        text: str = "",
+        headers: Optional[Dict[str, str]] = None,
+    ):
+        self.url = url
+        self.status_code = status_code
+        self.text = text
+        self.content = text.encode("utf-8")
+        self.headers = headers or {}
+
+    def raise_for_status(self) -> None:
+        if self.status_code >= 400:
+            raise requests.exceptions.HTTPError(f"{self.status_code} for {self.url}")
+
+
+class FakeUpstream:
+    """Counting stand-in for UpstreamClient."""
+
+    def __init__(self, bodies: Optional[Dict[str, str]] = None):
+        self.bodies = dict(bodies or {})
+        self.requests: List[str] = []
+        self.error: Optional[Exception] = None
+        # Cleared to hold requests inside get() until the test sets it
+        self.release = threading.Event()
+        self.release.set()
+        self.entered = threading.Event()
+        self._lock = threading.Lock()
+
+    def etag(self, url: str) -> str:
+        return f'"{abs(hash(self.bodies[url]))}"'
+
+    def calls(self, url: Optional[str] = None) -> int:
+        with self._lock:
+            return len(self.requests) if url is None else self.requests.count(url)
+
+    def get(self, url: str, headers: Optional[Dict[str, str]] = None) -> FakeResponse:
+        with self._lock:
+            self.requests.append(url)
+        self.entered.set()
+        self.release.wait(timeout=10)
+        if self.error is not None:
+            raise self.error
+        if url not in self.bodies:
+            return FakeResponse(url, 404)
+        etag = self.etag(url)
+        if (headers or {}).get("If-None-Match") == etag:
+            return FakeResponse(url, 304)
+        return FakeResponse(url, 200, self.bodies[url], {"ETag": etag})
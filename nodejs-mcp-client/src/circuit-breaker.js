@@ -0,0 +1,87 @@
+/**
+ * Circuit breaker for requests to the Python MCP server
+ */
+
+export const CircuitState = {
+  CLOSED: 'closed',
+  OPEN: 'open',
+  HALF_OPEN: 'half-open'
+};
+
+export class CircuitBreaker {
+  /**
+   * @param {Object} options
+   * @param {number} options.failureThreshold - Consecutive failures that open the circuit
+   * @param {number} options.resetTimeout - Milliseconds to stay open before a trial request
+   */
+  constructor({ failureThreshold = 5, resetTimeout = 30000 } = {}) {
+    this.failureThreshold = failureThreshold;
+    this.resetTimeout = resetTimeout;
+    this.state = CircuitState.CLOSED;
+    this.failures = 0;
+    this.openedAt = 0;
+    this.trialInFlight = false;
+    this.rejected = 0;
+  }
+
+  /**
+   * Decide whether a request may be sent. Once the reset timeout has passed
+   * an open circuit lets exactly one trial request through (half-open).
+   * @returns {boolean} - True if the request may be sent
+   */
+  allowRequest() {
+    if (this.state === CircuitState.OPEN && Date.now() - this.openedAt >= this.resetTimeout) {
+      this.state = CircuitState.HALF_OPEN;
+      this.trialInFlight = false;
+    }
+    if (this.state === CircuitState.CLOSED) {
+      return true;
+    }
+    if (this.state === CircuitState.HALF_OPEN && !this.trialInFlight) {
+      this.trialInFlight = true;
+      return true;
+    }
+    this.rejected++;
+    return false;
+  }
+
+  recordSuccess() {
+    this.state = CircuitState.CLOSED;
+    this.failures = 0;
+    this.trialInFlight = false;
+  }
+
+  recordFailure() {
+    this.failures++;
+    this.trialInFlight = false;
+    if (this.state === CircuitState.HALF_OPEN || this.failures >= this.failureThreshold) {
+      if (this.state !== CircuitState.OPEN) {
+        console.error(`⚡ Circuit opened after ${this.failures} failure(s)`);
+      }
+      this.state = CircuitState.OPEN;
+      this.openedAt = Date.now();
+    }
+  }
+
+  /**
+   * Milliseconds until an open circuit allows a trial request
+   * @returns {number}
+   */
+  retryIn() {
+    if (this.state !== CircuitState.OPEN) {
+      return 0;
+    }
+    return Math.max(0, this.resetTimeout - (Date.now() - this.openedAt));
+  }
+
+  stats() {
+    return {
+      state: this.state,
+      failures: this.failures,
+      rejected: this.rejected,
+      retryInMs: this.retryIn()
+    };
+  }
+}
+
+export default CircuitBreaker;
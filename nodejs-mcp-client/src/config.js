@@ -10,7 +10,24 @@ export const CONFIG = {
   // Python MCP Server Configuration
   mcp_server: {
     base_url: process.env.MCP_SERVER_URL || 'http://localhost:8080',
-    timeout: parseInt(process.env.HTTP_TIMEOUT) || 30000
+    timeout: parseInt(process.env.HTTP_TIMEOUT) || 30000,
+    keep_alive: process.env.HTTP_KEEP_ALIVE !== 'false',
+    max_sockets: parseInt(process.env.HTTP_MAX_SOCKETS) || 8
+  },
+
+  // Local cache of tool responses, revalidated with the server's ETags
+  response_cache: {
+    enabled: process.env.RESPONSE_CACHE_ENABLED !== 'false',
+    max_entries: parseInt(process.env.RESPONSE_CACHE_MAX_ENTRIES) || 100,
+    max_bytes: parseInt(process.env.RESPONSE_CACHE_MAX_BYTES) || 20 * 1024 * 1024,
+    // Endpoints that are never cached (dynamic responses)
+    exclude: ['/system-info']
+  },
+
+  // Fail fast (serving stale responses) while the Python server is down
+  circuit_breaker: {
+    failure_threshold: parseInt(process.env.CIRCUIT_FAILURE_THRESHOLD) || 5,
+    reset_timeout: parseInt(process.env.CIRCUIT_RESET_TIMEOUT) || 30000
   },
   
   // Node.js MCP Server Configuration
@@ -27,11 +44,15 @@ export const CONFIG = {
     'get_radio_checkbox_styling': '/radio-checkbox-styling',
     'get_panel_container_styling': '/panel-container-styling',
     'get_css_selectors_guide': '/css-selectors-guide',
+    'lookup_selectors': '/lookup-selectors',
     'get_file_attachment_styling': '/file-attachment-styling',
     'get_error_message_styling': '/error-message-styling',
     'get_repeatable_panel_styling': '/repeatable-panel-styling',
+    'get_styling_bundle': '/styling-bundle',
     'get_custom_component_creation': '/custom-component-creation',
     'get_layout_configuration': '/layout-configuration',
+    'search_forms_docs': '/search',
+    'lint_form_markup': '/lint-form-markup',
     'get_system_information': '/system-info'
   },
 
@@ -2,13 +2,235 @@
  * HTTP Client for communicating with Python MCP Server
  */
 
+import http from 'http';
+import https from 'https';
 import fetch from 'node-fetch';
 import { CONFIG } from './config.js';
+import { ResponseCache, parseMaxAge } from './response-cache.js';
+import { CircuitBreaker } from './circuit-breaker.js';
 
 export class HttpClient {
   constructor() {
     this.baseUrl = CONFIG.mcp_server.base_url;
     this.timeout = CONFIG.mcp_server.timeout;
+
+    // Pooled keep-alive connections to the Python server
+    const agentOptions = {
+      keepAlive: CONFIG.mcp_server.keep_alive,
+      maxSockets: CONFIG.mcp_server.max_sockets
+    };
+    this.httpAgent = new http.Agent(agentOptions);
+    this.httpsAgent = new https.Agent(agentOptions);
+    this.agent = (parsedURL) => (parsedURL.protocol === 'http:' ? this.httpAgent : this.httpsAgent);
+
+    this.cache = CONFIG.response_cache.enabled
+      ? new ResponseCache({
+          maxEntries: CONFIG.response_cache.max_entries,
+          maxBytes: CONFIG.response_cache.max_bytes
+        })
+      : null;
+
+    this.breaker = new CircuitBreaker({
+      failureThreshold: CONFIG.circuit_breaker.failure_threshold,
+      resetTimeout: CONFIG.circuit_breaker.reset_timeout
+    });
+
+    // Identical tool calls in flight share one request
+    this.inflight = new Map();
+    this.coalesced = 0;
+    this.staleServed = 0;
+  }
+
+  /**
+   * Fetch with the keep-alive agent and the configured timeout
+   * @param {string} url - Absolute URL
+   * @param {Object} options - node-fetch options
+   * @returns {Promise<Response>} - The fetch response
+   */
+  async fetchWithTimeout(url, options) {
+    const controller = new AbortController();
+    const timeoutId = setTimeout(() => controller.abort(), this.timeout);
+    try {
+      return await fetch(url, { ...options, agent: this.agent, signal: controller.signal });
+    } finally {
+      clearTimeout(timeoutId);
+    }
+  }
+
+  /**
+   * Call a tool endpoint. Identical concurrent calls share one request,
+   * fresh responses come from the response cache, and when the Python
+   * server is failing (or the circuit is open) the last good response is
+   * returned with stale: true instead of an error.
+   * @param {string} endpoint - The endpoint path (e.g., '/field-structure')
+   * @param {Object} args - Tool arguments
+   * @returns {Promise<Object>} - The response from the Python server
+   */
+  async callTool(endpoint, args = {}) {
+    const key = `${endpoint} ${JSON.stringify(args)}`;
+    const pending = this.inflight.get(key);
+    if (pending) {
+      this.coalesced++;
+      return pending;
+    }
+
+    const promise = this.executeTool(endpoint, args).finally(() => this.inflight.delete(key));
+    this.inflight.set(key, promise);
+    return promise;
+  }
+
+  async executeTool(endpoint, args) {
+    const cacheable = this.cache && !CONFIG.response_cache.exclude.includes(endpoint);
+    if (cacheable) {
+      // Fresh cache hits need no request, whatever the circuit state
+      const cached = this.cache.peek(this.toolUrl(endpoint, args));
+      if (cached && cached.expiresAt > Date.now()) {
+        return this.getCached(endpoint, args);
+      }
+    }
+
+    if (!this.breaker.allowRequest()) {
+      const retryIn = Math.ceil(this.breaker.retryIn() / 1000);
+      return this.staleFallback(
+        endpoint,
+        args,
+        new Error(`Python MCP server unavailable (circuit open, retrying in ${retryIn}s)`)
+      );
+    }
+
+    try {
+      const result = cacheable ? await this.getCached(endpoint, args) : await this.post(endpoint, args);
+      this.breaker.recordSuccess();
+      return result;
+    } catch (error) {
+      // Client errors mean the server is up; only outages count as failures
+      if (error.status === undefined || error.status >= 500) {
+        this.breaker.recordFailure();
+      } else {
+        this.breaker.recordSuccess();
+      }
+      return this.staleFallback(endpoint, args, error);
+    }
+  }
+
+  /**
+   * Return the last good cached response marked as stale, or rethrow
+   * @param {string} endpoint - The endpoint path
+   * @param {Object} args - Tool arguments
+   * @param {Error} error - Why the server could not answer
+   * @returns {Object} - Cached response with stale, staleReason and staleAgeSeconds
+   */
+  staleFallback(endpoint, args, error) {
+    const cached = this.cache && this.cache.peek(this.toolUrl(endpoint, args));
+    if (!cached) {
+      throw error;
+    }
+    this.staleServed++;
+    if (CONFIG.debug) {
+      console.log(`💾 Serving stale response for ${endpoint}: ${error.message}`);
+    }
+    return {
+      ...cached.result,
+      stale: true,
+      staleReason: error.message,
+      staleAgeSeconds: Math.round((Date.now() - cached.storedAt) / 1000)
+    };
+  }
+
+  /**
+   * Build the GET URL of a tool call (arrays are comma-joined)
+   * @param {string} endpoint - The endpoint path
+   * @param {Object} params - Query parameters
+   * @returns {string} - Absolute URL, also used as the cache key
+   */
+  toolUrl(endpoint, params = {}) {
+    const query = new URLSearchParams();
+    for (const [key, value] of Object.entries(params)) {
+      if (value !== undefined && value !== null) {
+        query.set(key, Array.isArray(value) ? value.join(',') : String(value));
+      }
+    }
+    const queryString = query.toString();
+    return `${this.baseUrl}${endpoint}${queryString ? `?${queryString}` : ''}`;
+  }
+
+  /**
+   * Connection reuse, cache and circuit breaker state
+   * @returns {Object}
+   */
+  stats() {
+    return {
+      inflight: this.inflight.size,
+      coalesced: this.coalesced,
+      staleServed: this.staleServed,
+      cache: this.cache ? this.cache.stats() : null,
+      circuit: this.breaker.stats()
+    };
+  }
+
+  /**
+   * GET a cacheable endpoint. Fresh cached responses are returned without a
+   * request; stale ones are revalidated with If-None-Match.
+   * @param {string} endpoint - The endpoint path (e.g., '/dropdown-styling')
+   * @param {Object} params - Query parameters (arrays are comma-joined)
+   * @returns {Promise<Object>} - The response from the Python server
+   */
+  async getCached(endpoint, params = {}) {
+    const url = this.toolUrl(endpoint, params);
+    const cached = this.cache.get(url);
+    if (cached && cached.expiresAt > Date.now()) {
+      this.cache.hits++;
+      if (CONFIG.debug) {
+        console.log(`💾 Cache hit: ${url}`);
+      }
+      return cached.result;
+    }
+
+    const headers = { 'User-Agent': 'FORMS-Edge-Delivery-MCP-NodeJS/1.0.0' };
+    if (cached) {
+      headers['If-None-Match'] = cached.etag;
+    }
+
+    try {
+      const response = await this.fetchWithTimeout(url, { method: 'GET', headers });
+      const maxAge = parseMaxAge(response.headers.get('cache-control'));
+
+      if (response.status === 304 && cached) {
+        this.cache.revalidated++;
+        this.cache.touch(cached, maxAge);
+        if (CONFIG.debug) {
+          console.log(`💾 Cache revalidated: ${url}`);
+        }
+        return cached.result;
+      }
+
+      if (!response.ok) {
+        const error = new Error(`HTTP ${response.status}: ${response.statusText}`);
+        error.status = response.status;
+        throw error;
+      }
+
+      const body = await response.text();
+      const result = JSON.parse(body);
+      this.cache.misses++;
+
+      const etag = response.headers.get('etag');
+      if (etag && result.status === 'success') {
+        this.cache.set(url, result, etag, Buffer.byteLength(body), maxAge);
+      } else {
+        this.cache.delete(url);
+      }
+      return result;
+    } catch (error) {
+      if (error.name === 'AbortError') {
+        throw new Error(`Request timeout after ${this.timeout}ms`);
+      }
+
+      console.error(`❌ Request failed for ${endpoint}:`, error.message);
+      const wrapped = new Error(`Failed to communicate with Python MCP server: ${error.message}`);
+      wrapped.status = error.status;
+      throw wrapped;
+    }
   }
 
   /**
@@ -26,23 +248,19 @@ export class HttpClient {
     }
 
     try {
-      const controller = new AbortController();
-      const timeoutId = setTimeout(() => controller.abort(), this.timeout);
-
-      const response = await fetch(url, {
+      const response = await this.fetchWithTimeout(url, {
         method: 'POST',
         headers: {
           'Content-Type': 'application/json',
           'User-Agent': 'FORMS-Edge-Delivery-MCP-NodeJS/1.0.0'
         },
-        body: JSON.stringify(data),
-        signal: controller.signal
+        body: JSON.stringify(data)
       });
 
-      clearTimeout(timeoutId);
-
       if (!response.ok) {
-        throw new Error(`HTTP ${response.status}: ${response.statusText}`);
+        const error = new Error(`HTTP ${response.status}: ${response.statusText}`);
+        error.status = response.status;
+        throw error;
       }
 
       const result = await response.json();
@@ -59,7 +277,9 @@ export class HttpClient {
       }
       
       console.error(`❌ Request failed for ${endpoint}:`, error.message);
-      throw new Error(`Failed to communicate with Python MCP server: ${error.message}`);
+      const wrapped = new Error(`Failed to communicate with Python MCP server: ${error.message}`);
+      wrapped.status = error.status;
+      throw wrapped;
     }
   }
 
@@ -71,6 +291,7 @@ export class HttpClient {
     try {
       const response = await fetch(`${this.baseUrl}/health`, {
         method: 'GET',
+        agent: this.agent,
         timeout: 5000
       });
       return response.ok;
@@ -90,6 +311,7 @@ export class HttpClient {
     try {
       const response = await fetch(`${this.baseUrl}/resource/server-info`, {
         method: 'GET',
+        agent: this.agent,
         timeout: 5000
       });
       
@@ -111,6 +333,7 @@ export class HttpClient {
     try {
       const response = await fetch(`${this.baseUrl}/resource/system-info`, {
         method: 'GET',
+        agent: this.agent,
         timeout: 5000
       });
       
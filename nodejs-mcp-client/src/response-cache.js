@@ -0,0 +1,117 @@
+/**
+ * Bounded LRU cache of Python MCP server responses
+ */
+
+/**
+ * Read the max-age directive of a Cache-Control header
+ * @param {string|null} cacheControl - Raw Cache-Control header value
+ * @returns {number} - Lifetime in seconds (0 if absent or not cacheable)
+ */
+export function parseMaxAge(cacheControl) {
+  if (!cacheControl || /no-store|no-cache/i.test(cacheControl)) {
+    return 0;
+  }
+  const match = /max-age=(\d+)/i.exec(cacheControl);
+  return match ? parseInt(match[1], 10) : 0;
+}
+
+export class ResponseCache {
+  /**
+   * @param {Object} options
+   * @param {number} options.maxEntries - Maximum number of cached responses
+   * @param {number} options.maxBytes - Maximum total size of cached bodies
+   */
+  constructor({ maxEntries = 100, maxBytes = 20 * 1024 * 1024 } = {}) {
+    this.maxEntries = maxEntries;
+    this.maxBytes = maxBytes;
+    this.entries = new Map();
+    this.bytes = 0;
+    this.hits = 0;
+    this.revalidated = 0;
+    this.misses = 0;
+    this.evictions = 0;
+  }
+
+  /**
+   * Look up a cached response and mark it as most recently used
+   * @param {string} key - Cache key (request URL)
+   * @returns {Object|undefined} - Entry with result, etag, size and expiresAt
+   */
+  get(key) {
+    const entry = this.entries.get(key);
+    if (entry) {
+      // Map iteration order is insertion order: re-insert to mark as recent
+      this.entries.delete(key);
+      this.entries.set(key, entry);
+    }
+    return entry;
+  }
+
+  /**
+   * Look up a cached response, fresh or not, without touching its recency
+   * @param {string} key - Cache key (request URL)
+   * @returns {Object|undefined} - Cached entry
+   */
+  peek(key) {
+    return this.entries.get(key);
+  }
+
+  /**
+   * Store a response, evicting least recently used entries to stay in bounds
+   * @param {string} key - Cache key (request URL)
+   * @param {Object} result - Parsed JSON response
+   * @param {string} etag - Validator sent by the server
+   * @param {number} size - Body size in bytes
+   * @param {number} maxAge - Freshness lifetime in seconds
+   */
+  set(key, result, etag, size, maxAge) {
+    this.delete(key);
+    if (size > this.maxBytes) {
+      return;
+    }
+    this.entries.set(key, { result, etag, size, storedAt: Date.now(), expiresAt: Date.now() + maxAge * 1000 });
+    this.bytes += size;
+
+    while (this.entries.size > this.maxEntries || this.bytes > this.maxBytes) {
+      const oldest = this.entries.keys().next().value;
+      this.delete(oldest);
+      this.evictions++;
+    }
+  }
+
+  /**
+   * Extend the lifetime of an entry after a 304 Not Modified
+   * @param {Object} entry - Cached entry
+   * @param {number} maxAge - New freshness lifetime in seconds
+   */
+  touch(entry, maxAge) {
+    entry.storedAt = Date.now();
+    entry.expiresAt = Date.now() + maxAge * 1000;
+  }
+
+  delete(key) {
+    const entry = this.entries.get(key);
+    if (entry) {
+      this.entries.delete(key);
+      this.bytes -= entry.size;
+    }
+  }
+
+  clear() {
+    this.entries.clear();
+    this.bytes = 0;
+  }
+
+  stats() {
+    return {
+      entries: this.entries.size,
+      bytes: this.bytes,
+      hits: this.hits,
+      revalidated: this.revalidated,
+      misses: this.misses,
+      evictions: this.evictions
+    };
+  }
+}
+
+export default ResponseCache;
@@ -152,17 +152,36 @@ class FormsMCPProxyServer {
 
       try {
         // Make request to Python server
-        const result = await this.client.post(endpoint, args || {});
+        const result = await this.client.callTool(endpoint, args || {});
         
         // Return the result in MCP format
-        return {
-          content: [
-            {
-              type: 'text',
-              text: result.data || result.errorMessage || 'No data received'
-            }
-          ]
-        };
+        const content = [
+          {
+            type: 'text',
+            text: result.unchanged
+              ? `Unchanged since ${result.hash}; your copy is current.`
+              : result.data || result.errorMessage || 'No data received'
+          }
+        ];
+        if (result.hash && !result.unchanged) {
+          content.push({
+            type: 'text',
+            text: `Content hash: ${result.hash} (pass as if_changed_since to skip unchanged content)`
+          });
+        }
+        if (result.cursor) {
+          content.push({
+            type: 'text',
+            text: `More sections available (${result.budget.sections_remaining} remaining). Call ${name} again with cursor: ${result.cursor}`
+          });
+        }
+        if (result.stale) {
+          content.push({
+            type: 'text',
+            text: `⚠️ Stale response (${result.staleAgeSeconds}s old): ${result.staleReason}`
+          });
+        }
+        return { content };
       } catch (error) {
         console.error(`❌ Tool execution failed for ${name}:`, error.message);
         
@@ -2,6 +2,38 @@
  * Tools definitions for FORMS Edge Delivery MCP Server
  */
 
+/**
+ * Optional budget arguments of the documentation tools: the server returns the
+ * most relevant sections that fit and a cursor for the rest
+ */
+const BUDGET_PROPERTIES = {
+  max_tokens: {
+    type: 'integer',
+    minimum: 1,
+    description: 'Optional token budget for the returned documentation'
+  },
+  max_bytes: {
+    type: 'integer',
+    minimum: 1,
+    description: 'Optional byte budget for the returned documentation'
+  },
+  cursor: {
+    type: 'string',
+    description: 'Cursor returned by a previous budgeted call, to fetch the remaining sections'
+  }
+};
+
+/**
+ * Optional argument of the documentation tools: the hash of a response the
+ * caller already has, to get a short "unchanged" reply or only changed sections
+ */
+const IF_CHANGED_PROPERTIES = {
+  if_changed_since: {
+    type: 'string',
+    description: 'The "hash" of a response you already have; returns only what changed since'
+  }
+};
+
 /**
  * Get available tools
  * @returns {Array} Array of tool definitions
@@ -13,7 +45,7 @@ export function getTools() {
       description: 'Get field structure styling and markup patterns for Adaptive Form Block. Returns HTML structure and CSS for form fields including labels, inputs, wrappers, and validation states.',
       inputSchema: {
         type: 'object',
-        properties: {},
+        properties: { ...BUDGET_PROPERTIES, ...IF_CHANGED_PROPERTIES },
         required: []
       }
     },
@@ -22,7 +54,7 @@ export function getTools() {
       description: 'Get dropdown component styling for Adaptive Form Block. Returns CSS and HTML patterns for dropdown elements including select boxes, option styling, and custom dropdown implementations.',
       inputSchema: {
         type: 'object',
-        properties: {},
+        properties: { ...BUDGET_PROPERTIES, ...IF_CHANGED_PROPERTIES },
         required: []
       }
     },
@@ -31,7 +63,7 @@ export function getTools() {
       description: 'Get radio button and checkbox styling for Adaptive Form Block. Returns CSS and HTML patterns for radio buttons, checkboxes, groups, and custom styled form controls.',
       inputSchema: {
         type: 'object',
-        properties: {},
+        properties: { ...BUDGET_PROPERTIES, ...IF_CHANGED_PROPERTIES },
         required: []
       }
     },
@@ -40,7 +72,7 @@ export function getTools() {
       description: 'Get panel and container styling for Adaptive Form Block. Returns CSS and HTML patterns for form panels, fieldsets, containers, and layout structures.',
       inputSchema: {
         type: 'object',
-        properties: {},
+        properties: { ...BUDGET_PROPERTIES, ...IF_CHANGED_PROPERTIES },
         required: []
       }
     },
@@ -49,16 +81,34 @@ export function getTools() {
       description: 'Get comprehensive CSS selectors guide for Adaptive Form Block. Returns a complete guide to CSS selectors for form styling and customization.',
       inputSchema: {
         type: 'object',
-        properties: {},
+        properties: { ...BUDGET_PROPERTIES, ...IF_CHANGED_PROPERTIES },
         required: []
       }
     },
+    {
+      name: 'lookup_selectors',
+      description: 'Look up the exact CSS selectors for one Adaptive Form Block field type, optionally for a named field. Returns the wrapper, control, label, name-based and state (.field-invalid) selectors with the documented CSS examples. Much shorter than the full selectors guide.',
+      inputSchema: {
+        type: 'object',
+        properties: {
+          field_type: {
+            type: 'string',
+            description: 'Field type, e.g. "drop-down", "radio-group", "checkbox-group", "file", "panel", "email"'
+          },
+          name: {
+            type: 'string',
+            description: 'Optional field name, e.g. "country", for name-based selectors'
+          }
+        },
+        required: ['field_type']
+      }
+    },
     {
       name: 'get_file_attachment_styling',
       description: 'Get file attachment component styling for Adaptive Form Block. Returns CSS and HTML for file upload elements, drag-and-drop zones, and custom file input styling.',
       inputSchema: {
         type: 'object',
-        properties: {},
+        properties: { ...BUDGET_PROPERTIES, ...IF_CHANGED_PROPERTIES },
         required: []
       }
     },
@@ -67,7 +117,7 @@ export function getTools() {
       description: 'Get error message styling for Adaptive Form Block. Returns CSS and HTML for form validation errors, error states, and accessibility patterns.',
       inputSchema: {
         type: 'object',
-        properties: {},
+        properties: { ...BUDGET_PROPERTIES, ...IF_CHANGED_PROPERTIES },
         required: []
       }
     },
@@ -76,7 +126,26 @@ export function getTools() {
       description: 'Get repeatable panel styling for Adaptive Form Block. Returns CSS and HTML for dynamic repeatable form sections, including add/remove controls and layout.',
       inputSchema: {
         type: 'object',
-        properties: {},
+        properties: { ...BUDGET_PROPERTIES, ...IF_CHANGED_PROPERTIES },
+        required: []
+      }
+    },
+    {
+      name: 'get_styling_bundle',
+      description: 'Get the styling documentation of several Adaptive Form Block components in one call. Use this instead of calling the individual styling tools one after another.',
+      inputSchema: {
+        type: 'object',
+        properties: {
+          components: {
+            type: 'array',
+            items: {
+              type: 'string',
+              enum: ['field-structure', 'css-selectors', 'error-messages', 'dropdown', 'radio-checkbox', 'panel-container', 'file-attachment', 'repeatable-panel']
+            },
+            description: 'Components to include. Defaults to field-structure, css-selectors, error-messages, dropdown and radio-checkbox.'
+          },
+          ...IF_CHANGED_PROPERTIES
+        },
         required: []
       }
     },
@@ -85,7 +154,7 @@ export function getTools() {
       description: 'Get complete documentation for creating custom components (decorating fields) in Adaptive Form Block. Returns guide with decorator functions, custom styling, and behavior implementation.',
       inputSchema: {
         type: 'object',
-        properties: {},
+        properties: { ...BUDGET_PROPERTIES, ...IF_CHANGED_PROPERTIES },
         required: []
       }
     },
@@ -94,10 +163,54 @@ export function getTools() {
       description: 'Get complete documentation for panel layout configuration in Adaptive Form Block. Returns guide for implementing custom layouts like accordion, wizard, tabs, etc.',
       inputSchema: {
         type: 'object',
-        properties: {},
+        properties: { ...BUDGET_PROPERTIES, ...IF_CHANGED_PROPERTIES },
         required: []
       }
     },
+    {
+      name: 'search_forms_docs',
+      description: 'Search every section of the Adaptive Form Block theme, layout and custom component documentation. Use this first to find which section answers a question instead of fetching whole documents. Returns ranked sections with section IDs and snippets.',
+      inputSchema: {
+        type: 'object',
+        properties: {
+          query: {
+            type: 'string',
+            description: 'Free-text query, e.g. "wizard navigation buttons"'
+          },
+          limit: {
+            type: 'integer',
+            minimum: 1,
+            maximum: 50,
+            description: 'Maximum number of results (default 5)'
+          }
+        },
+        required: ['query']
+      }
+    },
+    {
+      name: 'lint_form_markup',
+      description: 'Lint generated Adaptive Form Block field HTML against the documented Field Structure: wrapper classes, label and description placement, and for / aria-describedby / aria-live attributes. Takes a directory or .zip/.tar(.gz) archive on the server. Returns violations by rule and throughput in fragments per second.',
+      inputSchema: {
+        type: 'object',
+        properties: {
+          path: {
+            type: 'string',
+            description: 'Directory of .html fragments, archive of them, or a single .html file on the server'
+          },
+          workers: {
+            type: 'integer',
+            minimum: 1,
+            description: 'Number of worker processes (defaults to the server setting)'
+          },
+          max_violations: {
+            type: 'integer',
+            minimum: 1,
+            description: 'Maximum number of violations to list (default 100; all are counted)'
+          }
+        },
+        required: ['path']
+      }
+    },
     {
       name: 'get_system_information',
       description: 'Get system information and server details for Adaptive Form Block. Returns system details and environment info.',